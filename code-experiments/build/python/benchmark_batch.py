@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""Benchmark `cocoex.Problem.evaluate_batch` against single calls.
+
+Times the evaluation of populations of random solutions with
+``problem.evaluate_batch(X)`` and with ``[problem(x) for x in X]`` on
+the sphere and the ellipsoid function of the ``bbob`` suite, unobserved
+and observed with the ``bbob`` observer, and prints the speedup.
+
+Usage::
+
+    python benchmark_batch.py [population_size [evaluations]]
+
+"""
+from __future__ import absolute_import, division, print_function
+import sys
+import time
+import shutil
+import numpy as np
+import cocoex as ex
+
+
+def timeit(evaluate, problem, X, evaluations):
+    """return seconds per evaluation of `evaluate(problem, X)`"""
+    repetitions = max((1, evaluations // len(X)))
+    t0 = time.time()
+    for _ in range(repetitions):
+        evaluate(problem, X)
+    return (time.time() - t0) / (repetitions * len(X))
+
+
+def single_calls(problem, X):
+    return [problem(x) for x in X]
+
+
+def batch_call(problem, X):
+    return problem.evaluate_batch(X)
+
+
+def main(population_size=100, evaluations=200000):
+    """print the time per evaluation of single and batch calls"""
+    observer = ex.Observer("bbob", "result_folder: benchmark_batch")
+    print("population size %d, %d evaluations per measurement"
+          % (population_size, evaluations))
+    print("%-22s %4s %12s %12s %8s" % ("problem", "obs", "single [us]", "batch [us]", "speedup"))
+    suite = ex.Suite("bbob", "", "function_indices:1,2 dimensions:2,10,40 instance_indices:1")
+    for observed in [False, True]:
+        for index in range(len(suite)):
+            problem = suite.get_problem(index, observer if observed else None)
+            X = np.random.randn(population_size, problem.dimension)
+            t_single = timeit(single_calls, problem, X, evaluations)
+            t_batch = timeit(batch_call, problem, X, evaluations)
+            print("%-22s %4s %12.3f %12.3f %8.1f" % (problem.id, "yes" if observed else "no",
+                                                     1e6 * t_single, 1e6 * t_batch,
+                                                     t_single / t_batch))
+            problem.free()
+    result_folder = observer.result_folder
+    del observer
+    shutil.rmtree(result_folder)
+
+
+if __name__ == "__main__":
+    main(*[int(float(arg)) for arg in sys.argv[1:]])
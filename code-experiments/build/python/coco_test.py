@@ -99,6 +99,161 @@ def run_constrained_suite_test():
         counts['b'] += np.any(f.constraint(best_parameter(f)) > 1e-11)  # mac: 6.8361219664552603e-12 is the largest value
     assert sum(counts.values()) == 0
 
+def _read_logged_files(folder):
+    """return a `dict` of the .info, .dat and .tdat files in `folder`"""
+    res = {}
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            if name.endswith(('.info', '.dat', '.tdat')):
+                with open(os.path.join(root, name)) as file_:
+                    res[os.path.relpath(os.path.join(root, name), folder)] = file_.read()
+    return res
+
+def run_batch_evaluation_test():
+    """check that `evaluate_batch` and `constraint_batch` give the same
+    values and the same logged data as single evaluations"""
+    folders = []
+    for batch in [False, True]:
+        observer = ex.Observer("bbob", "result_folder: test_batch_%s" % batch)
+        folders.append(observer.result_folder)
+        np.random.seed(3)
+        for problem in Suite("bbob", "", "dimensions:2,5 instance_indices:1,2"):
+            problem.observe_with(observer)
+            X = 5 * (2 * np.random.rand(37, problem.dimension) - 1)
+            if batch:
+                F = problem.evaluate_batch(X)
+            else:
+                F = [problem(x) for x in X]
+            assert problem.evaluations == len(X)
+            assert np.all(np.asarray(F) == [problem(x) for x in X])
+            problem.free()
+        del observer
+    assert _read_logged_files(folders[0]) == _read_logged_files(folders[1])
+    for problem in Suite("bbob-constrained", "", "dimensions:2 instance_indices:1"):
+        X = np.random.randn(7, problem.dimension)
+        assert np.all(problem.constraint_batch(X) == [problem.constraint(x) for x in X])
+    for problem in Suite("bbob-biobj", "", "dimensions:2 instance_indices:1"):
+        X = np.random.randn(7, problem.dimension)
+        assert np.all(problem.evaluate_batch(X) == [problem(x) for x in X])
+    for folder in folders:
+        shutil.rmtree(folder)
+
+def run_threaded_evaluation_test(number_of_threads=4):
+    """evaluate many unobserved problems concurrently from several threads
+    and check the results against serial evaluation"""
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:  # Python 2
+        return
+    suite = Suite("bbob-largescale", "", "dimensions:20,40 instance_indices:1-2")
+    np.random.seed(5)
+    X = np.random.randn(30, 40)
+
+    def evaluate(problem):
+        F = [problem(x[:problem.dimension]) for x in X]
+        return F + list(problem.evaluate_batch(X[:, :problem.dimension]))
+
+    expected = []
+    for problem in suite:
+        expected.append(evaluate(problem))
+    problems = [suite.get_problem(index) for index in range(len(suite))]  # not thread-safe
+    with ThreadPoolExecutor(number_of_threads) as executor:
+        results = list(executor.map(evaluate, problems))
+    for problem, F, F_expected in zip(problems, results, expected):
+        assert F == F_expected, problem.id
+        assert problem.evaluations == 2 * len(X)
+        problem.free()
+
+class _Interrupt(Exception):
+    pass
+
+_calls_before_interrupt = [-1]
+
+def _sequence_search(problem, budget):
+    """evaluate `budget` points of a deterministic sequence and raise
+    `_Interrupt` in the middle of the problem after a set number of calls"""
+    _calls_before_interrupt[0] -= 1
+    for k in range(int(budget)):
+        if k == budget // 2 and _calls_before_interrupt[0] == 0:
+            raise _Interrupt()
+        fractions = ((k + 1) * np.sqrt(np.arange(2, 2 + problem.dimension))) % 1
+        problem(problem.lower_bounds + fractions * (problem.upper_bounds - problem.lower_bounds))
+
+def _logged_records(folder):
+    """return the data lines and the runs in the .info files in `folder`
+    as `Counter`, independent of the file names"""
+    from collections import Counter
+    records = Counter()
+    for name, content in _read_logged_files(folder).items():
+        for line in content.splitlines():
+            if name.endswith('.info'):
+                records.update(s for s in line.split(', ') if '|' in s)
+            else:
+                records[line] += 1
+    return records
+
+def run_resume_test():
+    """interrupt `cocoex.run_suite`, resume and compare the data with an
+    uninterrupted run"""
+    options = dict(suite_options="dimensions: 2,3 function_indices: 1,2 instance_indices: 1-3",
+                   verbose=False)
+    for suite_name in ["bbob", "bbob-biobj"]:
+        folders = [os.path.join('exdata', 'test_resume_%s_%s' % (suite_name, s))
+                   for s in ['uninterrupted', 'interrupted']]
+        for folder in folders:
+            if os.path.exists(folder):
+                shutil.rmtree(folder)
+        ex.run_suite(_sequence_search, suite_name, "result_folder: " + os.path.basename(folders[0]),
+                     workers=2, **options)
+        _calls_before_interrupt[0] = 7
+        try:
+            ex.run_suite(_sequence_search, suite_name, "result_folder: " + os.path.basename(folders[1]),
+                         workers=1, **options)
+        except _Interrupt:
+            pass
+        else:
+            raise AssertionError("run_suite was not interrupted")
+        assert len(ex.runner.read_journal(folders[1])) == 0
+        ex.run_suite(_sequence_search, suite_name, "result_folder: " + os.path.basename(folders[1]),
+                     workers=2, resume=folders[1], **options)
+        assert len(ex.runner.read_journal(folders[1])) == len(ex.runner.read_journal(folders[0]))
+        assert _logged_records(folders[0]) == _logged_records(folders[1]), suite_name
+        for folder in folders:
+            shutil.rmtree(folder)
+
+def run_buffered_observer_test():
+    """check that `BufferedObserver`, after conversion with `to_text`,
+    logs the same data as the "bbob" observer"""
+    folders = []
+    for observer in [ex.Observer("bbob", "result_folder: test_buffered_c"),
+                     ex.BufferedObserver("bbob", "result_folder: test_buffered_npz",
+                                         buffer_size=1000)]:
+        folders.append(observer.result_folder)
+        for problem in Suite("bbob", "", "dimensions:2,40 function_indices:1,2,7 instance_indices:1,2"):
+            np.random.seed(problem.index)
+            X = 5 * (2 * np.random.rand(1234, problem.dimension) - 1)
+            if isinstance(observer, ex.BufferedObserver):
+                problem = observer.observe(problem)
+                for x in X[:3]:
+                    problem(x)
+                problem.evaluate_batch(X[3:100])
+                for x in X[100:110]:
+                    problem(list(x))
+                for i in range(110, len(X), 500):
+                    problem.evaluate_batch(X[i:i + 500])
+            else:
+                problem.observe_with(observer)
+                for x in X:
+                    problem(x)
+            problem.free()
+        if isinstance(observer, ex.BufferedObserver):
+            observer.free()
+        del observer
+    assert ex.buffered.to_text(folders[1])
+    assert _logged_records(folders[0]) == _logged_records(folders[1])
+    for folder in folders:
+        shutil.rmtree(folder)
+
 def run_doctests():
     """Run doctests on "all" modules.
 
@@ -111,6 +266,8 @@ def run_doctests():
         print("  CAVEAT: doctest OF cocoex.interface IS, FOR SOME REASON, " +
               "INEFFECTIVE IN PYTHON 2 ")
     testmod(interface)
+    testmod(ex.runner)
+    testmod(ex.buffered)
     testmod(example_experiment)
 
 
@@ -142,6 +299,10 @@ def main(args):
     example_experiment.main()
     if "bbob-constrained" in known_suite_names:
         run_constrained_suite_test()
+    run_batch_evaluation_test()
+    run_threaded_evaluation_test()
+    run_resume_test()
+    run_buffered_observer_test()
     for arg in args if args else default_testcases:
         if arg is None or arg == 'None':
             break
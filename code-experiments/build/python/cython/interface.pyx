@@ -46,8 +46,8 @@ cdef extern from "coco.h":
     void coco_problem_free(coco_problem_t *problem)
 
     void coco_problem_get_initial_solution(coco_problem_t *problem, double *x)
-    void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y)
-    void coco_evaluate_constraint(coco_problem_t *problem, const double *x, double *y)
+    void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y) nogil
+    void coco_evaluate_constraint(coco_problem_t *problem, const double *x, double *y) nogil
     void coco_recommend_solution(coco_problem_t *problem, const double *x)
 
     int coco_logger_biobj_feed_solution(coco_problem_t *problem, const size_t evaluation, const double *y)
@@ -71,6 +71,7 @@ cdef extern from "coco.h":
     size_t coco_problem_get_evaluations(const coco_problem_t *problem)
     size_t coco_problem_get_evaluations_constraints(const coco_problem_t *problem)
     double coco_problem_get_best_observed_fvalue1(const coco_problem_t *problem)
+    double coco_problem_get_best_value(const coco_problem_t *problem)
     int coco_problem_final_target_hit(const coco_problem_t *problem)
     void bbob_problem_best_parameter_print(const coco_problem_t *problem)
     void bbob_biobj_problem_best_parameter_print(const coco_problem_t *problem)
@@ -85,6 +86,18 @@ cdef bytes _bstring(s):
 
 cdef coco_observer_t* _current_observer
 
+cdef void _evaluate_rows(coco_problem_t *problem, const double *x, double *y,
+                         size_t number, size_t dimension, size_t size,
+                         bint constraint) noexcept nogil:
+    """evaluate the `number` solutions of length `dimension` in `x`, in
+    order, and write the results of length `size` into `y`"""
+    cdef size_t i
+    for i in range(number):
+        if constraint:
+            coco_evaluate_constraint(problem, x + i * dimension, y + i * size)
+        else:
+            coco_evaluate_function(problem, x + i * dimension, y + i * size)
+
 cdef class Suite:
     """see __init__.py"""
     cdef coco_suite_t* suite  # AKA _self
@@ -584,10 +597,42 @@ cdef class Problem:
         _x = x  # this is the final type conversion
         if self.problem is NULL:
             raise InvalidProblemException()
-        coco_evaluate_constraint(self.problem,
-                               <double *>np.PyArray_DATA(_x),
-                               <double *>np.PyArray_DATA(self.constraint_values))
+        self._evaluate(<double *>np.PyArray_DATA(_x),
+                       <double *>np.PyArray_DATA(self.constraint_values), 1, True)
         return np.array(self.constraint_values, copy=True)
+    cdef _evaluate(self, const double *x, double *y, size_t number, bint constraint):
+        """evaluate `number` solutions, releasing the GIL if no observer
+        is attached, see "Thread safety" in __init__.py"""
+        cdef coco_problem_t *problem = self.problem
+        cdef size_t dimension = self._number_of_variables
+        cdef size_t size = self._number_of_constraints if constraint else self._number_of_objectives
+        if self._list_of_observers:  # loggers write files and share state
+            _evaluate_rows(problem, x, y, number, dimension, size, constraint)
+        else:
+            with nogil:
+                _evaluate_rows(problem, x, y, number, dimension, size, constraint)
+    cdef np.ndarray _batch_input(self, X):
+        """return `X` as C-contiguous 2-D array of `double` with one
+        solution per row"""
+        X = np.ascontiguousarray(X, dtype=np.double)
+        if X.ndim != 2 or X.shape[1] != self._number_of_variables:
+            raise ValueError(
+                "Shape, `np.shape(X)==%s`, of input `X` does " % str(np.shape(X)) +
+                "not match `(number_of_solutions, number_of_variables==%d)`."
+                             % self._number_of_variables)
+        if self.problem is NULL:
+            raise InvalidProblemException()
+        return X
+    def constraint_batch(self, X):
+        """see __init__.py"""
+        if self.number_of_constraints <= 0:
+            return  # like `constraint`
+        cdef np.ndarray[double, ndim=2, mode="c"] _X = self._batch_input(X)
+        cdef np.ndarray[double, ndim=2, mode="c"] _C = np.empty(
+            (_X.shape[0], self._number_of_constraints))
+        self._evaluate(<double *>np.PyArray_DATA(_X), <double *>np.PyArray_DATA(_C),
+                       _X.shape[0], True)
+        return _C
     def recommend(self, arx):
         """Recommend a solution, return `None`.
 
@@ -764,6 +809,11 @@ cdef class Problem:
         assert(self.problem)
         return coco_problem_get_best_observed_fvalue1(self.problem)
     @property
+    def _best_value(self):
+        """optimal f-value, meant to be used by observers only"""
+        assert(self.problem)
+        return coco_problem_get_best_value(self.problem)
+    @property
     def largest_fvalues_of_interest(self):
         "largest f-values of interest (defined only for multi-objective problems)"
         assert(self.problem)
@@ -813,13 +863,24 @@ cdef class Problem:
         _x = x  # this is the final type conversion
         if self.problem is NULL:
             raise InvalidProblemException()
-        coco_evaluate_function(self.problem,
-                               <double *>np.PyArray_DATA(_x),
-                               <double *>np.PyArray_DATA(self.y_values))
+        self._evaluate(<double *>np.PyArray_DATA(_x),
+                       <double *>np.PyArray_DATA(self.y_values), 1, False)
         if self._number_of_objectives == 1:
             return self.y_values[0]
         return np.array(self.y_values, copy=True)
 
+    def evaluate_batch(self, X):
+        """see __init__.py"""
+        assert self.initialized
+        cdef np.ndarray[double, ndim=2, mode="c"] _X = self._batch_input(X)
+        cdef np.ndarray[double, ndim=2, mode="c"] _F = np.empty(
+            (_X.shape[0], self._number_of_objectives))
+        self._evaluate(<double *>np.PyArray_DATA(_X), <double *>np.PyArray_DATA(_F),
+                       _X.shape[0], False)  # in order, as seen by the observers
+        if self._number_of_objectives == 1:
+            return _F.reshape(_X.shape[0])
+        return _F
+
     @property
     def id(self):
         "id as string without spaces or weird characters"
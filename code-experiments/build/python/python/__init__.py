@@ -17,6 +17,8 @@ file.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 from . import solvers, utilities
+from .runner import run_suite
+from .buffered import BufferedObserver
 try:
     from . import _interface
     from ._interface import Suite as _Suite, Observer as _Observer
@@ -35,7 +37,8 @@ import pkg_resources
 __version__ = pkg_resources.require('cocoex')[0].version
 del pkg_resources
 
-__all__ = ['Observer', 'Suite', 'known_suite_names', 'default_observers']
+__all__ = ['Observer', 'Suite', 'known_suite_names', 'default_observers', 'run_suite',
+           'BufferedObserver']
 
 def default_observers(update=None):
     """return a map from suite names to default observer names.
@@ -429,6 +432,25 @@ class Problem(_interface.Problem):
     It provides other useful properties and methods like `dimension`,
     `number_of_constraints`, `observe_with`, `initial_solution_proposal`...
 
+    Thread safety
+    -------------
+
+    Calling, `constraint`, `evaluate_batch` and `constraint_batch` of a
+    problem without observer release the GIL while the C code evaluates
+    the solutions, such that different `Problem` instances, also of the
+    same `Suite`, can be evaluated concurrently from several threads,
+    e.g. with a ``concurrent.futures.ThreadPoolExecutor``. The contract is:
+
+        - a single `Problem` instance must not be used (evaluated or
+          free'd) from two threads at the same time, because it has a
+          single evaluation counter and output buffer;
+        - problems with an observer keep the GIL during evaluation,
+          because the loggers write files and share state between
+          problems; hence, their evaluations are serialized;
+        - `Suite` and `Observer` methods, like `Suite.get_problem` or
+          `observe_with`, are not thread-safe and should be called from
+          one thread only.
+
     """
     def __init__(self):
         super(Problem, self).__init__()
@@ -439,6 +461,33 @@ class Problem(_interface.Problem):
         """
         return super(Problem, self).constraint(x)
 
+    def evaluate_batch(self, X):
+        """return objective function values of the rows of `X`.
+
+        `X` is a (number of solutions x `dimension`) array-like. The
+        solutions are evaluated in the C code in order of the rows, such
+        that observers log exactly the same data as with ``[self(x) for x
+        in X]``, but without the Python overhead of each call. Return a
+        1-D array, or for more than one objective, a (number of solutions
+        x `number_of_objectives`) array.
+
+        >>> import numpy as np
+        >>> import cocoex as ex
+        >>> f = ex.Suite("bbob", "", "dimensions:2 instance_indices:1")[0]
+        >>> X = np.random.randn(5, f.dimension)
+        >>> assert np.all(f.evaluate_batch(X) == [f(x) for x in X])
+        >>> assert f.evaluations == 10
+
+        """
+        return super(Problem, self).evaluate_batch(X)
+
+    def constraint_batch(self, X):
+        """return constraint values of the rows of `X` as (number of
+        solutions x `number_of_constraints`) array, see `evaluate_batch`
+        and `constraint`.
+        """
+        return super(Problem, self).constraint_batch(X)
+
     def logger_biobj_feed_solution(self, evaluation, y):
         """Feed the given solution to logger_biobj in order to reconstruct its
         output.
@@ -0,0 +1,431 @@
+"""Observer which keeps the logged data in memory and writes them in bulk
+to binary files.
+
+`BufferedObserver` records the same data as the ``"bbob"`` observer of
+the C code, that is, a record for each new target hit (the ``.dat``
+files) and for each evaluation trigger (the ``.tdat`` files), but
+keeps the records of the observed problems in NumPy arrays and writes
+them, when flushed, to a single ``.npz`` file for each function and
+dimension, which `cocopp` reads without parsing text. `to_text`
+converts these files into the usual text format.
+
+>>> import cocoex
+>>> suite = cocoex.Suite("bbob", "", "dimensions: 2,3 function_indices: 1,2")
+>>> observer = cocoex.BufferedObserver("bbob", "result_folder: doctest-buffered")
+>>> for problem in suite:
+...     problem = observer.observe(problem)
+...     F = problem.evaluate_batch(problem.lower_bounds +
+...             (problem.upper_bounds - problem.lower_bounds) *
+...             np.random.rand(100, problem.dimension))
+...     problem.free()
+>>> observer.free()  # writes the buffered data
+>>> len(to_text(observer.result_folder))  # writes .dat and .tdat files
+4
+
+"""
+from __future__ import absolute_import, division, print_function
+import os
+import re
+import math
+import numpy as np
+
+fvalue_logged_for_infinite = 3e21
+"""f-value logged in place of an infinite f-value, as in the C logger"""
+fvalue_logged_for_nan = 2e21
+"""f-value logged in place of `nan`, as in the C logger"""
+
+data_file_header = ("%% f evaluations | g evaluations | best noise-free fitness - Fopt "
+                    "(%13.12e) + sum g_i+ | measured fitness | best measured fitness "
+                    "or single-digit g-values | x1 | x2...\n")
+"""header line of a run in the ``.dat``, ``.tdat`` and ``.rdat`` files"""
+
+
+def _read_option(options, name, default):
+    """return the value of option `name` from an observer options `str` or
+    `dict` `options` like the C code does, or `default`"""
+    if isinstance(options, dict):
+        return str(options.get(name, default))
+    match = re.search(re.escape(name) + r'\s*:\s*("[^"]*"|\S+)', options or '')
+    if not match:
+        return default
+    return match.group(1).strip('"')
+
+
+def _unique_folder(folder):
+    """create and return `folder`, or ``folder-001``, ``folder-002``,...
+    if it exists, like the C function ``coco_create_unique_directory``"""
+    if not os.path.exists(os.path.dirname(folder)):
+        os.makedirs(os.path.dirname(folder))
+    for i in range(999):
+        name = folder if i == 0 else '%s-%03d' % (folder, i)
+        try:
+            os.mkdir(name)
+        except OSError:
+            continue
+        return name
+    raise OSError("unable to create unique folder %s" % folder)
+
+
+class _EvaluationTriggers(object):
+    """evaluation numbers which trigger a ``.tdat`` record, as
+    ``coco_observer_evaluations`` in the C code.
+
+    These are ``10**(i/20)`` for ``i = 0, 1, 2, ...`` and ``dimension *
+    base * 10**j`` for all `base_evaluations` and ``j = 0, 1, 2, ...``.
+    """
+    def __init__(self, dimension, base_evaluations=(1, 2, 5)):
+        self.dimension = dimension
+        self.base_evaluations = base_evaluations
+        self.value1, self.exponent1 = 1, 0
+        self.base_index, self.exponent2 = 0, 0
+        self.value2 = dimension * base_evaluations[0]
+
+    @property
+    def next(self):
+        """the next evaluation number which triggers a record"""
+        return min((self.value1, self.value2))
+
+    def trigger(self, evaluation):
+        """return whether `evaluation` triggers a record and update the
+        triggers"""
+        res = False
+        if evaluation >= self.value1:
+            while int(math.floor(math.pow(10, self.exponent1 / 20.))) <= self.value1:
+                self.exponent1 += 1
+            self.value1 = int(math.floor(math.pow(10, self.exponent1 / 20.)))
+            res = True
+        if evaluation >= self.value2:
+            if self.base_index < len(self.base_evaluations) - 1:
+                self.base_index += 1
+            else:
+                self.base_index, self.exponent2 = 0, self.exponent2 + 1
+            self.value2 = int(math.floor(math.pow(10, self.exponent2) * self.dimension
+                                         * self.base_evaluations[self.base_index] + 0.5))
+            res = True
+        return res
+
+
+class _Records(object):
+    """growing 2-D array of the records of a run, a row for each record
+    with the columns of the ``.dat`` files"""
+    def __init__(self, columns, rows=32):
+        self.data = np.empty((rows, columns))
+        self.size = 0
+
+    def append(self, evaluation, best_delta, fvalue, best_fvalue, x):
+        if self.size == len(self.data):
+            self.data = np.concatenate((self.data, np.empty_like(self.data)))
+        row = self.data[self.size]
+        row[:5] = evaluation, 0, best_delta, fvalue, best_fvalue
+        if len(row) > 5:
+            row[5:] = x
+        self.size += 1
+
+    @property
+    def records(self):
+        return self.data[:self.size]
+
+
+class _Run(object):
+    """the records of a single run on a problem, see `BufferedObserver`"""
+    def __init__(self, problem, number_of_target_triggers, target_precision,
+                 base_evaluations):
+        self.suite_name = problem.suite
+        if isinstance(self.suite_name, bytes):
+            self.suite_name = self.suite_name.decode('ascii')
+        self.function = problem.id_function
+        self.instance = problem.id_instance
+        self.dimension = problem.dimension
+        self.optimal_fvalue = problem._best_value
+        self.number_of_target_triggers = number_of_target_triggers
+        self.target_precision = target_precision
+        self.target_exponent = None  # no target was hit yet
+        self.evaluations = 0
+        self.best_fvalue = np.inf
+        self.best_solution = None
+        self.written_last_evaluation = False
+        columns = 5 + (self.dimension if self.dimension < 22 else 0)
+        self.dat, self.tdat = _Records(columns), _Records(columns)
+        self.evaluation_triggers = _EvaluationTriggers(self.dimension, base_evaluations)
+        self.next_evaluation_trigger = self.evaluation_triggers.next
+
+    def _target_hit(self, delta):
+        """return whether the f-value difference `delta` hits a new target,
+        as ``coco_observer_targets_trigger`` in the C code"""
+        if delta == 0:
+            delta = self.target_precision / 10.
+        elif delta < self.target_precision:
+            delta = self.target_precision
+        exponent = int(math.ceil(math.log10(delta) * self.number_of_target_triggers))
+        if self.target_exponent is None or exponent < self.target_exponent:
+            self.target_exponent = exponent
+            return True
+        return False
+
+    def _improved(self, evaluation, fvalue, x):
+        """update the best solution and record a new target hit"""
+        self.best_fvalue = max((fvalue, self.optimal_fvalue))
+        self.best_solution = np.array(x, dtype=float)
+        if evaluation == 1 or self._target_hit(self.best_fvalue - self.optimal_fvalue):
+            self.dat.append(evaluation, self.best_fvalue - self.optimal_fvalue, fvalue,
+                            self.best_fvalue, x)
+
+    def record(self, x, fvalue):
+        """record the evaluation of `x` with f-value `fvalue`"""
+        if fvalue != fvalue:
+            fvalue = fvalue_logged_for_nan
+        elif fvalue in (np.inf, -np.inf):
+            fvalue = fvalue_logged_for_infinite
+        self.evaluations += 1
+        if self.evaluations == 1 or max((fvalue, self.optimal_fvalue)) < self.best_fvalue:
+            self._improved(self.evaluations, fvalue, x)
+        self.written_last_evaluation = self.evaluations >= self.next_evaluation_trigger
+        if self.written_last_evaluation:
+            self.evaluation_triggers.trigger(self.evaluations)
+            self.next_evaluation_trigger = self.evaluation_triggers.next
+            self.tdat.append(self.evaluations, self.best_fvalue - self.optimal_fvalue,
+                             fvalue, self.best_fvalue, x)
+
+    def record_batch(self, X, F):
+        """record the evaluations of the rows of `X` with f-values `F`"""
+        if not np.all(np.isfinite(F)):
+            F = np.where(np.isnan(F), fvalue_logged_for_nan,
+                         np.where(np.isinf(F), fvalue_logged_for_infinite, F))
+        first = self.evaluations + 1  # evaluation number of X[0]
+        best = np.minimum.accumulate(np.concatenate((
+            [self.best_fvalue], np.maximum(F, self.optimal_fvalue))))
+        improved = best[1:] < best[:-1]  # best[i + 1] is the best f-value after X[i]
+        best = best[1:]
+        if first == 1 and len(F):
+            improved[0] = True
+        for i in np.nonzero(improved)[0]:
+            self._improved(first + i, F[i], X[i])
+        self.evaluations += len(F)
+        self.written_last_evaluation = False
+        while self.next_evaluation_trigger <= self.evaluations:
+            i = self.next_evaluation_trigger - first
+            self.evaluation_triggers.trigger(first + i)
+            self.next_evaluation_trigger = self.evaluation_triggers.next
+            self.tdat.append(first + i, best[i] - self.optimal_fvalue, F[i], best[i], X[i])
+            self.written_last_evaluation = first + i == self.evaluations
+
+    def finalize(self):
+        """record the final evaluation in the ``.tdat`` records"""
+        if self.evaluations and not self.written_last_evaluation:
+            self.tdat.append(self.evaluations, self.best_fvalue - self.optimal_fvalue,
+                             self.best_fvalue, self.best_fvalue, self.best_solution)
+            self.written_last_evaluation = True
+
+    @property
+    def number_of_records(self):
+        return self.dat.size + self.tdat.size
+
+
+class BufferedProblem(object):
+    """a `Problem` observed by a `BufferedObserver`.
+
+    Calling the problem or its `evaluate_batch` method evaluates the
+    unobserved problem and passes the solutions and f-values to the
+    observer. All other attributes are those of the unobserved problem.
+    """
+    def __init__(self, problem, observer):
+        self.problem = problem
+        self.observer = observer
+        self._run = observer._start_run(problem)
+
+    def __call__(self, x):
+        """return objective function value of input `x`"""
+        f = self.problem(x)
+        self._run.record(x, f)
+        return f
+
+    def evaluate_batch(self, X):
+        """return the objective function values of the rows of `X`, see
+        `Problem.evaluate_batch`"""
+        X = np.asarray(X, dtype=float)  # recorded rows are copied
+        F = self.problem.evaluate_batch(X)
+        self._run.record_batch(X, F)
+        return F
+
+    def free(self, force=False):
+        """finalize the records of the run and free the problem"""
+        if self._run is not None:
+            self.observer._finish_run(self._run)
+            self._run = None
+        self.problem.free(force)
+
+    def __del__(self):
+        if getattr(self, '_run', None) is not None:
+            self.observer._finish_run(self._run)
+
+    def __getattr__(self, name):
+        if name in ('problem', 'observer', '_run'):  # not yet set in __init__
+            raise AttributeError(name)
+        return getattr(self.problem, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.free()
+
+    def __str__(self):
+        return str(self.problem)
+
+    def __repr__(self):
+        return repr(self.problem).replace('<', '<observed ', 1)
+
+
+class BufferedObserver(object):
+    """Observer which writes the data of the ``"bbob"`` observer in bulk
+    to ``.npz`` files.
+
+    `name` must be ``"bbob"``, `options` are a `str` or `dict` as for
+    `Observer`, where ``result_folder``, ``algorithm_name``,
+    ``number_target_triggers``, ``target_precision`` and
+    ``base_evaluation_triggers`` are used. Single-objective problems
+    without constraints can be observed.
+
+    Unlike `Observer.observe`, `observe` returns the observed problem,
+    a `BufferedProblem`. The records of a run are complete when the
+    observed problem is free'd. Complete runs are written when more than
+    `buffer_size` records are buffered and in `flush` and `free`.
+
+    The result folder has a ``bbobexp_f<function>.info`` file for each
+    function with an entry for each flush, whose data file, named like
+    ``data_f<function>/bbobexp_f<function>_DIM<dimension>_i<instance>.dat``,
+    does not exist, but the ``.npz`` file of the same name contains the
+    arrays ``instances`` and ``optimal_fvalues`` with an entry for each
+    run, and ``dat`` and ``tdat`` with the records of all runs, one
+    after the other, with the number of records of each run in
+    ``dat_lengths`` and ``tdat_lengths``.
+    """
+    def __init__(self, name, options, buffer_size=100000):
+        if name != 'bbob':
+            raise ValueError("BufferedObserver writes only the data of the"
+                             " 'bbob' observer, got '%s'" % str(name))
+        self.name = name
+        self.options = options
+        self.buffer_size = buffer_size
+        self.algorithm_name = _read_option(options, 'algorithm_name', 'ALG')
+        self.number_of_target_triggers = int(_read_option(options, 'number_target_triggers', 100))
+        self.target_precision = float(_read_option(options, 'target_precision', 1e-8))
+        self.base_evaluations = [int(s) for s in _read_option(
+            options, 'base_evaluation_triggers', '1,2,5').split(',')]
+        self._result_folder = _unique_folder(os.path.join(
+            'exdata', _read_option(options, 'result_folder', 'default')))
+        self._runs = []  # complete runs which are not written yet
+        self._open_runs = []
+
+    @property
+    def result_folder(self):
+        """name of the output folder"""
+        return self._result_folder
+
+    def observe(self, problem):
+        """return `problem` observed by `self`, a `BufferedProblem`"""
+        if problem.number_of_objectives != 1 or problem.number_of_constraints > 0:
+            raise ValueError("%s can only observe single-objective problems without"
+                             " constraints" % self.__class__.__name__)
+        if not hasattr(problem, '_best_value'):
+            raise RuntimeError("%s needs the optimal f-value of the problem, which"
+                               " the installed cocoex interface does not provide;"
+                               " it is outdated, rebuild and reinstall cocoex with"
+                               " `python do.py run-python`" % self.__class__.__name__)
+        return BufferedProblem(problem, self)
+
+    def _start_run(self, problem):
+        run = _Run(problem, self.number_of_target_triggers, self.target_precision,
+                   self.base_evaluations)
+        self._open_runs.append(run)
+        return run
+
+    def _finish_run(self, run):
+        if run not in self._open_runs:  # finished already in `free`
+            return
+        run.finalize()
+        self._open_runs.remove(run)
+        if run.evaluations:  # like the C logger, which writes on the first evaluation
+            self._runs.append(run)
+        if sum(run.number_of_records for run in self._runs) > self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """write the complete runs to the result folder"""
+        from . import __version__
+        groups = {}  # runs of each function and dimension
+        for run in self._runs:
+            groups.setdefault((run.function, run.dimension), []).append(run)
+        for (function, dimension), runs in sorted(groups.items()):
+            folder = os.path.join(self.result_folder, 'data_f%d' % function)
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+            name = 'bbobexp_f%d_DIM%d_i%d' % (function, dimension, runs[0].instance)
+            base, i = name, 1
+            while os.path.exists(os.path.join(folder, name + '.npz')):
+                name, i = '%s-%d' % (base, i), i + 1
+            arrays = dict(instances=np.array([run.instance for run in runs]),
+                          optimal_fvalues=np.array([run.optimal_fvalue for run in runs]))
+            for extension in ['dat', 'tdat']:
+                records = [getattr(run, extension).records for run in runs]
+                arrays[extension] = np.concatenate(records)
+                arrays[extension + '_lengths'] = np.array([len(r) for r in records])
+            np.savez(os.path.join(folder, name + '.npz'), **arrays)
+            info = os.path.join(self.result_folder, 'bbobexp_f%d.info' % function)
+            entry = ("suite = '%s', funcId = %d, DIM = %d, Precision = %.3e, algId = '%s',"
+                     " coco_version = '%s', logger = 'bbob', data_format = 'bbob-new2'\n%%\n"
+                     "data_f%d/%s.dat" % (runs[0].suite_name, function, dimension, 1e-8,
+                                          self.algorithm_name, __version__, function, name))
+            entry += ''.join(', %d:%d|%.1e' % (run.instance, run.evaluations,
+                                               run.best_fvalue - run.optimal_fvalue)
+                             for run in runs)
+            if os.path.exists(info):
+                entry = '\n' + entry
+            with open(info, 'a') as f:
+                f.write(entry)
+        self._runs = []
+
+    def free(self):
+        """finalize the runs of all observed problems and write all data"""
+        for run in list(self._open_runs):
+            self._finish_run(run)
+        self.flush()
+
+    def __del__(self):
+        if getattr(self, '_runs', None) or getattr(self, '_open_runs', None):
+            self.free()
+
+
+def _format_record(row):
+    """return a line of a ``.dat`` file from a record"""
+    return ' '.join(['%d %d %+10.9e %+10.9e %+10.9e' % tuple(row[:5])]
+                    + ['%+5.4e' % x for x in row[5:]]) + '\n'
+
+
+def to_text(folder, remove=False):
+    """convert the ``.npz`` files written by `BufferedObserver` in `folder`
+    to ``.dat``, ``.tdat`` and ``.rdat`` files in the text format of the
+    ``"bbob"`` observer, remove the ``.npz`` files if `remove`, and return
+    the list of converted files.
+    """
+    converted = []
+    for root, _dirs, names in os.walk(folder):
+        for name in sorted(names):
+            if not name.endswith('.npz'):
+                continue
+            filename = os.path.join(root, name)
+            with np.load(filename) as data:
+                if 'optimal_fvalues' not in data:
+                    continue
+                optimal_fvalues = data['optimal_fvalues']
+                for extension in ['dat', 'tdat', 'rdat']:
+                    runs = ([[]] * len(optimal_fvalues) if extension == 'rdat' else np.split(
+                        data[extension], np.cumsum(data[extension + '_lengths'])[:-1]))
+                    with open(os.path.splitext(filename)[0] + '.' + extension, 'w') as f:
+                        for fopt, records in zip(optimal_fvalues, runs):
+                            f.write(data_file_header % fopt)
+                            f.write(''.join(_format_record(row) for row in records))
+            if remove:
+                os.remove(filename)
+            converted.append(filename)
+    return converted
@@ -0,0 +1,361 @@
+"""Run a solver on a benchmark suite in several processes.
+
+`run_suite` distributes the problems of a `Suite` to a pool of worker
+processes, each of which writes the data of its problems with its own
+`Observer`, and merges the output of the workers into a single result
+folder, which can be post-processed with `cocopp` like the output of a
+single process.
+
+The workers record each finished problem in a journal in their folder,
+see `read_journal`. When an experiment is interrupted, ``run_suite(...,
+resume=result_folder)`` truncates the partially logged problems from the
+data files, merges the finished problems and benchmarks only the
+remaining problems.
+"""
+from __future__ import absolute_import, division, print_function
+import os
+import re
+import json
+import time
+import shutil
+import heapq
+import multiprocessing
+from . import solvers
+from .utilities import ObserverOptions, ascetime
+
+data_file_extensions = ('.dat', '.tdat', '.rdat', '.mdat', '.adat')
+"""extensions of the data files referenced in the .info files"""
+
+journal_name = 'journal.txt'
+"""name of the file which records the finished problems in a result folder"""
+
+
+def problem_dimension(problem_id):
+    """return the dimension of the problem with id `problem_id`.
+
+    >>> from cocoex.runner import problem_dimension
+    >>> problem_dimension('bbob_f001_i01_d10')
+    10
+
+    """
+    return int(problem_id.split('_d')[-1].split('_')[0])
+
+
+def balanced_batches(costs, number_of_batches):
+    """return `number_of_batches` sorted lists of indices into `costs`
+    with about equal sum of costs.
+
+    The indices are assigned in order of decreasing cost, each to the
+    batch with the smallest sum of costs so far (longest processing time
+    first).
+
+    >>> from cocoex.runner import balanced_batches
+    >>> balanced_batches([4, 1, 9, 1, 4, 1], 2)
+    [[2, 3], [0, 1, 4, 5]]
+
+    """
+    batches = [[] for _ in range(number_of_batches)]
+    sums = [(0, i) for i in range(number_of_batches)]
+    for index in sorted(range(len(costs)), key=lambda i: (-costs[i], i)):
+        cost, batch = heapq.heappop(sums)
+        batches[batch].append(index)
+        heapq.heappush(sums, (cost + costs[index], batch))
+    return [sorted(batch) for batch in batches]
+
+
+def optimize(solver, problem, budget):
+    """call ``solver(problem, remaining_budget)`` until the `budget` of
+    evaluations is exhausted, the final target is hit or `solver` does
+    not evaluate `problem` anymore, and return the number of calls"""
+    used = lambda: max((problem.evaluations, problem.evaluations_constraints))
+    runs = 0
+    while used() < budget and not problem.final_target_hit:
+        used_before = used()
+        solver(problem, budget - used_before)
+        runs += 1
+        if used() <= used_before:
+            break
+    return runs
+
+
+def random_search(problem, budget):
+    """`solvers.random_search` with the interface of `run_suite`"""
+    return solvers.random_search(problem, problem.lower_bounds, problem.upper_bounds, budget)
+
+
+def read_journal(folder):
+    """return the entries of the journal in `folder` as a `list` of `dict`.
+
+    The journal has a line in json format for each finished problem with
+    the keys ``'id'``, ``'evaluations'`` and ``'runs'`` and, in a worker
+    folder, ``'files'``, the sizes of the files in the folder after the
+    problem was finished. An incomplete last line is ignored.
+    """
+    entries = []
+    filename = os.path.join(folder, journal_name)
+    if os.path.exists(filename):
+        with open(filename, 'r') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:  # interrupted while writing
+                    break
+    return entries
+
+
+def _write_journal_entry(folder, entry):
+    with open(os.path.join(folder, journal_name), 'a') as f:
+        f.write(json.dumps(entry, sort_keys=True) + '\n')
+
+
+def _file_sizes(folder):
+    """return a `dict` of the sizes of the files in `folder` but the journal"""
+    sizes = {}
+    for root, _dirs, names in os.walk(folder):
+        for name in names:
+            path = os.path.join(root, name)
+            if os.path.relpath(path, folder) != journal_name:
+                sizes[os.path.relpath(path, folder).replace(os.sep, '/')] = os.path.getsize(path)
+    return sizes
+
+
+def truncate_result_folder(folder):
+    """remove the data of unfinished problems from worker `folder`.
+
+    Truncates the files in `folder` to their size after the last problem
+    in the journal was finished and removes the files created thereafter.
+    Return the journal entries.
+    """
+    entries = read_journal(folder)
+    sizes = entries[-1]['files'] if entries else {}
+    for name, size in _file_sizes(folder).items():
+        path = os.path.join(folder, *name.split('/'))
+        if name not in sizes:
+            os.remove(path)
+        elif size > sizes[name]:
+            with open(path, 'r+b') as f:
+                f.truncate(sizes[name])
+    return entries
+
+
+def _observer_options(options, result_folder):
+    """return `options` with `result_folder`"""
+    if isinstance(options, dict):
+        return ObserverOptions(options).update(result_folder=result_folder).as_string
+    # the C code uses the first occurrence of an option name
+    return 'result_folder: %s %s' % (result_folder, options or '')
+
+
+def _run_batch(job):
+    """benchmark the problems of a batch and return the result folder"""
+    (solver, suite_name, suite_instance, suite_options, observer_name, observer_options,
+     indices, budget_multiplier) = job
+    from . import Suite, Observer
+    suite = Suite(suite_name, suite_instance, suite_options)
+    observer = Observer(observer_name, observer_options)
+    for index in indices:
+        problem = suite.get_problem(index, observer)
+        entry = {'runs': optimize(solver, problem, budget_multiplier * problem.dimension),
+                 'evaluations': problem.evaluations + problem.evaluations_constraints,
+                 'id': problem.id}
+        problem.free()  # finalizes the output of the problem
+        entry['files'] = _file_sizes(observer.result_folder)
+        _write_journal_entry(observer.result_folder, entry)
+    return observer.result_folder
+
+
+def _data_file_reference_folder(info_name, info):
+    """return the folder relative to which the .info file `info_name` with
+    content `info` references its data files"""
+    match = re.search(r"folder = '([^']*)'", info.split('\n')[0])
+    if match:  # bbob-biobj format
+        return os.path.join(os.path.dirname(info_name), match.group(1))
+    return os.path.dirname(info_name)
+
+
+def _append_info(destination, info):
+    """append the .info file content `info` to file `destination`.
+
+    The header and comment lines are not repeated if the .info file has a
+    single header for all entries, as in the bbob-biobj format.
+    """
+    if os.path.exists(destination):
+        with open(destination, 'r') as f:
+            existing = f.read()
+        lines = info.split('\n')
+        if (lines[0] == existing.split('\n')[0] and len(lines) > 2
+                and lines[2].startswith('function')):
+            info = '\n'.join(lines[2:])
+        if not existing.endswith('\n'):
+            info = '\n' + info
+    with open(destination, 'a') as f:
+        f.write(info)
+
+
+def merge_result_folders(folders, target):
+    """merge the result `folders` of several observers into `target`.
+
+    The files are copied into `target`. The entries of .info files of
+    the same name are appended to each other and colliding data files are
+    renamed, together with their references in the .info files.
+    """
+    for folder in folders:
+        renamed = {}  # relative data file name without extension -> new name
+        files = []
+        for root, _dirs, names in os.walk(folder):
+            files.extend(os.path.relpath(os.path.join(root, name), folder) for name in names)
+        files = [name for name in files if name != journal_name]
+        for name in files:
+            base, extension = os.path.splitext(name)
+            if extension in data_file_extensions and base not in renamed:
+                new, i = base, 1
+                while any(os.path.exists(os.path.join(target, new + ext))
+                          for ext in data_file_extensions):
+                    new, i = '%s_%d' % (base, i), i + 1
+                renamed[base] = new
+        for name in files:
+            base, extension = os.path.splitext(name)
+            source = os.path.join(folder, name)
+            if extension == '.info':
+                with open(source, 'r') as f:
+                    info = f.read()
+                reference_folder = _data_file_reference_folder(name, info)
+                for old, new in renamed.items():
+                    if old == new:
+                        continue
+                    for ext in data_file_extensions:
+                        old_reference, new_reference = [
+                            os.path.relpath(path, reference_folder).replace(os.sep, '/') + ext
+                            for path in (old, new)]
+                        info = re.sub(r'(?<![\w./-])' + re.escape(old_reference) + r'(?![\w.])',
+                                      new_reference.replace('\\', r'\\'), info)
+                _append_info(os.path.join(target, name), info)
+                continue
+            destination = os.path.join(target, renamed.get(base, base) + extension)
+            if not os.path.exists(os.path.dirname(destination)):
+                os.makedirs(os.path.dirname(destination))
+            shutil.copy2(source, destination)
+
+
+def _collect_worker_folder(folder, result_folder, finished):
+    """merge the problems of worker `folder` which are finished but not in
+    `finished` into `result_folder`, remove `folder` and return the
+    journal entries of the merged problems"""
+    entries = [entry for entry in truncate_result_folder(folder)
+               if entry['id'] not in finished]
+    if entries:
+        merge_result_folders([folder], result_folder)
+        for entry in entries:
+            _write_journal_entry(result_folder, dict(
+                (key, value) for key, value in entry.items() if key != 'files'))
+    shutil.rmtree(folder)
+    return entries
+
+
+def run_suite(solver, suite_name, observer_options=None, workers=None,
+              budget_multiplier=2, suite_instance='', suite_options='',
+              observer_name=None, verbose=True, resume=None):
+    """benchmark `solver` on all problems of suite `suite_name` using
+    `workers` processes and return the result folder.
+
+    `solver` is called like ``solver(problem, budget)`` and, in case, it
+    is called again with the remaining budget, see `optimize`, until
+    ``budget_multiplier * problem.dimension`` evaluations are used. With
+    more than one worker, `solver` must be a picklable callable, e.g. a
+    function defined on module level.
+
+    The problems are distributed to the workers by their expected cost,
+    that is, ``dimension * budget``, with `balanced_batches`. Each
+    worker writes its data to a folder of its own, with the suffix
+    ``_worker###ofN`` and the worker folders are merged into the result
+    folder defined by `observer_options` with `merge_result_folders`
+    and then removed. `workers` defaults to the number of CPUs.
+
+    Finished problems are recorded in the journal of the result folder,
+    see `read_journal`. To continue an interrupted experiment, `resume`
+    is the result folder of the experiment, as returned or printed by
+    `run_suite`. Then, the problems finished in the remaining worker
+    folders are merged, their unfinished problems are removed with
+    `truncate_result_folder` and the problems not in the journal are
+    benchmarked. The other arguments must be the same as in the
+    interrupted call, except for `workers`.
+
+    >>> import cocoex
+    >>> folder = cocoex.run_suite(cocoex.runner.random_search, 'bbob',
+    ...                           'result_folder: doctest-runner', workers=2,
+    ...                           suite_options='dimensions: 2,3 function_indices: 1-2',
+    ...                           verbose=False)
+    >>> runs = 0  # count the runs listed in the .info files
+    >>> for name in os.listdir(folder):
+    ...     if name.endswith('.info'):
+    ...         with open(os.path.join(folder, name)) as f:
+    ...             runs += f.read().count('|')
+    >>> runs  # 2 functions x 2 dimensions x 15 instances
+    60
+    >>> len(cocoex.runner.read_journal(folder))
+    60
+    >>> folder == cocoex.run_suite(cocoex.runner.random_search, 'bbob',
+    ...                            'result_folder: doctest-runner', workers=2,
+    ...                            suite_options='dimensions: 2,3 function_indices: 1-2',
+    ...                            verbose=False, resume=folder)  # nothing left to do
+    True
+
+    """
+    from . import Suite, Observer, default_observers
+    t0 = time.time()
+    if observer_name is None:
+        observer_name = default_observers()[suite_name]
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if resume:
+        if not os.path.isdir(resume):
+            raise ValueError("cannot resume, %s is not a folder" % str(resume))
+        result_folder = resume
+    else:
+        observer = Observer(observer_name, observer_options)  # creates the result folder
+        result_folder = observer.result_folder
+        del observer
+    finished = set(entry['id'] for entry in read_journal(result_folder))
+    worker_prefix = os.path.basename(result_folder) + '_worker'
+    parent_folder = os.path.dirname(result_folder) or os.curdir
+    entries = []
+    if resume:
+        for name in sorted(os.listdir(parent_folder)):
+            folder = os.path.join(parent_folder, name)
+            if name.startswith(worker_prefix) and os.path.isdir(folder):
+                entries += _collect_worker_folder(folder, result_folder, finished)
+                finished.update(entry['id'] for entry in entries)
+        if verbose:
+            print("%d problems finished before, %d in the interrupted run" % (
+                len(finished) - len(entries), len(entries)))
+        entries = []
+    ids = Suite(suite_name, suite_instance, suite_options).ids()
+    indices = [i for i, id in enumerate(ids) if id not in finished]
+    costs = [budget_multiplier * problem_dimension(ids[i])**2 for i in indices]
+    batches = [[indices[i] for i in batch]
+               for batch in balanced_batches(costs, max((1, workers))) if batch]
+    jobs = [(solver, suite_name, suite_instance, suite_options, observer_name,
+             _observer_options(observer_options, '%s%03dof%d' % (
+                 worker_prefix, i + 1, len(batches))),
+             batch, budget_multiplier)
+            for i, batch in enumerate(batches)]
+    if len(jobs) <= 1:
+        folders = [_run_batch(job) for job in jobs]
+    else:
+        pool = multiprocessing.Pool(min((workers, len(jobs))))
+        try:
+            folders = pool.map(_run_batch, jobs, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    for folder in folders:
+        entries += _collect_worker_folder(folder, result_folder, finished)
+    if verbose:
+        print("%d problems of suite %s benchmarked with %d evaluations in %d solver calls"
+              " by %d worker%s in %s, data written to folder %s" % (
+                  len(entries), suite_name,
+                  sum(entry['evaluations'] for entry in entries),
+                  sum(entry['runs'] for entry in entries),
+                  len(jobs), 's' if len(jobs) > 1 else '', ascetime(time.time() - t0),
+                  result_folder))
+    return result_folder
@@ -19,6 +19,8 @@ def random_search(fun, lbounds, ubounds, budget):
             FC = [(fun(x), fun.constraint(x)) for x in X]  # call  objective and constraints
             F = [fc[0] for fc in FC if all(fc[1] <= 0)]
             budget -= chunk  # one more to account for constraint evals
+        elif hasattr(fun, 'evaluate_batch'):  # a `cocoex.Problem`
+            F = fun.evaluate_batch(X)
         else:
             F = [fun(x) for x in X]
         if fun.number_of_objectives == 1:
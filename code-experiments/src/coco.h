@@ -407,6 +407,13 @@ int coco_problem_final_target_hit(const coco_problem_t *problem);
  */
 double coco_problem_get_best_observed_fvalue1(const coco_problem_t *problem);
 
+/**
+ * @brief Returns the optimal value of the first objective.
+ *
+ * @note Meant to be used by observers, not by the optimization algorithm.
+ */
+double coco_problem_get_best_value(const coco_problem_t *problem);
+
 /**
  * @brief Returns the target value for the first objective.
  */
@@ -690,6 +690,47 @@ class COCODataArchive(_td.StrList):
             self.check_hash(full_name)
         return full_name
 
+    def get_summary(self, substr=None, remote=True):
+        """return the full pathname of the summary file of `substr`,
+
+        which contains, per function and dimension, only the run lengths
+        to reach the target values of the testbed, see
+        `cocopp.pproc.summarize_dataset`. The summary loads much faster
+        than the archived data and is sufficient to display background
+        algorithms or to construct a best algorithm, for example
+
+        >>> import cocopp
+        >>> cocopp.genericsettings.background = {
+        ...     None: cocopp.archives.bbob.get_all_summaries('2009/')}  # doctest:+SKIP
+
+        The data are retrieved with `get` and the summary is created on
+        first use as hidden file next to the data, see
+        `cocopp.pproc.summary_filename`. It is created again when the
+        data or the relevant settings have changed.
+
+        Return `''` if the data are not available and ``remote is False``.
+        """
+        from . import pproc  # pproc imports archiving
+        full_name = self.get(substr, remote=remote)
+        if not full_name:
+            return full_name
+        filename = pproc.summary_filename(full_name)
+        if not pproc.is_current_summary(filename):
+            self._print("  creating summary %s" % filename)
+            pproc.save_summary(full_name, filename)
+        return filename
+
+    def get_all_summaries(self, indices=None, remote=True):
+        """Return a `list` (`StrList`) of the summary file names of
+        `get_all` ``(indices, remote)``, see `get_summary`.
+        """
+        if indices is not None:
+            names = self.find(indices)
+        else:
+            names = self.found
+        return _td.StrList(self.get_summary(name, remote=remote)
+                           for name in names)
+
     def _download(self, name):
         """create full local path and download single dataset"""
         url = '/'.join((self.remote_data_path, name))
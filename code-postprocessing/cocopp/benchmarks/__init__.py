@@ -0,0 +1,16 @@
+"""Benchmarks of the run time of the post-processing.
+
+`datagen` writes synthetic data of configurable size in the format of
+the ``bbob`` logger and `hotpaths` times the functions and modules
+which dominate the run time of the post-processing on these data and
+saves the results as JSON, such that runs can be compared across
+revisions without network access::
+
+    python -m cocopp.benchmarks --size=medium -o before.json
+    python -m cocopp.benchmarks --size=medium -o after.json
+    python -m cocopp.benchmarks --compare before.json after.json
+
+"""
+from __future__ import absolute_import
+from . import datagen, hotpaths
+from .hotpaths import run, save, load, compare
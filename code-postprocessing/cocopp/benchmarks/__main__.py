@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Run the `cocopp` benchmarks and write their results as JSON.
+
+Usage::
+
+    python -m cocopp.benchmarks [options] [benchmark names]
+    python -m cocopp.benchmarks --compare results1.json results2.json ...
+
+Options:
+
+    -h, --help
+        display this message
+    -o, --output=FILE
+        write the results to FILE, default is
+        ``cocopp_benchmarks_<revision>.json``
+    --size=small|medium|large
+        size of the synthetic data, default is ``small``
+    -r, --repetitions=N
+        number of timed runs of each micro-benchmark, the minimal
+        time is compared, default is 3
+    --micro, --macro
+        run only the micro-benchmarks of single functions or only the
+        macro-benchmarks of complete output modules
+    --full
+        run also the full post-processing with `rungeneric.main`
+    --data-folder=FOLDER
+        write the synthetic data to FOLDER, which is kept, instead of a
+        temporary folder
+    --compare
+        print the times of the given result files and their ratios to
+        the times of the first file
+
+Without names, all micro- and macro-benchmarks are run. The names are
+listed with ``--list``.
+"""
+
+from __future__ import absolute_import, print_function
+import sys
+import getopt
+from . import hotpaths
+
+
+def main(argv=None):
+    """run the benchmarks, see module documentation"""
+    if argv is None:
+        argv = sys.argv[1:]
+    try:
+        opts, args = getopt.getopt(argv, 'ho:r:',
+                                   ['help', 'output=', 'size=', 'repetitions=', 'micro',
+                                    'macro', 'full', 'data-folder=', 'compare', 'list'])
+    except getopt.GetoptError as err:
+        print(err)
+        print(__doc__)
+        return 2
+    output, size, repetitions, folder = None, 'small', 3, None
+    kinds = ('micro', 'macro')
+    for o, a in opts:
+        if o in ('-h', '--help'):
+            print(__doc__)
+            return 0
+        elif o in ('-o', '--output'):
+            output = a
+        elif o == '--size':
+            if a not in hotpaths.sizes:
+                print('unknown size %s, use one of %s' % (a, ', '.join(sorted(hotpaths.sizes))))
+                return 2
+            size = a
+        elif o in ('-r', '--repetitions'):
+            repetitions = int(a)
+        elif o == '--micro':
+            kinds = ('micro',)
+        elif o == '--macro':
+            kinds = ('macro',)
+        elif o == '--full':
+            kinds = kinds + ('full',)
+        elif o == '--data-folder':
+            folder = a
+        elif o == '--compare':
+            print(hotpaths.compare(args))
+            return 0
+        elif o == '--list':
+            for name, kind, benchmark in hotpaths.benchmarks:
+                print('%-20s %s: %s' % (name, kind, ' '.join(benchmark.__doc__.split())))
+            return 0
+    unknown = set(args) - set(name for name, _, _ in hotpaths.benchmarks)
+    if unknown:
+        print('unknown benchmarks %s, see --list' % ', '.join(sorted(unknown)))
+        return 2
+    results = hotpaths.run(size, names=args, kinds=kinds, repetitions=repetitions,
+                           folder=folder)
+    if output is None:
+        output = 'cocopp_benchmarks_%s.json' % (results['cocopp'] or size)
+    hotpaths.save(results, output)
+    print('results written to %s' % output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Write synthetic ``bbob`` data of configurable size.
+
+The data are written in the ``bbob-new2`` format of the ``bbob``
+logger of `cocoex`: for each algorithm, one :file:`.info` file per
+function and :file:`.dat` and :file:`.tdat` files per function and
+dimension, with one block of lines for each instance. A run is
+simulated as a random sequence of improvements with a linearly
+decreasing logarithm of the function value, see `simulate_run`, until
+the final target ``1e-8`` or the budget is reached. The data are
+reproducible for the same arguments.
+
+>>> import os, tempfile
+>>> from cocopp.benchmarks import datagen
+>>> folder = tempfile.mkdtemp()
+>>> algorithms = datagen.write_synthetic_data(folder, algorithms=2,
+...     functions=(1, 2), dimensions=(2, 3), instances=3,
+...     evaluations_per_dimension=100)
+>>> [os.path.basename(a) for a in algorithms]
+['SYN1', 'SYN2']
+>>> sorted(os.listdir(algorithms[0]))
+['bbobexp_f1_i1.info', 'bbobexp_f2_i1.info', 'data_f1', 'data_f2']
+>>> sorted(os.listdir(os.path.join(algorithms[0], 'data_f1')))  # doctest: +NORMALIZE_WHITESPACE
+['bbobexp_f1_DIM2_i1.dat', 'bbobexp_f1_DIM2_i1.tdat',
+ 'bbobexp_f1_DIM3_i1.dat', 'bbobexp_f1_DIM3_i1.tdat']
+
+"""
+
+from __future__ import absolute_import, division, print_function
+import os
+import numpy as np
+
+final_target = 1e-8
+dat_header = ('%% f evaluations | g evaluations | best noise-free fitness - Fopt (%.12e)'
+              ' + sum g_i+ | measured fitness | best measured fitness or single-digit'
+              ' g-values | x1 | x2...')
+info_header = ("suite = 'bbob', funcId = %d, DIM = %d, Precision = 1.000e-08, algId = '%s',"
+               " coco_version = '2.6.3', logger = 'bbob', data_format = 'bbob-new2'")
+
+
+def simulate_run(rand, budget, difficulty, max_steps=500):
+    """return evaluations and best function values of the improvements
+    of a simulated run with `budget` evaluations.
+
+    The logarithm of the function value decreases linearly by one per
+    `difficulty` evaluations, with noise. The last entry is the final
+    evaluation.
+    """
+    evals = np.unique(np.hstack((1, np.ceil(np.exp(np.cumsum(rand.exponential(0.1, max_steps)))))))
+    log_f = rand.uniform(0, 3) - evals / difficulty + rand.normal(0, 0.3, len(evals))
+    fvalues = np.minimum.accumulate(10**log_f)
+    improved = np.hstack((True, fvalues[1:] < fvalues[:-1]))
+    evals, fvalues = evals[improved], fvalues[improved]
+    success = np.flatnonzero(fvalues <= final_target)
+    end = success[0] + 1 if len(success) else len(evals)
+    keep = evals[:end] <= budget
+    evals, fvalues = evals[:end][keep], fvalues[:end][keep]
+    if fvalues[-1] > final_target and evals[-1] < budget:
+        evals, fvalues = np.hstack((evals, budget)), np.hstack((fvalues, fvalues[-1]))
+    return evals, fvalues
+
+
+def _lines(rand, evals, fvalues, fopt, dim):
+    """return data lines for the given evaluations and function values"""
+    x = rand.uniform(-5, 5, (len(evals), dim))
+    measured = fvalues + fopt
+    return ['%d 0 %+.9e %+.9e %+.9e ' % (e, f, m, m) + ' '.join('%+.4e' % xi for xi in xs)
+            for e, f, m, xs in zip(evals, fvalues, measured, x)]
+
+
+def tdat_evaluations(final_evaluation):
+    """return the evaluations logged in a :file:`.tdat` file for a run
+    with `final_evaluation` evaluations"""
+    evals = np.unique(np.floor(10**(np.arange(0, 20 * np.log10(final_evaluation) + 1) / 20)))
+    evals = evals[evals < final_evaluation]
+    return np.hstack((evals, final_evaluation))
+
+
+def write_function_dimension(folder, algorithm, fun, dim, instances, budget, difficulty, rand):
+    """write the data files of `fun` in dimension `dim` and return the
+    lines of the entry in the :file:`.info` file"""
+    name = 'data_f%d/bbobexp_f%d_DIM%d_i1' % (fun, fun, dim)
+    dat, tdat, info = [], [], []
+    for instance in instances:
+        fopt = np.round(rand.uniform(-1000, 1000), 2)
+        evals, fvalues = simulate_run(rand, budget, difficulty)
+        dat.append(dat_header % fopt)
+        dat.extend(_lines(rand, evals, fvalues, fopt, dim))
+        tevals = tdat_evaluations(evals[-1])
+        tfvalues = fvalues[np.searchsorted(evals, tevals, side='right') - 1]
+        tdat.append(dat_header % fopt)
+        tdat.extend(_lines(rand, tevals, tfvalues, fopt, dim))
+        info.append('%d:%d|%.1e' % (instance, evals[-1], fvalues[-1]))
+    for extension, lines in (('.dat', dat), ('.tdat', tdat)):
+        with open(os.path.join(folder, name + extension), 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+    return [info_header % (fun, dim, algorithm), '%',
+            '%s.dat, %s' % (name, ', '.join(info))]
+
+
+def write_synthetic_data(folder, algorithms=2, functions=range(1, 25),
+                         dimensions=(2, 3, 5, 10, 20), instances=15,
+                         evaluations_per_dimension=1000, seed=1):
+    """write synthetic data into `folder` and return the folders of the
+    algorithms.
+
+    `algorithms` and `instances` are numbers, `functions` and
+    `dimensions` are sequences. The budget of each run is
+    ``evaluations_per_dimension * dimension``.
+    """
+    res = []
+    for i in range(1, algorithms + 1):
+        algorithm = 'SYN%d' % i
+        alg_folder = os.path.join(folder, algorithm)
+        for fun in functions:
+            if not os.path.exists(os.path.join(alg_folder, 'data_f%d' % fun)):
+                os.makedirs(os.path.join(alg_folder, 'data_f%d' % fun))
+            info = []
+            for dim in dimensions:
+                rand = np.random.RandomState([seed, i, fun, dim])
+                difficulty = dim * 10**rand.uniform(0.5, 2.5)  # evaluations per decade
+                info.extend(write_function_dimension(
+                    alg_folder, algorithm, fun, dim, list(range(1, instances + 1)),
+                    evaluations_per_dimension * dim, difficulty, rand))
+            with open(os.path.join(alg_folder, 'bbobexp_f%d_i1.info' % fun), 'w') as f:
+                f.write('\n'.join(info) + '\n')
+        res.append(alg_folder)
+    return res
@@ -0,0 +1,295 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Timed benchmarks of the hot paths of `cocopp` and their results.
+
+Each benchmark is a function of a `BenchmarkData` instance, which
+prepares everything which is not to be timed and returns the function
+to be timed. `benchmarks` lists the micro-benchmarks, which time a
+single function like `readalign.split` or `toolsstats.draw`, and the
+macro-benchmarks, which time a complete output module or a full
+`rungeneric.main` call, which is of kind ``'full'`` and not run by
+default.
+
+`run` returns the timings as a JSON serializable `dict`, which `save`
+writes to a file and `compare` compares with earlier results.
+"""
+
+from __future__ import absolute_import, division, print_function
+import os
+import sys
+import time
+import json
+import shutil
+import subprocess
+import platform
+import tempfile
+import warnings
+import numpy as np
+from .. import genericsettings, testbedsettings, config, pproc, readalign, toolsstats
+from .. import bestalg, toolsdivers
+from . import datagen
+
+results_format_version = 1
+
+sizes = {
+    'small': dict(algorithms=2, functions=(1, 2, 8, 15), dimensions=(2, 5, 20),
+                  instances=5, evaluations_per_dimension=1000),
+    'medium': dict(algorithms=3, functions=tuple(range(1, 25)), dimensions=(2, 3, 5, 10, 20),
+                   instances=15, evaluations_per_dimension=1000),
+    'large': dict(algorithms=10, functions=tuple(range(1, 25)), dimensions=(2, 3, 5, 10, 20, 40),
+                  instances=15, evaluations_per_dimension=10000),
+}
+"""arguments of `datagen.write_synthetic_data` for the data sizes"""
+
+
+class BenchmarkData(object):
+    """Synthetic data written to `folder` and loaded on demand.
+
+    Data sets are always read without the data set cache and with a
+    single process.
+    """
+    def __init__(self, folder, **data_arguments):
+        self.folder = folder
+        self.arguments = data_arguments
+        self.algorithms = datagen.write_synthetic_data(folder, **data_arguments)
+        self._dsList = None
+
+    @property
+    def dsList(self):
+        """`DataSetList` of all algorithms"""
+        if self._dsList is None:
+            self._dsList = pproc.DataSetList(self.algorithms, workers=1)
+            config.config(self._dsList[0].suite_name)
+        return self._dsList
+
+    def data_files(self, algorithm=0):
+        """return the :file:`dat` and :file:`tdat` files of an algorithm"""
+        res = []
+        for root, _dirs, files in os.walk(self.algorithms[algorithm]):
+            res.extend(os.path.join(root, f) for f in files
+                       if f.endswith('.dat') or f.endswith('.tdat'))
+        return sorted(res)
+
+
+def _targets():
+    return pproc.TargetValues(10**np.arange(2, -8.1, -0.2))
+
+
+def split(data):
+    """`readalign.split` of all data files of one algorithm"""
+    files = data.data_files()
+
+    def run():
+        for name in files:
+            readalign.split([name])
+    return run
+
+
+def dataset_init(data):
+    """`DataSet.__init__` of all data sets of one algorithm"""
+    return lambda: pproc.DataSetList(data.algorithms[0], workers=1)
+
+
+def det_evals(data):
+    """`DataSet.detEvals` for 51 targets of all data sets without the
+    results cache"""
+    dsList = data.dsList
+    targets = _targets()
+
+    def run():
+        for ds in dsList:
+            ds.clear_results_cache()
+            ds.detEvals(targets((ds.funcId, ds.dim)))
+    return run
+
+
+def best_alg_set(data):
+    """`bestalg.BestAlgSet` of all functions and dimensions"""
+    dict_algs = []
+    for _f, dictAlgF in sorted(pproc.dictAlgByFun(data.dsList.dictByAlg()).items()):
+        for _d, dictAlgFD in sorted(pproc.dictAlgByDim(dictAlgF).items()):
+            dict_algs.append(dict((str(alg[0]), dsl) for alg, dsl in dictAlgFD.items()))
+
+    def run():
+        for dict_alg in dict_algs:
+            bestalg.BestAlgSet(dict_alg)
+    return run
+
+
+def draw(data):
+    """`toolsstats.draw` of the ERT of 1000 bootstrap samples for the
+    targets 1e-1 and 1e-8 of all data sets"""
+    samples = []
+    for ds in data.dsList:
+        for evals in ds.detEvals([1e-1, 1e-8]):
+            succ = np.isfinite(evals)
+            samples.append((np.where(succ, evals, ds.maxevals), succ))
+
+    def run():
+        np.random.seed(1)
+        for values, succ in samples:
+            toolsstats.draw(values, [10, 50, 90], samplesize=1000,
+                            func=toolsstats.sp, args=[np.inf, succ])
+    return run
+
+
+def pprldmany_main(data):
+    """`compall.pprldmany.main` of all algorithms in each dimension"""
+    from ..compall import pprldmany
+    dictAlg = data.dsList.dictByAlg()
+    outputdir = tempfile.mkdtemp(prefix='_benchmark_pprldmany_', dir=data.folder)
+
+    def run():
+        for d, entries in sorted(pproc.dictAlgByDim(dictAlg).items()):
+            pprldmany.main(entries, order=list(dictAlg), outputdir=outputdir,
+                           info='%02dD_all' % d)
+    return run
+
+
+def rungeneric_main(data):
+    """`rungeneric.main` with all algorithms"""
+    from .. import rungeneric
+    outputdir = os.path.join(data.folder, '_benchmark_rungeneric')
+    settings = dict((key, getattr(genericsettings, key))
+                    for key in ('interactive_mode', 'dataset_cache_folder'))
+
+    def run():
+        genericsettings.interactive_mode = False
+        genericsettings.dataset_cache_folder = None
+        try:
+            rungeneric.main(['--no-svg', '-o', outputdir] + data.algorithms)
+        finally:
+            for key, value in settings.items():
+                setattr(genericsettings, key, value)
+    return run
+
+
+benchmarks = [('readalign.split', 'micro', split),
+              ('DataSet.__init__', 'micro', dataset_init),
+              ('DataSet.detEvals', 'micro', det_evals),
+              ('bestalg.BestAlgSet', 'micro', best_alg_set),
+              ('toolsstats.draw', 'micro', draw),
+              ('pprldmany.main', 'macro', pprldmany_main),
+              ('rungeneric.main', 'full', rungeneric_main)]
+"""(name, kind, function returning the timed function) of all benchmarks"""
+
+
+def timeit(function, repetitions):
+    """return the run times of `repetitions` calls of `function`"""
+    times = []
+    for _ in range(repetitions):
+        t0 = time.time()
+        function()
+        times.append(time.time() - t0)
+    return times
+
+
+def run(size='small', names=None, kinds=('micro', 'macro'), repetitions=3,
+        folder=None, verbose=True):
+    """run the benchmarks and return their results as `dict`.
+
+    `names` selects benchmarks by name, `kinds` by kind, where a name
+    overrules the kind. The data of
+    `size`, see `sizes`, are written to `folder` or to a temporary
+    folder which is removed afterwards. Only micro-benchmarks are
+    repeated.
+    """
+    temporary_folder = folder is None
+    if temporary_folder:
+        folder = tempfile.mkdtemp(prefix='_cocopp_benchmarks_')
+    settings = dict((key, getattr(genericsettings, key))
+                    for key in ('dataset_cache_folder', 'verbose'))
+    genericsettings.dataset_cache_folder = None
+    genericsettings.verbose = False
+    results = {}
+    try:
+        t0 = time.time()
+        data = BenchmarkData(folder, **sizes[size])
+        if verbose:
+            print('wrote %s data in %.1fs' % (size, time.time() - t0))
+        for name, kind, benchmark in benchmarks:
+            if (name not in names) if names else (kind not in kinds):
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                function = benchmark(data)
+                times = timeit(function, repetitions if kind == 'micro' else 1)
+            results[name] = {'kind': kind, 'times': times, 'min': min(times),
+                             'median': float(np.median(times))}
+            if verbose:
+                print('  %-20s %9.3fs' % (name, min(times)))
+    finally:
+        for key, value in settings.items():
+            setattr(genericsettings, key, value)
+        testbedsettings.reset_current_testbed()
+        if temporary_folder:
+            shutil.rmtree(folder, ignore_errors=True)
+    return {'format': results_format_version,
+            'size': size,
+            'data': dict((key, list(value) if isinstance(value, tuple) else value)
+                         for key, value in sizes[size].items()),
+            'repetitions': repetitions,
+            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'cocopp': _version(),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.node(),
+            'benchmarks': results}
+
+
+def _version():
+    """return the git revision of the source tree or the `cocopp` version"""
+    try:
+        return subprocess.check_output(
+            ['git', 'describe', '--always', '--dirty'], stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            universal_newlines=True).strip()
+    except Exception:
+        try:
+            return toolsdivers.get_version_label(None)
+        except Exception:
+            return None
+
+
+def save(results, filename):
+    """write `results` of `run` as JSON to `filename`"""
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=1, sort_keys=True)
+
+
+def load(filename):
+    """return the results saved with `save`"""
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def compare(results_list, labels=None):
+    """return a table of the minimal times of `results_list` and their
+    ratio to the times of the first results.
+
+    `results_list` are results of `run` or file names of saved results.
+    """
+    results_list = [load(r) if not isinstance(r, dict) else r for r in results_list]
+    if labels is None:
+        labels = [r.get('cocopp') or str(i) for i, r in enumerate(results_list)]
+    names = [name for name, _, _ in benchmarks
+             if any(name in r['benchmarks'] for r in results_list)]
+    lines = ['%-20s' % 'benchmark' + ''.join(' %18s' % str(label)[:18] for label in labels)]
+    for name in names:
+        line = '%-20s' % name
+        reference = results_list[0]['benchmarks'].get(name, {}).get('min')
+        for r in results_list:
+            t = r['benchmarks'].get(name, {}).get('min')
+            if t is None:
+                line += ' %18s' % '-'
+            elif reference and r is not results_list[0]:
+                line += ' %10.3fs %5.2fx' % (t, t / reference)
+            else:
+                line += ' %17.3fs' % t
+        lines.append(line)
+    if len(set(r['size'] for r in results_list)) > 1:
+        lines.append('(results of different data sizes %s)'
+                     % ', '.join(r['size'] for r in results_list))
+    return '\n'.join(lines)
@@ -22,8 +22,11 @@ from __future__ import print_function
 
 import os
 import sys
+import json
+import shutil
 import pickle
 import gzip
+import hashlib
 import warnings
 import numpy as np
 import tarfile
@@ -33,7 +36,7 @@ from six import advance_iterator
 from . import readalign, pproc
 from .toolsdivers import print_done
 from .ppfig import Usage
-from . import toolsstats, toolsdivers, testbedsettings, genericsettings
+from . import toolsstats, toolsdivers, testbedsettings, genericsettings, findfiles
 from .pproc import DataSet
 
 bestAlgorithmEntries = {}
@@ -91,7 +94,12 @@ class BestAlgSet(DataSet):
     Known bug: algorithms where the ERT is NaN or Inf are not taken into
     account!?
 
+    The best algorithm and its evals row are determined for all targets
+    at once. A subclass with ``_vectorized = False`` uses the former row
+    by row computation, see :file:`helper-scripts/benchmark_bestalg.py`.
+
     """
+    _vectorized = True
 
     def __init__(self, dict_alg, algId='Virtual Best Algorithm'):
         """Instantiate one best algorithm data set with name algId.
@@ -151,61 +159,19 @@ class BestAlgSet(DataSet):
         # Align ERT
         erts = list(np.transpose(np.vstack([dict_alg[i].target, dict_alg[i].ert]))
                     for i in sortedAlgs)
-        res = readalign.alignArrayData(readalign.HArrayMultiReader(erts))
-
-        resalgs = []
-        reserts = []
-        instance_numbers = []
-        # For each function value
-        for i in res:
-            # Find best algorithm
-            curerts = i[1:]
-            assert len((np.isnan(curerts) == False)) > 0
-            currentbestert = np.inf
-            currentbestalg = ''
-            for j, tmpert in enumerate(curerts):
-                if np.isnan(tmpert):
-                    continue  # TODO: don't disregard these entries
-                if tmpert == currentbestert:
-                    # TODO: what do we do in case of ties?
-                    # look at function values corresponding to the ERT?
-                    # Look at the function evaluations? the success ratio?
-                    pass
-                elif tmpert < currentbestert:
-                    currentbestert = tmpert
-                    currentbestalg = sortedAlgs[j]
-            reserts.append(currentbestert)
-            resalgs.append(currentbestalg)
-            sorted_instance_numbers = list(set(dict_alg[currentbestalg].instancenumbers))
-            sorted_instance_numbers.sort()
-            instance_numbers.append(sorted_instance_numbers)
-
-        dictiter = {}
-        dictcurLine = {}
-        resDataSet = []
-
-        # write down the #fevals to reach the function value.
-        for funval, alg in zip(res[:, 0], resalgs):
-            it = dictiter.setdefault(alg, iter(dict_alg[alg].evals))  # TODO: do we want evals_appended here?
-            curLine = dictcurLine.setdefault(alg, np.array([np.inf, 0]))
-            while curLine[0] > funval:
-                try:
-                    curLine = advance_iterator(it)
-                except StopIteration:
-                    break
-            dictcurLine[alg] = curLine.copy()
-            tmp = curLine.copy()
-            tmp[0] = funval
-            resDataSet.append(tmp)
+        reader = readalign.HArrayMultiReader(erts)
+        if self._vectorized:
+            res = readalign.alignArrayData(reader)
+            resalgs, reserts, instance_numbers, resDataSet = _best_algorithm_rows(
+                res, sortedAlgs, dict_alg)
+        else:
+            res = readalign._align_array_data_stepwise(reader)
+            resalgs, reserts, instance_numbers, resDataSet = _best_algorithm_rows_stepwise(
+                res, sortedAlgs, dict_alg)
 
         setalgs = set(resalgs)
-        dictFunValsNoFail = {}
-        for alg in setalgs:
-            for curline in dict_alg[alg].funvals:
-                if (curline[1:] == dict_alg[alg].finalfunvals).any():
-                    # only works because the funvals are monotonous
-                    break
-            dictFunValsNoFail[alg] = curline.copy()
+        dictFunValsNoFail = dict((alg, _funvals_no_fail(dict_alg[alg]))
+                                 for alg in setalgs)
 
         self._evals = resDataSet
         # evals is not a np array but a list of arrays because they may not
@@ -370,6 +336,100 @@ class BestAlgSet(DataSet):
 
 
 # FUNCTION DEFINITIONS
+def _best_algorithm_rows_stepwise(res, sortedAlgs, dict_alg):
+    """return the same as `_best_algorithm_rows` computed row by row"""
+    resalgs = []
+    reserts = []
+    instance_numbers = []
+    # For each function value
+    for i in res:
+        # Find best algorithm
+        curerts = i[1:]
+        assert len((np.isnan(curerts) == False)) > 0
+        currentbestert = np.inf
+        currentbestalg = ''
+        for j, tmpert in enumerate(curerts):
+            if np.isnan(tmpert):
+                continue  # TODO: don't disregard these entries
+            if tmpert == currentbestert:
+                # TODO: what do we do in case of ties?
+                # look at function values corresponding to the ERT?
+                # Look at the function evaluations? the success ratio?
+                pass
+            elif tmpert < currentbestert:
+                currentbestert = tmpert
+                currentbestalg = sortedAlgs[j]
+        reserts.append(currentbestert)
+        resalgs.append(currentbestalg)
+        sorted_instance_numbers = list(set(dict_alg[currentbestalg].instancenumbers))
+        sorted_instance_numbers.sort()
+        instance_numbers.append(sorted_instance_numbers)
+
+    dictiter = {}
+    dictcurLine = {}
+    resDataSet = []
+
+    # write down the #fevals to reach the function value.
+    for funval, alg in zip(res[:, 0], resalgs):
+        it = dictiter.setdefault(alg, iter(dict_alg[alg].evals))  # TODO: do we want evals_appended here?
+        curLine = dictcurLine.setdefault(alg, np.array([np.inf, 0]))
+        while curLine[0] > funval:
+            try:
+                curLine = advance_iterator(it)
+            except StopIteration:
+                break
+        dictcurLine[alg] = curLine.copy()
+        tmp = curLine.copy()
+        tmp[0] = funval
+        resDataSet.append(tmp)
+    return resalgs, reserts, instance_numbers, resDataSet
+
+
+def _best_algorithm_rows(res, sortedAlgs, dict_alg):
+    """return best algorithm names, their ERTs, sorted instance numbers
+    and evals rows for each row of the aligned ERTs `res`.
+
+    The best algorithm of a row is the first one with the smallest ERT,
+    `nan` ERTs are disregarded. Its evals row is the first row which
+    reaches the target in the first column of `res`, or its last row,
+    with the target as first entry.
+    """
+    erts = res[:, 1:]
+    erts = np.where(np.isnan(erts), np.inf, erts)  # TODO: don't disregard nan entries
+    best = np.argmin(erts, axis=1)
+    reserts = erts[np.arange(len(erts)), best]
+    # like in _best_algorithm_rows_stepwise, an infinite ERT has no algorithm
+    resalgs = [sortedAlgs[j] if ert < np.inf else ''
+               for j, ert in zip(best, reserts)]
+    sorted_instance_numbers = {}
+    instance_numbers = []
+    for alg in resalgs:
+        if alg not in sorted_instance_numbers:
+            sorted_instance_numbers[alg] = sorted(set(dict_alg[alg].instancenumbers))
+        instance_numbers.append(list(sorted_instance_numbers[alg]))
+
+    resDataSet = [None] * len(res)
+    for alg in set(resalgs):  # TODO: do we want evals_appended here?
+        rows = [i for i, a in enumerate(resalgs) if a == alg]
+        evals = dict_alg[alg].evals
+        targets = res[rows, 0]
+        # evals are sorted by decreasing function values
+        first = len(evals) - np.searchsorted(evals[::-1, 0], targets, side='right')
+        for i, target, k in zip(rows, targets, np.minimum(first, len(evals) - 1)):
+            resDataSet[i] = evals[k].copy()
+            resDataSet[i][0] = target
+    return resalgs, list(reserts), instance_numbers, resDataSet
+
+
+def _funvals_no_fail(ds):
+    """return the first `funvals` row of `DataSet` `ds` which contains a
+    final function value, or the last row"""
+    funvals = ds.funvals
+    # only works because the funvals are monotonous
+    found = (funvals[:, 1:] == ds.finalfunvals).any(axis=1)
+    return funvals[np.argmax(found) if found.any() else -1].copy()
+
+
 def reset_reference_algorithm():
     global bestAlgorithmEntries
     bestAlgorithmEntries = {}
@@ -501,7 +561,8 @@ def deprecated_customgenerate(args=algs2009):
     print('done with writing pickle...')
 
 
-def custom_generate(args=algs2009, algId='bestCustomAlg', suite=None):
+def custom_generate(args=algs2009, algId='bestCustomAlg', suite=None,
+                    workers=None, resume=False):
     """Generates best algorithm data set from a given set of algorithms.
 
     It will create a folder named as algId in the current working directory
@@ -509,6 +570,14 @@ def custom_generate(args=algs2009, algId='bestCustomAlg', suite=None):
     variable args. This folder is furthermore added to a `.tar.gz` file
     of the same name.
 
+    With ``workers > 1``, by default `genericsettings.number_of_jobs`,
+    or with `resume`, the best algorithm data set of each function and
+    dimension is computed in a pool of `workers` processes and its data
+    files are written right away, see `generate_data_files`. With
+    `resume`, functions and dimensions, whose files were written by an
+    earlier interrupted call with the same algorithms, are skipped. The
+    written files are the same in all cases.
+
     This method is called from the python command line from a directory
     containing all necessary data folders::
 
@@ -524,6 +593,8 @@ def custom_generate(args=algs2009, algId='bestCustomAlg', suite=None):
     """
 
     output_dir = algId
+    if workers is None:
+        workers = genericsettings.number_of_jobs
 
     # genericsettings.verbose = True
     testbedsettings.reset_reference_values()
@@ -534,9 +605,11 @@ def custom_generate(args=algs2009, algId='bestCustomAlg', suite=None):
         if genericsettings.verbose:
             print('Folder %s was created.' % output_dir)
 
-    result = generate(dictAlg, algId)
-
-    create_data_files(output_dir, result, suite)
+    if workers > 1 or resume:
+        generate_data_files(output_dir, dictAlg, algId, suite, workers, resume)
+    else:
+        result = generate(dictAlg, algId)
+        create_data_files(output_dir, result, suite)
 
     tar = tarfile.open(output_dir + ".tar.gz", "w:gz")
     tar.add(output_dir)
@@ -554,66 +627,98 @@ def create_data_files(output_dir, result, suite):
 
     print('create_data_files: %s ' % suite)
 
+    records = [write_data_files(output_dir, key, value, suite)
+               for key, value in sorted(result.items())]
+    write_info_file(output_dir, records, suite,
+                    result[list(result.keys())[0]].suite_name)
+
+
+def _filename_template(suite):
+    """return the template of the data file names of `suite`"""
+    return '%s-bestalg' % suite + '_f%02d_d%02d.%s'
 
-    info_filename = '%s-bestalg' % suite
-    filename_template = info_filename + '_f%02d_d%02d.%s'
+
+def write_data_files(output_dir, key, value, suite):
+    """write the data files of the best algorithm data set `value` of
+    ``key == (dimension, function)`` and return a `dict` with its entries
+    of the info file, see `write_info_file`.
+    """
+    filename_template = _filename_template(suite)
+
+    # TODO: throw an error
+    # if not len(value.target) == len(value.ert):
+
+    dict_evaluation = {}
+    for index in range(len(value.target)):
+        evaluation_value = value.ert[index]
+        target = value.target[index]
+        dict_evaluation[np.round(evaluation_value)] = target
+
+    lines = list()
+    lines.append("% Artificial instance")
+    lines.append("% algorithm type = best")
+    target_list = value.target.tolist()
+    instances_used = []
+    for key_target, value_target in sorted(dict_evaluation.items()):
+        successful_runs, all_runs = value.get_success_ratio(value_target)
+        target_index = target_list.index(value_target)
+        alg_for_target = os.path.basename(value.algs[target_index])
+        instances_used.append(value.instances[target_index])
+        lines.append("%d %10.15e %10.15e %s %d %d" %
+                     (key_target, value_target, value_target, alg_for_target, successful_runs, all_runs))
+        last_evaluation = key_target
+        last_value = value_target
+
+    instance_data = "%d:%d|%10.15e" % (0, last_evaluation, last_value)
+    instances_list = get_used_instance_list(instances_used)
+
+    algorithm_id = value.algId
+    info_lines = []
+    if suite in ['bbob-biobj', 'bbob-biobj-ext', testbedsettings.default_suite_bi]:
+        info_lines.append("function = %d, dim = %d, %s, %s"
+                          % (key[1], key[0], filename_template % (key[1], key[0], 'dat'), instance_data))
+    else:
+        header = "funcId = %d, DIM = %d, Precision = %10.15e, algId = '%s'" \
+                 % (key[1], key[0], value.precision, algorithm_id)
+        if suite is not None:
+            header += ", suite = '%s'" % suite
+        info_lines.append(header)
+        info_lines.append("%% %s; instance_numbers: %s" % (value.comment, instances_list))
+        info_lines.append("%s, %s" % (filename_template % (key[1], key[0], 'dat'), instance_data))
+
+    filename = os.path.join(output_dir, filename_template % (key[1], key[0], 'dat'))
+    write_to_file(filename, lines)
+    filename = os.path.join(output_dir, filename_template % (key[1], key[0], 'tdat'))
+    write_to_file(filename, lines)
+
+    return {'key': list(key),
+            'info_lines': info_lines,
+            'instances_used': instances_used,
+            'used_algorithms': list(value.used_algorithms),
+            'algId': algorithm_id,
+            'comment': value.comment,
+            'suite_name': value.suite_name}
+
+
+def write_info_file(output_dir, records, suite, suite_name):
+    """write the info file from the `records` of `write_data_files`
+    sorted by dimension and function.
+
+    `suite_name` is the suite of the data, which may differ from the
+    `suite` written into the files.
+    """
     info_lines = []
     all_instances_used = []
     algorithms_used = []
-    for key, value in sorted(result.items()):
-
-        # TODO: throw an error
-        # if not len(value.target) == len(value.ert):
-
-        dict_evaluation = {}
-        for index in range(len(value.target)):
-            evaluation_value = value.ert[index]
-            target = value.target[index]
-            dict_evaluation[np.round(evaluation_value)] = target
-
-        lines = list()
-        lines.append("% Artificial instance")
-        lines.append("% algorithm type = best")
-        target_list = value.target.tolist()
-        instances_used = []
-        for key_target, value_target in sorted(dict_evaluation.items()):
-            successful_runs, all_runs = result[(key[0], key[1])].get_success_ratio(value_target)
-            target_index = target_list.index(value_target)
-            alg_for_target = os.path.basename(value.algs[target_index])
-            instances_used.append(value.instances[target_index])
-            lines.append("%d %10.15e %10.15e %s %d %d" %
-                         (key_target, value_target, value_target, alg_for_target, successful_runs, all_runs))
-            last_evaluation = key_target
-            last_value = value_target
-
-        instance_data = "%d:%d|%10.15e" % (0, last_evaluation, last_value)
-        all_instances_used.extend(instances_used)
-        instances_list = get_used_instance_list(instances_used)
-
-        algorithm_id = value.algId
-        if suite in ['bbob-biobj', 'bbob-biobj-ext', testbedsettings.default_suite_bi]:
-            info_lines.append("function = %d, dim = %d, %s, %s"
-                              % (key[1], key[0], filename_template % (key[1], key[0], 'dat'), instance_data))
-        else:
-            header = "funcId = %d, DIM = %d, Precision = %10.15e, algId = '%s'" \
-                     % (key[1], key[0], value.precision, algorithm_id)
-            if suite is not None:
-                header += ", suite = '%s'" % suite
-            info_lines.append(header)
-            info_lines.append("%% %s; instance_numbers: %s" % (value.comment, instances_list))
-            info_lines.append("%s, %s" % (filename_template % (key[1], key[0], 'dat'), instance_data))
-
-        filename = os.path.join(output_dir, filename_template % (key[1], key[0], 'dat'))
-        write_to_file(filename, lines)
-        filename = os.path.join(output_dir, filename_template % (key[1], key[0], 'tdat'))
-        write_to_file(filename, lines)
-
-        for algorithm in value.used_algorithms:
+    for record in records:
+        info_lines.extend(record['info_lines'])
+        all_instances_used.extend(record['instances_used'])
+        for algorithm in record['used_algorithms']:
             if algorithm not in algorithms_used:
                 algorithms_used.append(algorithm)
 
-    if result[list(result.keys())[0]].suite_name == testbedsettings.default_testbed_bi:
-        header = "algorithm = '%s', indicator = 'hyp'" % algorithm_id
+    if suite_name == testbedsettings.default_testbed_bi:
+        header = "algorithm = '%s', indicator = 'hyp'" % records[-1]['algId']
         if suite is not None:
             header += ", suite = '%s'" % suite
         reference_values = testbedsettings.get_first_reference_values()
@@ -625,15 +730,125 @@ def create_data_files(output_dir, result, suite):
         if len(algorithms_used) > 1:
             comment = 'Combination of ' + ', '.join(algorithms_used)
         else:
-            comment = value.comment
+            comment = records[-1]['comment']
         comment += '; coco_version: ' + pkg_resources.require('cocopp')[0].version
 
         info_lines.insert(1, "%% %s; instance_numbers: %s" % (comment, instances_list))
 
-    filename = os.path.join(output_dir, '%s.info' % info_filename)
+    filename = os.path.join(output_dir, '%s-bestalg.info' % suite)
     write_to_file(filename, info_lines)
 
 
+slice_records_folder = '.slices'
+"""folder in the output folder of `generate_data_files` with a record
+   file for each function and dimension whose data files were written"""
+
+
+def _slice_record_filename(output_dir, key):
+    return os.path.join(output_dir, slice_records_folder, 'f%03d_d%03d.json' % (key[1], key[0]))
+
+
+def _slice_inputs(dict_alg, algId, suite):
+    """return a hash of the data sets in `dict_alg`, `algId` and `suite`"""
+    h = hashlib.sha1(repr((algId, suite)).encode('utf-8'))
+    for alg in sorted(dict_alg):
+        h.update(repr(alg).encode('utf-8'))
+        for ds in dict_alg[alg]:
+            h.update(repr((ds.algId, ds.comment, ds.indexFiles, ds.dataFiles,
+                           ds.instancenumbers)).encode('utf-8'))
+            h.update(np.ascontiguousarray(ds._evals).tobytes())
+    return h.hexdigest()
+
+
+def _load_slice_record(output_dir, key, inputs, suite):
+    """return the record of the data files of `key` written with the same
+    `inputs` or `None`"""
+    try:
+        with open(_slice_record_filename(output_dir, key), 'r') as f:
+            record = json.load(f)
+    except (IOError, ValueError):
+        return None
+    filename_template = _filename_template(suite)
+    if record.get('inputs') != inputs or not all(
+            os.path.exists(os.path.join(output_dir, filename_template % (key[1], key[0], ext)))
+            for ext in ('dat', 'tdat')):
+        return None
+    return record
+
+
+def _generate_slice(job):
+    """compute the `BestAlgSet` of ``job == (output_dir, key, dict_alg,
+    algId, suite, inputs)``, write its data files and its record file and
+    return the record"""
+    output_dir, key, dict_alg, algId, suite, inputs = job
+    record = write_data_files(output_dir, key, BestAlgSet(dict_alg, algId), suite)
+    record['inputs'] = inputs
+    filename = _slice_record_filename(output_dir, key)
+    with open(filename + '.tmp', 'w') as f:
+        json.dump(record, f, default=int)  # numpy integers
+    os.rename(filename + '.tmp', filename)  # the record is complete or missing
+    return record
+
+
+def generate_data_files(output_dir, dict_alg, algId, suite=None, workers=1, resume=False):
+    """write the data files of the best algorithm data sets of all
+    functions and dimensions of `dict_alg` into `output_dir` with
+    `workers` parallel processes.
+
+    The data files of each function and dimension are written as soon as
+    they are computed and recorded in the `slice_records_folder`. With
+    `resume`, recorded functions and dimensions with the same data are
+    not computed again. The info file is written when all data files
+    are written and the records are removed. The files are the same as
+    with `generate` and `create_data_files`.
+    """
+    slices = [((d, f), j) for f, i in pproc.dictAlgByFun(dict_alg).items()
+              for d, j in pproc.dictAlgByDim(i).items()]
+    records_folder = os.path.join(output_dir, slice_records_folder)
+    if not resume and os.path.exists(records_folder):
+        shutil.rmtree(records_folder)
+    if not os.path.exists(records_folder):
+        os.makedirs(records_folder)
+
+    if not suite:
+        suite = BestAlgSet(slices[0][1], algId).suite_name
+    print('create_data_files: %s ' % suite)
+
+    records = {}
+    jobs = []
+    for key, j in slices:
+        inputs = _slice_inputs(j, algId, suite)
+        record = _load_slice_record(output_dir, key, inputs, suite) if resume else None
+        if record is not None:
+            records[key] = record
+        else:
+            jobs.append((output_dir, key, j, algId, suite, inputs))
+    if resume:
+        print('  %d of %d functions and dimensions were already written'
+              % (len(records), len(slices)))
+
+    if workers > 1 and len(jobs) > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(min((workers, len(jobs))),
+                                    pproc._init_reading_process,
+                                    (pproc._picklable_settings(),
+                                     testbedsettings.current_testbed,
+                                     findfiles._archive_indices))
+        try:
+            for record in pool.imap_unordered(_generate_slice, jobs):
+                records[tuple(record['key'])] = record
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for job in jobs:
+            records[job[1]] = _generate_slice(job)
+
+    write_info_file(output_dir, [records[key] for key in sorted(records)], suite,
+                    records[slices[0][0]]['suite_name'])
+    shutil.rmtree(records_folder)
+
+
 def write_to_file(filename, lines):
     fid = open(filename, 'w')
     for line in lines:
@@ -0,0 +1,264 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Incremental post-processing with a build manifest.
+
+A `Build` records for each post-processing step, like the scaling
+figures of a single algorithm, a hash of the step inputs and the
+content hashes of the files written by the step. The inputs are the
+data sets, the settings in `genericsettings` and of the current testbed,
+and the `cocopp` version. If `genericsettings.incremental` is set (with
+the ``--incremental`` option), a step is skipped when its inputs and its
+output files did not change since the last run::
+
+    build = Build(outputdir, dsList, algfolder)
+    if build.start('ppfigdim'):
+        ppfigdim.main(dsList, values_of_interest, algoutputdir)
+        build.done('ppfigdim')
+
+The lines a step prepends to the LaTeX commands file are recorded too
+and prepended again when the step is skipped.
+
+The manifest is saved as JSON file `manifest_file_name` in the output
+folder. Data of background algorithms are only represented by their
+file names in the settings.
+"""
+
+from __future__ import absolute_import, division, print_function
+import os
+import json
+import hashlib
+import inspect
+import numpy as np
+from . import genericsettings, testbedsettings, toolsdivers, ppfig, profiling
+
+manifest_file_name = '.cocopp-manifest.json'
+manifest_format_version = 1
+ignored_settings = ('verbose', 'interactive_mode', 'number_of_jobs',
+                    'dataset_cache_folder', 'dataset_cache_max_size',
+                    'dataset_results_cache_size',
+                    'incremental', 'profile', 'default_settings')
+"""names of settings which do not change the output"""
+
+
+def _file_hash(filename):
+    """return sha1 hex digest of the content of `filename` or `None`"""
+    h = hashlib.sha1()
+    try:
+        with open(filename, 'rb') as f:
+            for block in iter(lambda: f.read(2**20), b''):
+                h.update(block)
+    except (IOError, OSError):
+        return None
+    return h.hexdigest()
+
+
+def dataset_hash(ds):
+    """return a hash of the data and header attributes of `DataSet` `ds`.
+
+    Function values, `funvals`, are represented by their file names.
+    """
+    h = hashlib.sha1()
+    for name in ('algId', 'comment', 'funcId', 'dim', 'precision',
+                 'suite_name', 'instancenumbers', 'indexFiles', 'dataFiles',
+                 '_funvals_sources'):
+        h.update(('%s=%r\n' % (name, getattr(ds, name, None))).encode('utf-8'))
+    for name in ('_evals', '_maxevals', 'finalfunvals'):
+        value = getattr(ds, name, None)
+        h.update(name.encode('utf-8'))
+        if isinstance(value, np.ndarray):
+            h.update(str(value.shape).encode('utf-8'))
+            h.update(np.ascontiguousarray(value).tobytes())
+        else:
+            h.update(repr(value).encode('utf-8'))
+    return h.hexdigest()
+
+
+def settings_hash():
+    """return a hash of `genericsettings` and the current testbed settings.
+
+    Settings in `ignored_settings` and values without a reproducible
+    representation are ignored.
+    """
+    h = hashlib.sha1()
+    for settings in (genericsettings, testbedsettings.current_testbed):
+        for name, value in sorted(vars(settings).items()):
+            if (name.startswith('__') or name in ignored_settings or
+                    inspect.ismodule(value) or callable(value)):
+                continue
+            value = repr(value.tolist() if isinstance(value, np.ndarray) else value)
+            if ' at 0x' not in value:  # an object address changes in each run
+                h.update(('%s=%s\n' % (name, value)).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _output_files(folder):
+    """return a `dict` of the files in `folder` with their modification
+    time and size, except for the manifest, the LaTeX commands file and
+    the index pages.
+
+    The index pages link the present files and are rewritten also
+    outside of the steps, see `ppfig.save_folder_index_file`.
+    """
+    index_pages = ['%s.html' % name for name in (genericsettings.index_html_file_name,
+                                                 genericsettings.single_algorithm_file_name,
+                                                 genericsettings.many_algorithm_file_name)]
+    res = {}
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            path = os.path.join(root, name)
+            filename = os.path.relpath(path, folder)
+            if filename in (manifest_file_name, 'cocopp_commands.tex') or name in index_pages:
+                continue
+            stat = os.stat(path)
+            res[filename] = (stat.st_mtime, stat.st_size)
+    return res
+
+
+def _read_lines(filename):
+    try:
+        with open(filename, 'r') as f:
+            return [line.rstrip('\n') for line in f]
+    except IOError:
+        return []
+
+
+class Build(object):
+    """Skip post-processing steps of `datasets` with unchanged inputs and
+    outputs in `outputdir`.
+
+    `name` identifies the build in the manifest, like the output sub
+    folder of the algorithm(s). Without `genericsettings.incremental`,
+    `start` always returns `True` and nothing is recorded.
+    """
+    def __init__(self, outputdir, datasets, name):
+        self.outputdir = outputdir
+        self.name = name
+        self.enabled = genericsettings.incremental
+        self.latex_commands_file = os.path.join(outputdir, 'cocopp_commands.tex')
+        self._snapshot = None
+        self._steps_of_this_run = []
+        self._skipped_steps = []
+        if not self.enabled:
+            return
+        self.manifest = self.load()
+        datasets_hashes = [[repr(ds), dataset_hash(ds)] for ds in datasets]
+        build = {'version': toolsdivers.get_version_label(None),
+                 'settings': settings_hash(),
+                 'datasets': datasets_hashes}
+        self.inputs = hashlib.sha1(json.dumps(build, sort_keys=True).encode('utf-8')).hexdigest()
+        previous = self.manifest['builds'].get(name, {})
+        build['steps'] = previous.get('steps', {}) if previous.get('inputs') == self.inputs else {}
+        build['inputs'] = self.inputs
+        self.manifest['builds'][name] = build
+        self.save()
+
+    @property
+    def filename(self):
+        return os.path.join(self.outputdir, manifest_file_name)
+
+    def load(self):
+        """return the manifest `dict` from `filename` or a new one"""
+        try:
+            with open(self.filename, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('format') == manifest_format_version:
+                return manifest
+        except (IOError, ValueError):
+            pass
+        return {'format': manifest_format_version, 'builds': {}}
+
+    def save(self):
+        if not os.path.exists(self.outputdir):
+            os.makedirs(self.outputdir)
+        with open(self.filename, 'w') as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+
+    @property
+    def steps(self):
+        return self.manifest['builds'][self.name]['steps']
+
+    def is_up_to_date(self, step):
+        """return `True` if `step` was recorded with the current inputs
+        and all its output files are unchanged.
+
+        A step is also outdated if a later step, which changed some of
+        its output files, is outdated.
+        """
+        if not self.enabled or step not in self.steps:
+            return False
+        entry = self.steps[step]
+        return all(_file_hash(os.path.join(self.outputdir, filename)) == h
+                   for filename, h in entry['outputs'].items()) and all(
+                       self.is_up_to_date(later_step) for later_step in entry['later_steps'])
+
+    def start(self, step):
+        """return `False` if `step` is up to date and can be skipped,
+        otherwise prepare the recording of the `step` outputs and return
+        `True`.
+        """
+        if not self.enabled:
+            profiling.start(step)
+            return True
+        self._steps_of_this_run.append(step)
+        if self.is_up_to_date(step):
+            lines = self.steps[step]['latex_commands']
+            if lines:
+                toolsdivers.prepend_to_file(self.latex_commands_file, lines)
+            print("  %s: output is up to date" % step)
+            self._skipped_steps.append(step)
+            return False
+        if self.steps.pop(step, None) is not None:
+            self.save()
+        ppfig.flush_figures()  # written by earlier steps
+        self._snapshot = (step, _output_files(self.outputdir),
+                          _read_lines(self.latex_commands_file))
+        profiling.start(step)
+        return True
+
+    def cancel(self, step):
+        """finish `step` like `done` without recording it, such that it
+        is run again the next time"""
+        profiling.stop(step)
+        if self.enabled:
+            self._snapshot = None
+
+    def done(self, step):
+        """record the files written and the LaTeX commands prepended by
+        `step` since `start` was called.
+
+        The step is not recorded, if the lines prepended to the LaTeX
+        commands file cannot be determined.
+        """
+        profiling.stop(step)
+        if not self.enabled:
+            return
+        ppfig.flush_figures()
+        previous_step, files, lines = self._snapshot
+        assert previous_step == step, (previous_step, step)
+        self._snapshot = None
+        new_lines = _read_lines(self.latex_commands_file)
+        n = len(new_lines) - len(lines)
+        if n < 0 or new_lines[n:] != lines:
+            return
+        new_files = _output_files(self.outputdir)
+        outputs = dict((filename, _file_hash(os.path.join(self.outputdir, filename)))
+                       for filename in new_files
+                       if files.get(filename) != new_files[filename])
+        for earlier_step in self._steps_of_this_run[:-1]:  # with changed output files
+            entry = self.steps.get(earlier_step, {'outputs': {}})
+            changed = set(entry['outputs']).intersection(outputs)
+            if changed:
+                entry['outputs'].update((filename, outputs[filename]) for filename in changed)
+                if step not in entry['later_steps']:
+                    entry['later_steps'].append(step)
+        self.steps[step] = {'outputs': outputs,
+                            'latex_commands': new_lines[:n],
+                            'later_steps': []}
+        self.save()
+
+    def update_index_page(self, filename):
+        """write the links to the present output files into the index page
+        `filename`, like the steps do, if a step was skipped"""
+        if self._skipped_steps:
+            ppfig.save_folder_index_file(filename, 'svg')
@@ -125,7 +125,7 @@ def info(dsList):
     """Display more info on an instance of DatasetList."""
     dsList.info()
 
-# pproc.get_DataSetList writes and loads the pickled class
+# pproc.DataSetList writes and loads cached data per index file
 def _pickle(dsList):
     """Pickle a DataSetList."""
     dsList.pickle()
@@ -41,6 +41,7 @@ from .. import toolsdivers  # strip_pathname, str_to_latex
 from .. import pprldistr  # plotECDF, beautifyECDF
 from .. import ppfig  # consecutiveNumbers, save_figure, plotUnifLogXMarkers, logxticks
 from .. import pptex  # numtotex
+from .. import figurejobs
 
 PlotType = ppfig.enum('ALG', 'DIM', 'FUNC')
 
@@ -196,10 +197,75 @@ def beautify():
 
 
 
+class RunlengthSamples(object):
+    """Accumulate run length samples for an empirical cumulative
+    distribution function.
+
+    Finite samples are stored as distinct values with their number of
+    appearances in preallocated arrays, which grow by doubling; infinite
+    and `nan` samples are only counted. The values of all `extend` calls
+    are merged and sorted once in `distribution`:
+
+    >>> import numpy as np
+    >>> from cocopp.compall.pprldmany import RunlengthSamples
+    >>> samples = RunlengthSamples()
+    >>> samples.extend([3., 1., np.inf, 3.])
+    >>> samples.extend([1., np.nan])
+    >>> len(samples), samples.number_of_infinite, samples.number_of_nan
+    (6, 1, 1)
+    >>> values, counts = samples.distribution()
+    >>> list(values), list(counts)
+    ([1.0, 3.0], [2, 2])
+
+    """
+    def __init__(self, capacity=256):
+        self._values = np.zeros(capacity)
+        self._counts = np.zeros(capacity, dtype=int)
+        self._size = 0
+        self._is_sorted = True
+        self.number_of_infinite = 0
+        self.number_of_nan = 0
+
+    def __len__(self):
+        return int(np.sum(self._counts[:self._size])) + self.number_of_infinite + self.number_of_nan
+
+    def extend(self, x):
+        """append the samples in `x`"""
+        x = np.asarray(x, dtype=float)
+        isnan = np.isnan(x)
+        self.number_of_nan += int(np.sum(isnan))
+        x = x[~isnan]
+        isinf = np.isinf(x)
+        self.number_of_infinite += int(np.sum(isinf))
+        values, counts = np.unique(x[~isinf], return_counts=True)
+        if self._size + len(values) > len(self._values):
+            capacity = max((2 * len(self._values), self._size + len(values)))
+            self._values = np.hstack((self._values[:self._size], np.zeros(capacity - self._size)))
+            self._counts = np.hstack((self._counts[:self._size],
+                                      np.zeros(capacity - self._size, dtype=int)))
+        self._values[self._size:self._size + len(values)] = values
+        self._counts[self._size:self._size + len(values)] = counts
+        self._size += len(values)
+        self._is_sorted = self._size == len(values)  # values of a single call are sorted
+
+    def distribution(self):
+        """return the sorted distinct finite samples and their number of
+        appearances"""
+        if not self._is_sorted:
+            values, idx = np.unique(self._values[:self._size], return_inverse=True)
+            counts = np.bincount(idx.ravel(), weights=self._counts[:self._size]).astype(int)
+            self._size = len(values)
+            self._values[:self._size] = values
+            self._counts[:self._size] = counts
+            self._is_sorted = True
+        return self._values[:self._size], self._counts[:self._size]
+
+
 def plotdata(data, maxval=None, maxevals=None, CrE=0., **kwargs):
     """Draw a normalized ECDF. What means normalized?
     
-    :param seq data: data set, a 1-D ndarray of runlengths
+    :param seq data: data set, a 1-D ndarray of runlengths or
+                     `RunlengthSamples`
     :param float maxval: right-most value to be displayed, will use the
                          largest non-inf, non-nan value in data if not
                          provided
@@ -210,26 +276,24 @@ def plotdata(data, maxval=None, maxevals=None, CrE=0., **kwargs):
     :param kwargs: optional arguments provided to plot function.
     
     """
-    # Expect data to be a ndarray.
-    x = data[np.isnan(data) == False]  # Take away the nans
-    nn = len(x)
-
-    x = x[np.isinf(x) == False]  # Take away the infs
-    n = len(x)
+    if not isinstance(data, RunlengthSamples):
+        samples, data = data, RunlengthSamples()
+        data.extend(samples)
+    x, counts = data.distribution()  # sorted distinct values without nan and inf
+    nn = len(data) - data.number_of_nan
+    n = int(np.sum(counts))
 
     x = np.exp(CrE) * x  # correction by crafting effort CrE
+    if CrE != 0.:  # distinct values may have become equal
+        x, idx = np.unique(x, return_inverse=True)
+        counts = np.bincount(idx.ravel(), weights=counts).astype(int)
 
     if n == 0:
         # res = plt.plot((1., ), (0., ), **kwargs)
         res = pprldistr.plotECDF(np.array((1.,)), n=np.inf, **kwargs)
         maxval = np.inf  # trick to plot the cross later if maxevals
     else:
-        dictx = {}  # number of appearances of each value in x
-        for i in x:
-            dictx[i] = dictx.get(i, 0) + 1
-
-        x = np.array(sorted(dictx))  # x is not a multiset anymore
-        y = np.cumsum(list(dictx[i] for i in x))  # cumsum of size of y-steps (nb of appearences)
+        y = np.cumsum(counts)  # cumsum of size of y-steps (nb of appearences)
         idx = sum(x <= x_limit ** annotation_space_end_relative) - 1
         y_last, x_last = y[idx] / float(nn), x[idx]
         if maxval is None:
@@ -489,8 +553,18 @@ def plot(dsList, targets=None, craftingeffort=0., **kwargs):
     return res
 
 
+_job_settings = ('displaybest', 'x_limit', 'divide_by_dimension',
+                 'annotation_line_end_relative', 'annotation_space_end_relative',
+                 'save_zoom', 'perfprofsamplesize', 'nbperdecade',
+                 'median_max_evals_marker_format', 'label_fontsize', 'xticks_fontsize',
+                 'yticks_fontsize', 'title_fontsize', 'save_figure', 'close_figure')
+"""module settings read by the figure jobs of `all_single_functions`"""
+
+
 def all_single_functions(dict_alg, is_single_algorithm, sorted_algs=None,
                          output_dir='.', parent_html_file_name=None, settings=genericsettings):
+    """plot the ECDFs of each function and of the function groups, the
+    figures are rendered as `figurejobs.FigureJobs`"""
     single_fct_output_dir = (output_dir.rstrip(os.sep) + os.sep +
                              'pprldmany-single-functions'
                              # + os.sep + ('f%03d' % fg)
@@ -498,60 +572,46 @@ def all_single_functions(dict_alg, is_single_algorithm, sorted_algs=None,
     if not os.path.exists(single_fct_output_dir):
         os.makedirs(single_fct_output_dir)
 
+    jobs = figurejobs.FigureJobs(module_settings={__name__: _job_settings})
     if is_single_algorithm:
-        main(dict_alg,
-             order=sorted_algs,
-             outputdir=single_fct_output_dir,
-             info='',
-             parentHtmlFileName=parent_html_file_name,
-             plotType=PlotType.DIM,
-             settings=settings)
-
-        dictFG = pp.dictAlgByFuncGroup(dict_alg)
-        for fg, entries in sorted(dictFG.items()):
-            main(entries,
+        jobs.add(main, dict_alg,
                  order=sorted_algs,
                  outputdir=single_fct_output_dir,
-                 info='%s' % (fg),
+                 info='',
                  parentHtmlFileName=parent_html_file_name,
-                 plotType=PlotType.DIM,
-                 settings=settings)
+                 plotType=PlotType.DIM)
+
+        dictFG = pp.dictAlgByFuncGroup(dict_alg)
+        for fg, entries in sorted(dictFG.items()):
+            jobs.add(main, entries,
+                     order=sorted_algs,
+                     outputdir=single_fct_output_dir,
+                     info='%s' % (fg),
+                     parentHtmlFileName=parent_html_file_name,
+                     plotType=PlotType.DIM)
 
     dictFG = pp.dictAlgByFun(dict_alg)
     for fg, tempDictAlg in sorted(dictFG.items()):
 
         if is_single_algorithm:
-            main(tempDictAlg,
-                 order=sorted_algs,
-                 outputdir=single_fct_output_dir,
-                 info='f%03d' % (fg),
-                 parentHtmlFileName=parent_html_file_name,
-                 plotType=PlotType.DIM,
-                 settings=settings)
+            jobs.add(main, tempDictAlg,
+                     order=sorted_algs,
+                     outputdir=single_fct_output_dir,
+                     info='f%03d' % (fg),
+                     parentHtmlFileName=parent_html_file_name,
+                     plotType=PlotType.DIM)
         else:
             dictDim = pp.dictAlgByDim(tempDictAlg)
             dims = sorted(dictDim)
             for i, d in enumerate(dims):
                 entries = dictDim[d]
-                main(entries,
-                     order=sorted_algs,
-                     outputdir=single_fct_output_dir,
-                     info='f%03d_%02dD' % (fg, d),
-                     parentHtmlFileName=parent_html_file_name,
-                     settings=settings)
-
-            ppfig.save_single_functions_html(
-                os.path.join(single_fct_output_dir, genericsettings.pprldmany_file_name),
-                '',  # algorithms names are clearly visible in the figure
-                dimensions=dims,
-                htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
-                parentFileName='../%s' % parent_html_file_name if parent_html_file_name else None,
-                header=ppfig.pprldmany_per_func_dim_header
-            )
+                jobs.add(main, entries,
+                         order=sorted_algs,
+                         outputdir=single_fct_output_dir,
+                         info='f%03d_%02dD' % (fg, d),
+                         parentHtmlFileName=parent_html_file_name)
 
     if is_single_algorithm:
-        functionGroups = dict_alg[list(dict_alg.keys())[0]].getFuncGroups()
-
         dictDim = pp.dictAlgByDim(dict_alg)
         dims = sorted(dictDim)
         for i, d in enumerate(dims):
@@ -559,14 +619,24 @@ def all_single_functions(dict_alg, is_single_algorithm, sorted_algs=None,
             next_dim = dims[i+1] if i + 1 < len(dims) else dims[0]
             dictFG = pp.dictAlgByFuncGroup(tempDictAlg)
             for fg, entries in sorted(dictFG.items()):
-                main(entries,
-                     order=sorted_algs,
-                     outputdir=single_fct_output_dir,
-                     info='gr_%s_%02dD' % (fg, d),
-                     parentHtmlFileName=parent_html_file_name,
-                     plotType=PlotType.FUNC,
-                     settings=settings)
+                jobs.add(main, entries,
+                         order=sorted_algs,
+                         outputdir=single_fct_output_dir,
+                         info='gr_%s_%02dD' % (fg, d),
+                         parentHtmlFileName=parent_html_file_name,
+                         plotType=PlotType.FUNC)
+    jobs.render()
+
+    if is_single_algorithm:
+        if save_figure:  # written by main before
+            ppfig.save_single_functions_html(
+                os.path.join(single_fct_output_dir, genericsettings.pprldmany_file_name),
+                '',  # algorithms names are clearly visible in the figure
+                htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
+                parentFileName='../%s' % parent_html_file_name if parent_html_file_name else None,
+                header=ppfig.pprldmany_per_func_dim_header)
 
+        functionGroups = dict_alg[list(dict_alg.keys())[0]].getFuncGroups()
         ppfig.save_single_functions_html(
             os.path.join(single_fct_output_dir, genericsettings.pprldmany_group_file_name),
             '',
@@ -575,6 +645,15 @@ def all_single_functions(dict_alg, is_single_algorithm, sorted_algs=None,
             function_groups=functionGroups,
             parentFileName='../%s' % parent_html_file_name if parent_html_file_name else None
         )
+    elif dictFG:  # with the dimensions of the last function
+        ppfig.save_single_functions_html(
+            os.path.join(single_fct_output_dir, genericsettings.pprldmany_file_name),
+            '',  # algorithms names are clearly visible in the figure
+            dimensions=dims,
+            htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
+            parentFileName='../%s' % parent_html_file_name if parent_html_file_name else None,
+            header=ppfig.pprldmany_per_func_dim_header
+        )
 
 
 def main(dictAlg, order=None, outputdir='.', info='default',
@@ -592,7 +671,8 @@ def main(dictAlg, order=None, outputdir='.', info='default',
     :param list order: sorted list of keys to dictAlg for plotting order
     :param str outputdir: output directory
     :param str info: output file name suffix
-    :param str parentHtmlFileName: defines the parent html page 
+    :param str parentHtmlFileName: defines the parent html page, the
+        html page of `PlotType.DIM` is written by `all_single_functions`
 
     """
     global divide_by_dimension  # not fully implemented/tested yet
@@ -643,11 +723,11 @@ def main(dictAlg, order=None, outputdir='.', info='default',
         if CrE != 0.0:
             print('Crafting effort for', alg, 'is', CrE)
 
-    dictData = {}  # list of (ert per function) per algorithm
+    dictData = {}  # RunlengthSamples (of ert per function) per algorithm
     dictMaxEvals = {}  # list of (maxevals per function) per algorithm
 
     # funcsolved = [set()] * len(targets) # number of functions solved per target
-    xbest = []
+    xbest = RunlengthSamples()
     maxevalsbest = []
     target_values = testbedsettings.current_testbed.pprldmany_target_values
 
@@ -695,7 +775,7 @@ def main(dictAlg, order=None, outputdir='.', info='default',
                 # funcsolved[j].add(f)
 
                 for alg in algorithms_with_data:
-                    x = [np.inf] * samplesize
+                    x = np.full(samplesize, np.inf)
                     runlengthunsucc = []
                     try:
                         entry = dictAlgperFunc[alg][0]  # one element per fun and per dim.
@@ -735,7 +815,7 @@ def main(dictAlg, order=None, outputdir='.', info='default',
                             order.append(keyValue)
                     elif plotType == PlotType.FUNC:
                         keyValue = 'f%d' % (f)
-                    dictData.setdefault(keyValue, []).extend(x)
+                    dictData.setdefault(keyValue, RunlengthSamples()).extend(x)
                     dictMaxEvals.setdefault(keyValue, []).extend(runlengthunsucc)
 
             displaybest = plotType == PlotType.ALG
@@ -760,7 +840,7 @@ def main(dictAlg, order=None, outputdir='.', info='default',
                                                   percentiles=[50],
                                                   samplesize=samplesize)[1]
                         else:
-                            x = samplesize * [np.inf]
+                            x = np.full(samplesize, np.inf)
                             runlengthunsucc = []
                         xbest.extend(x)
                         maxevalsbest.extend(runlengthunsucc)
@@ -774,7 +854,7 @@ def main(dictAlg, order=None, outputdir='.', info='default',
         args = {'label': testbedsettings.current_testbed.reference_algorithm_displayname,
                 'zorder': -1}
         args.update(genericsettings.reference_algorithm_styles)
-        lines.append(plotdata(np.array(xbest), x_limit, maxevalsbest,
+        lines.append(plotdata(xbest, x_limit, maxevalsbest,
                               CrE=0., **args))
 
     def algname_to_label(algname, dirname=None):
@@ -832,7 +912,7 @@ def main(dictAlg, order=None, outputdir='.', info='default',
 
             args.update(plotting_style.pprldmany_styles)  # no idea what this does, maybe update for background algorithms?
 
-            lines.append(plotdata(np.array(data), x_limit, maxevals,
+            lines.append(plotdata(data, x_limit, maxevals,
                                   CrE=CrEperAlg[alg], **args))
 
     if 11 < 3:
@@ -980,14 +1060,6 @@ def main(dictAlg, order=None, outputdir='.', info='default',
                                                top=0.92 if len(dictFunc) == 1 else 0.98  # space for a title or 1.0 y-tick annotation
                                                ),
                           )
-        if plotType == PlotType.DIM:
-            file_name = genericsettings.pprldmany_file_name
-            ppfig.save_single_functions_html(
-                os.path.join(outputdir, file_name),
-                '',  # algorithms names are clearly visible in the figure
-                htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
-                parentFileName='../%s' % parentHtmlFileName if parentHtmlFileName else None,
-                header=ppfig.pprldmany_per_func_dim_header)
 
     if close_figure:
         plt.close()
@@ -0,0 +1,123 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Render independent figures in parallel processes.
+
+A figure job is a function, which plots and saves a single figure, and
+its arguments, like the data sets of one function and the figure file
+name::
+
+    jobs = FigureJobs()
+    for func in dictFunc:
+        jobs.add(plot_and_save_figure, dictFunc[func], filename % func)
+    jobs.render()
+
+With ``workers > 1``, e.g. set with the ``--jobs`` option, the jobs are
+rendered in a process pool with the Agg backend of matplotlib. The job
+functions must be defined on module level and their arguments must be
+picklable. Everything written to HTML and LaTeX files is the same as
+with sequential rendering, as long as these are written by the calling
+process from the return values of `FigureJobs.render` or by the jobs
+into different files.
+
+Module settings which the job functions read, like `pprldistr.fmax`,
+are inherited by forked worker processes only. Hence they are given to
+`FigureJobs` by module and attribute names, passed to each job and set
+before the job is run::
+
+    jobs = FigureJobs(module_settings={__name__: ('fmax', 'refcolor')})
+"""
+
+from __future__ import absolute_import, division, print_function
+import sys
+import importlib
+import numpy as np
+from matplotlib import pyplot as plt
+from . import genericsettings, testbedsettings, findfiles, pproc, ppfig
+
+
+def _init_rendering_process(settings, testbed, archive_indices):
+    """initialize a worker process of `FigureJobs.render` like the
+    parent process and switch to the Agg backend.
+
+    The figure saving threads of the parent process are not inherited by
+    forked workers, hence the workers start their own.
+    """
+    from . import config  # config imports the plotting modules
+    pproc._init_reading_process(settings, testbed, archive_indices)
+    ppfig._figure_saving_threads = ppfig.FigureSavingThreads()
+    config.config()  # set the module settings of the plotting modules
+    plt.switch_backend('Agg')
+
+
+def _render(job):
+    """return ``function(*args, **kwargs)`` for ``job == (seed, function,
+    args, kwargs, module_settings)`` after seeding `np.random` with `seed`
+    and setting the module attributes in `module_settings`"""
+    seed, function, args, kwargs, module_settings = job
+    for module_name, settings in module_settings.items():
+        module = importlib.import_module(module_name)
+        for name, value in settings.items():
+            setattr(module, name, value)
+    np.random.seed(seed)
+    return function(*args, **kwargs)
+
+
+def _render_in_worker(job):
+    """return `_render` ``(job)`` after the figure files are written"""
+    try:
+        return _render(job)
+    finally:
+        ppfig.flush_figures()
+
+
+class FigureJobs(object):
+    """A list of figure jobs to be rendered with `render`.
+
+    `workers` is the number of processes to render the jobs with,
+    `genericsettings.number_of_jobs` if `None`. `module_settings` maps
+    module names to the names of their attributes which are read by the
+    jobs. Their values when a job is added are set when it is run.
+    """
+    def __init__(self, workers=None, module_settings=None):
+        self.workers = genericsettings.number_of_jobs if workers is None else workers
+        self.module_settings = module_settings or {}
+        self.jobs = []
+
+    def add(self, function, *args, **kwargs):
+        """append the job ``function(*args, **kwargs)``, which plots and
+        saves a figure and closes it"""
+        settings = dict((module_name, dict((name, getattr(sys.modules[module_name], name))
+                                           for name in names))
+                        for module_name, names in self.module_settings.items())
+        self.jobs.append((function, args, kwargs, settings))
+
+    def render(self):
+        """render all jobs and return their return values in the order
+        they were added.
+
+        `np.random` is seeded for each job with a seed drawn in the
+        current process, such that the results do not depend on the
+        number of workers.
+        """
+        jobs = [(int(seed),) + job for seed, job in
+                zip(np.random.randint(2**31 - 1, size=len(self.jobs)), self.jobs)]
+        self.jobs = []
+        if self.workers <= 1 or len(jobs) <= 1:
+            state = np.random.get_state()
+            try:
+                return [_render(job) for job in jobs]
+            finally:
+                np.random.set_state(state)
+        import multiprocessing
+        ppfig.flush_figures()  # forked workers must not inherit pending figures
+        pool = multiprocessing.Pool(min((self.workers, len(jobs))),
+                                    _init_rendering_process,
+                                    (pproc._picklable_settings(),
+                                     testbedsettings.current_testbed,
+                                     findfiles._archive_indices))
+        try:
+            return pool.map(_render_in_worker, jobs, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
@@ -15,6 +15,7 @@ TODO: we do not use pickle files anymore.
 """
 from __future__ import absolute_import, division, print_function
 import os
+import re
 import sys
 import warnings
 import tarfile
@@ -37,18 +38,36 @@ def is_recognized_repository_filetype(filename):
             or filename.find('.zip') > 0)
 
 
-def main(directory='.'):
+def main(directory='.', functions=None, dimensions=None):
     """Lists "data" files recursively in a given directory, tar files
     are extracted.
 
     The "data" files have :file:`info` and :file:`pickle` extensions.
 
+    If `genericsettings.extract_archives` is `False`, a tar or zip file
+    is not extracted. Instead, the names of the index files in the
+    (not existing) extraction folder are returned and all files are
+    read directly from the archive when they are opened with
+    `readalign.openfile`, see `ArchiveIndex`. Then, only the data of the
+    `functions` and `dimensions` given as lists of numbers are read.
+
     TODO: not only recognize .tar and .tar.gz and .tgz but .zip...
 
     """
 
     file_list = list()
     root = ''
+    directory = directory.strip()
+    if (not genericsettings.extract_archives and not os.path.isdir(directory)
+            and is_recognized_repository_filetype(directory)):
+        index = ArchiveIndex(directory, functions, dimensions)
+        _archive_indices[index.folder] = index
+        file_list = [os.path.join(index.folder, name) for name in index.index_files()]
+        if genericsettings.verbose:
+            print('Found %d file(s) in %s.' % (len(file_list), directory))
+        if not file_list:
+            warnings.warn('Could not find any file of interest in %s!' % directory)
+        return file_list
     directory = get_directory(directory, True)
 
     # Search through the directory directory and all its subfolders.
@@ -78,9 +97,8 @@ def get_directory(directory, extract_files):
     #       (root,elem) = os.path.split(elem)
     #       filelist = IndexFile(root,elem,archive)
     if not os.path.isdir(directory) and is_recognized_repository_filetype(directory):
+        dir_name = extraction_folder(directory)
         if '.zip' in directory:
-            head, tail = os.path.split(directory[:directory.find('.z')])
-            dir_name = os.path.join(head, genericsettings.extraction_folder_prefix + tail)
             # extract only if extracted folder does not exist yet or if it was
             # extracted earlier than last change of archive:
             if extract_files:
@@ -97,8 +115,6 @@ def get_directory(directory, extract_files):
                     print('    archive extracted to folder', dir_name, '...')
             directory = dir_name
         else: # i.e. either directory or .tar or zipped .tar
-            head, tail = os.path.split(directory[:directory.rfind('.t')])
-            dir_name = os.path.join(head, genericsettings.extraction_folder_prefix + tail)
             # extract only if extracted folder does not exist yet or if it was
             # extracted earlier than last change of archive:
             if extract_files:
@@ -122,6 +138,158 @@ def get_directory(directory, extract_files):
     return directory
 
 
+def extraction_folder(archive):
+    """return the name of the folder where `archive` is extracted to"""
+    if '.zip' in archive:
+        head, tail = os.path.split(archive[:archive.find('.z')])
+    else:
+        head, tail = os.path.split(archive[:archive.rfind('.t')])
+    return os.path.join(head, genericsettings.extraction_folder_prefix + tail)
+
+
+_archive_indices = {}
+"""`ArchiveIndex` instances by their `folder`, see `main`"""
+
+
+class ArchiveIndex(object):
+    """Index of the members of a tar or zip archive by their names.
+
+    The members are accessed with names relative to `folder`, the
+    folder to which `archive` would be extracted. Members are read
+    directly from the archive, without extracting them to disk. The
+    selected members of a tar file are read together in a single pass
+    and kept in memory, because a compressed tar file can only be read
+    forward.
+
+    Data files of other than the given `functions` or `dimensions` are
+    deselected, as far as function and dimension can be determined from
+    the file name, like in :file:`data_f1/bbobexp_f1_DIM2.dat` or
+    :file:`bbob-bestalg_f01_d02.dat`. Index files are deselected only if
+    their name contains a deselected function.
+
+    >>> import os
+    >>> from cocopp import findfiles, toolsdivers
+    >>> index = findfiles.ArchiveIndex(toolsdivers.path_in_package(
+    ...     os.path.join('refalgs', 'best2009-bbob.tar.gz')), [1, 2], [5])
+    >>> index.index_files() == [os.path.join('best2009-bbob', 'bbob-bestalg.info')]
+    True
+    >>> name = os.path.join('best2009-bbob', 'bbob-bestalg_f02_d05.tdat')
+    >>> index.is_selected(name), index.read(name).startswith(b'%')
+    (True, True)
+    >>> index.is_selected(name.replace('f02', 'f03')), index.is_selected(name.replace('d05', 'd10'))
+    (False, False)
+
+    """
+    _function_pattern = re.compile(r'_f(\d+)(?:_|\.|$)')
+    _dimension_pattern = re.compile(r'_(?:DIM|d)(\d+)(?:_|\.|$)')
+
+    def __init__(self, archive, functions=None, dimensions=None):
+        self.archive = os.path.abspath(archive)
+        self.folder = os.path.abspath(extraction_folder(archive))
+        self.functions = functions
+        self.dimensions = dimensions
+        self._file = None
+        self._pid = None
+        self._tar_members = {}
+        self._contents = None
+        self.members = {}
+        """archive member names by name relative to `folder`"""
+        archive = self._open()
+        if isinstance(archive, zipfile.ZipFile):
+            names = archive.namelist()
+        else:
+            names = []
+            for info in archive.getmembers():
+                if info.isfile():
+                    self._tar_members[info.name] = info
+                    names.append(info.name)
+        for name in names:
+            if not name.endswith('/'):
+                self.members[os.path.normpath(name)] = name
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.update(_file=None, _contents=None)
+        return state
+
+    def _open(self):
+        """return the open archive, (re)opened in each process"""
+        if self._file is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            if zipfile.is_zipfile(self.archive):
+                self._file = zipfile.ZipFile(self.archive)
+            else:
+                self._file = tarfile.open(self.archive)
+        return self._file
+
+    def is_selected(self, name):
+        """return `False` if `name` belongs to a deselected function or dimension"""
+        basename = os.path.basename(name)
+        for pattern, values in ((self._function_pattern, self.functions),
+                                (self._dimension_pattern, self.dimensions)):
+            match = pattern.search(basename)
+            if values is not None and match and int(match.group(1)) not in values:
+                return False
+        return True
+
+    def index_files(self):
+        """return the sorted names of the selected index and pickle files"""
+        return sorted(name for name in self.members
+                      if name.endswith(('.info', '.pickle', '.pickle.gz'))
+                      and self.is_selected(name))
+
+    def read(self, name):
+        """return the content of member `name` as `bytes`.
+
+        The first read of a selected member of a tar file reads all
+        selected members in archive order, such that a compressed tar
+        file is decompressed only once.
+        """
+        archive = self._open()
+        if isinstance(archive, zipfile.ZipFile):
+            return archive.read(self.members[name])
+        if not self.is_selected(name):
+            return self._read_tar_member(self.members[name])
+        if self._contents is None:
+            selected = set(self.members[n] for n in self.members
+                           if self.is_selected(n))
+            self._contents = dict((info.name, self._read_tar_member(info.name))
+                                  for info in sorted(self._tar_members.values(),
+                                                     key=lambda info: info.offset)
+                                  if info.name in selected)
+        return self._contents[self.members[name]]
+
+    def _read_tar_member(self, member):
+        """return the content of tar `member` as `bytes`"""
+        f = self._open().extractfile(self._tar_members[member])
+        try:
+            return f.read()
+        finally:
+            f.close()
+
+
+def archive_member(filename):
+    """return ``(index, name)`` where `index` is the `ArchiveIndex` containing
+    `filename` as member `name`, or ``(None, None)``"""
+    folder, name = os.path.split(os.path.abspath(filename))
+    while _archive_indices and name:
+        index = _archive_indices.get(folder)
+        if index is not None:
+            return (index, name) if name in index.members else (None, None)
+        folder, head = os.path.split(folder)
+        if not head:
+            break
+        name = os.path.join(head, name)
+    return None, None
+
+
+def is_selected(filename):
+    """return `False` if `filename` is a member of an `ArchiveIndex` which
+    deselects it, see `ArchiveIndex.is_selected`"""
+    index, name = archive_member(filename)
+    return index is None or index.is_selected(name)
+
+
 def get_output_directory_sub_folder(args):
 
     directory = ''
@@ -11,6 +11,7 @@ here see `config.py`.
 
 """
 
+import os
 import numpy as np
 
 test = False  # debug/test flag, set to False for committing the final version
@@ -214,6 +215,47 @@ ppfigdim_file_name = 'ppfigdim'
 latex_commands_for_html = 'latex_commands_for_html'
 
 extraction_folder_prefix = '.extracted_'
+summary_file_prefix = '.summary_'
+"""prefix of the file names of data summaries, see `pproc.save_summary`
+   and `archiving.COCODataArchive.get_summary`."""
+extract_archives = True
+"""if `False`, data are read directly from tar and zip archives instead
+   of from their extracted files, see `findfiles.main`, set with the
+   ``--no-extract`` option."""
+archive_functions = None
+"""if not `None`, the list of function numbers whose data are read from
+   archives when `extract_archives` is `False`, set with the
+   ``--functions`` option."""
+archive_dimensions = None
+"""if not `None`, the list of dimensions whose data are read from
+   archives when `extract_archives` is `False`, set with the
+   ``--dimensions`` option."""
+
+dataset_cache_folder = os.path.join('~', '.cocopp', 'dataset-cache')
+"""folder of the cache files for data parsed from each index file, see
+   `pproc.save_cached_datasets`. The cache is not used if `None`."""
+dataset_cache_max_size = 500 * 1024**2
+"""maximal size in bytes of all files in `dataset_cache_folder`, the least
+   recently used files are removed when it is exceeded, no limit if `None`."""
+number_of_jobs = 1
+"""number of processes to read index and data files in parallel by
+   `pproc.DataSetList` and to render figures with `figurejobs.FigureJobs`,
+   set with the ``--jobs`` option."""
+incremental = False
+"""if `True`, skip post-processing steps with unchanged data, settings
+   and output files, see `buildmanifest` and the ``--incremental`` option."""
+background_figure_saving = False
+"""if `True`, `ppfig.save_figure` encodes and writes the figure files in
+   background threads while the next figure is plotted, set with the
+   ``--background-figure-saving`` option."""
+profile = False
+"""if `True`, record run time, number of calls and peak memory of the
+   post-processing stages with `profiling` and write a report into the
+   output folder, set with the ``--profile`` option."""
+dataset_results_cache_size = 10000
+"""maximal number of values from `pproc.DataSet.detEvals` and
+   `pproc.DataSet.detERT` kept in the results cache of each data set,
+   ``0`` switches the cache off."""
 
 # default settings for rungeneric, rungeneric1 and rungenericmany
 inputCrE = 0.
@@ -6,18 +6,27 @@ from __future__ import absolute_import
 # from __future__ import unicode_literals  # enum construction fails
 
 import os
+import time
+import atexit
+import pickle
+import threading
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
 from collections import OrderedDict
 from operator import itemgetter
 from itertools import groupby
 import warnings
 import numpy as np
 from matplotlib import pyplot as plt
+from matplotlib.backend_bases import FigureCanvasBase
 import shutil
 from six import advance_iterator
 # from pdb import set_trace
 
 # absolute_import => . refers to where ppfig resides in the package:
-from . import genericsettings, testbedsettings, toolsstats, htmldesc, toolsdivers
+from . import genericsettings, testbedsettings, toolsstats, htmldesc, toolsdivers, profiling
 
 
 # CLASS DEFINITIONS
@@ -39,6 +48,87 @@ HtmlPage = enum('NON_SPECIFIED', 'ONE', 'MANY', 'PPRLDMANY_BY_GROUP', 'PPRLDMANY
 _figsize_warnings = 1  # couldn't convince filterwarnings('once') to work as desired
 '''remaining number of warnings to be issued'''
 
+figure_saving_statistics = {'figures': 0, 'files': 0, 'snapshot time': 0.,
+                            'encoding time': 0., 'waiting time': 0.}
+"""number of figures and files written by `save_figure`, the time spent
+   to pickle figures for the background threads, to encode and write the
+   files, and to wait for the background threads in `flush_figures`"""
+_statistics_lock = threading.Lock()
+
+
+class FigureSavingThreads(object):
+    """Encode and write figures with one background thread per file format.
+
+    Figures are passed as pickled snapshot, which each thread unpickles
+    into its own copy, such that the plotting can continue in the main
+    thread. Use `join` to wait until all files are written.
+    """
+    def __init__(self):
+        self.queues = {}
+        self.errors = []
+
+    def put(self, snapshot, filename, format, **kwargs):
+        """write the pickled figure `snapshot` to `filename` with
+        ``savefig(filename, format=format, **kwargs)``"""
+        if format not in self.queues:
+            self.queues[format] = queue.Queue()
+            thread = threading.Thread(target=self._work, args=(self.queues[format],))
+            thread.daemon = True
+            thread.start()
+        self.queues[format].put((snapshot, filename, dict(kwargs, format=format)))
+
+    def _work(self, jobs):
+        while True:
+            snapshot, filename, kwargs = jobs.get()
+            try:
+                start = time.time()
+                with profiling.stage('savefig (background)'):
+                    pickle.loads(snapshot).savefig(filename, **kwargs)
+                with _statistics_lock:
+                    figure_saving_statistics['files'] += 1
+                    figure_saving_statistics['encoding time'] += time.time() - start
+                if genericsettings.verbose:
+                    print('Wrote figure in %s.' % filename)
+            except IOError:
+                warnings.warn('%s is not writeable.' % filename)
+            except Exception as e:
+                self.errors.append(e)
+            finally:
+                jobs.task_done()
+
+    def join(self):
+        """wait until all figures are written and raise the first error
+        of the threads, if any"""
+        for jobs in list(self.queues.values()):
+            jobs.join()
+        errors, self.errors = self.errors, []
+        if errors:
+            raise errors[0]
+
+_figure_saving_threads = FigureSavingThreads()
+atexit.register(_figure_saving_threads.join)
+
+
+def flush_figures():
+    """wait until all figures passed to `save_figure` are written.
+
+    Called before html files, which link the figure files, are written.
+    """
+    start = time.time()
+    _figure_saving_threads.join()
+    figure_saving_statistics['waiting time'] += time.time() - start
+
+
+def _snapshot(fig):
+    """return `fig` pickled, which is not restored into `pyplot` when
+    unpickled"""
+    canvas = fig.canvas
+    FigureCanvasBase(fig)  # detach from the pyplot figure manager
+    try:
+        return pickle.dumps(fig, pickle.HIGHEST_PROTOCOL)
+    finally:
+        fig.set_canvas(canvas)
+
 def save_figure(filename,
                 algorithm=None,
                 format=None,
@@ -62,6 +152,10 @@ def save_figure(filename,
 
     'tight' `bbox_inches` lead possibly to (slightly) different figure
     sizes in each case, which is undesirable.
+
+    If `genericsettings.background_figure_saving`, the figure is pickled
+    and the files are encoded and written in background threads, see
+    `FigureSavingThreads` and `flush_figures`.
     """
     if not format:
         fig_formats = genericsettings.figure_file_formats
@@ -75,47 +169,78 @@ def save_figure(filename,
              fontsize=10,
              color='0.5',
              transform=plt.gca().transAxes)
+    figure_saving_statistics['figures'] += 1
+    dpi = 60 if genericsettings.in_a_hurry else 300
+    if genericsettings.background_figure_saving:
+        _adjust_layout(layout_rect, subplots_adjust)
+        _set_figure_size()
+        start = time.time()
+        try:
+            snapshot = _snapshot(plt.gcf())
+        except Exception as e:  # e.g. a lambda in the figure
+            warnings.warn('Figure "%s" could not be pickled (%s) and is saved'
+                          ' in the foreground.' % (filename, str(e)))
+        else:
+            figure_saving_statistics['snapshot time'] += time.time() - start
+            for format in fig_formats:
+                _figure_saving_threads.put(snapshot, filename + '.' + format, format,
+                                           dpi=dpi, bbox_inches=bbox_inches)
+            return
     for format in fig_formats:
-        if plt.matplotlib.__version__[0] >= '3' and subplots_adjust:
-            # subplots_adjust is used in pprldmany.main with bottom=0.135, right=0.735
-            plt.subplots_adjust(**subplots_adjust)
-        elif layout_rect:
-            try:
-                # possible alternative:
-                # bbox = gcf().get_tightbbox(gcf().canvas.get_renderer())
-                # bbox._bbox.set_points([[plt.xlim()[0], None], [None, None]])
-                #
-                # layout_rect[2]=0.88 extends the figure to the
-                # right, i.e., 0.88 is where the "tight" right figure
-                # border is placed whereas everything is plotted
-                # further up to plotted figure border at 1
-                plt.tight_layout(pad=0.15, rect=layout_rect)
-            except Exception as e:
-                warnings.warn(
-                    'Figure tightening failed (matplotlib version %s)'
-                    ' with Exception: "%s"' %
-                    (plt.matplotlib.__version__, str(e)))
+        _adjust_layout(layout_rect, subplots_adjust)
         try:
-            if plt.rcParams['figure.figsize'] != genericsettings.figsize:
-                # prevent saved figure to be different under Jupyter notebooks
-                plt.gcf().set_size_inches(genericsettings.figsize)
-                global _figsize_warnings
-                if _figsize_warnings > 0:
-                    m = 'Plotting with genericsettings.figsize=={} instead of default {}'.format(
-                            genericsettings.figsize, plt.rcParams['figure.figsize'])
-                    warnings.warn(m)
-                    _figsize_warnings -= 1
-            plt.savefig(filename + '.' + format,
-                        dpi=60 if genericsettings.in_a_hurry else 300,
-                        format=format,
-                        bbox_inches=bbox_inches,
-                        # pad_inches=0,  # default is 0.1?, 0 leads to cut label text
-                        )
+            _set_figure_size()
+            start = time.time()
+            with profiling.stage('savefig'):
+                plt.savefig(filename + '.' + format,
+                            dpi=dpi,
+                            format=format,
+                            bbox_inches=bbox_inches,
+                            # pad_inches=0,  # default is 0.1?, 0 leads to cut label text
+                            )
+            figure_saving_statistics['files'] += 1
+            figure_saving_statistics['encoding time'] += time.time() - start
             if genericsettings.verbose:
                 print('Wrote figure in %s.' % (filename + '.' + format))
         except IOError:
             warnings.warn('%s is not writeable.' % (filename + '.' + format))
 
+
+def _adjust_layout(layout_rect, subplots_adjust):
+    """adjust the layout of the current figure, see `save_figure`"""
+    if plt.matplotlib.__version__[0] >= '3' and subplots_adjust:
+        # subplots_adjust is used in pprldmany.main with bottom=0.135, right=0.735
+        plt.subplots_adjust(**subplots_adjust)
+    elif layout_rect:
+        try:
+            # possible alternative:
+            # bbox = gcf().get_tightbbox(gcf().canvas.get_renderer())
+            # bbox._bbox.set_points([[plt.xlim()[0], None], [None, None]])
+            #
+            # layout_rect[2]=0.88 extends the figure to the
+            # right, i.e., 0.88 is where the "tight" right figure
+            # border is placed whereas everything is plotted
+            # further up to plotted figure border at 1
+            plt.tight_layout(pad=0.15, rect=layout_rect)
+        except Exception as e:
+            warnings.warn(
+                'Figure tightening failed (matplotlib version %s)'
+                ' with Exception: "%s"' %
+                (plt.matplotlib.__version__, str(e)))
+
+
+def _set_figure_size():
+    """set the size of the current figure to `genericsettings.figsize`"""
+    if plt.rcParams['figure.figsize'] != genericsettings.figsize:
+        # prevent saved figure to be different under Jupyter notebooks
+        plt.gcf().set_size_inches(genericsettings.figsize)
+        global _figsize_warnings
+        if _figsize_warnings > 0:
+            m = 'Plotting with genericsettings.figsize=={} instead of default {}'.format(
+                    genericsettings.figsize, plt.rcParams['figure.figsize'])
+            warnings.warn(m)
+            _figsize_warnings -= 1
+
 pprldmany_per_func_dim_header = 'Runtime distributions (ECDFs) per function'
 pprldmany_per_group_dim_header = 'Runtime distributions (ECDFs) summary and function groups'
 convergence_plots_header = 'Convergence plots'
@@ -163,6 +288,7 @@ def add_link(current_dir, folder, file_name, label,
 
 
 def save_index_html_file(filename):
+    flush_figures()
     with open(filename + '.html', 'w') as f:
         text = ''
         f.write(html_header % tuple(2 * ['COCO Post-Processing Results'] + [text]))
@@ -193,6 +319,7 @@ def save_folder_index_file(filename, image_file_extension):
 
     if not filename:
         return
+    flush_figures()
 
     current_dir = os.path.dirname(os.path.realpath(filename))
 
@@ -297,6 +424,7 @@ def save_single_functions_html(filename,
                                header=None,  # used only with HtmlPage.NON_SPECIFIED
                                caption=None):  # used only with HtmlPage.NON_SPECIFIED and PPFIGCONS1 (dynamic caption setting)
 
+    flush_figures()
     name = filename.split(os.sep)[-1]
     current_dir = os.path.dirname(os.path.realpath(filename))
     with open(filename + add_to_names + '.html', 'w') as f:
@@ -62,7 +62,7 @@ from six import advance_iterator
 
 from . import genericsettings, toolsstats, bestalg, pproc, ppfig, ppfigparam, htmldesc, toolsdivers
 from . import testbedsettings
-from . import captions
+from . import captions, figurejobs
 
 xlim_max = None
 ynormalize_by_dimension = True  # not at all tested yet
@@ -564,38 +564,51 @@ def main(dsList, _valuesOfInterest, outputdir):
     funInfos = ppfigparam.read_fun_infos()
     fontSize = ppfig.getFontSize(funInfos.values())
 
+    jobs = figurejobs.FigureJobs(module_settings={__name__: _job_settings})
     for func in dictFunc:
-        plot(dictFunc[func], _valuesOfInterest, styles=styles)  # styles might have changed via config
-        beautify(axesLabel=False)
-        
-        # display number of instances in data and used targets type:
-        if all(set(d.instancenumbers) == set(dictFunc[func][0].instancenumbers)
-               for d in dictFunc[func]): # all the same?
-            display_text = '%d instances\n' % len(((dictFunc[func][0]).instancenumbers))
-        else:
-            display_text = 'instances %s' % [d.instancenumbers for d in dictFunc[func]]
-        display_text += _valuesOfInterest.short_info
-        plt.text(plt.xlim()[0], plt.ylim()[0],
-                 display_text, fontsize=14, horizontalalignment="left",
-                 verticalalignment="bottom")
-
-        if func in testbedsettings.current_testbed.functions_with_legend:
-            toolsdivers.legend(loc="best", fontsize=16)
-        if func in funInfos.keys():
-            funcName = funInfos[func]
-            plt.gca().set_title(funcName, fontsize=fontSize)
-
-        if genericsettings.scaling_plots_with_axis_labels:
-            plt.xlabel('dimension')
-            plt.ylabel('log10(# f-evals / dimension)')
-
-        plot_previous_algorithms(func, _valuesOfInterest)
-        filename = os.path.join(outputdir, 'ppfigdim_f%03d' % (func))
-        with warnings.catch_warnings(record=True) as ws:
-            ppfig.save_figure(filename, dsList[0].algId)
-            if len(ws):
-                for w in ws:
-                    print(w)
-                print('while saving figure to "' + filename + '" (at ppfigdim.py:595)')
-
-        plt.close()
+        jobs.add(_plot_and_save_function, dictFunc[func], _valuesOfInterest, func,
+                 funInfos.get(func), fontSize,
+                 os.path.join(outputdir, 'ppfigdim_f%03d' % (func)), dsList[0].algId)
+    jobs.render()
+
+
+_job_settings = ('xlim_max', 'ynormalize_by_dimension', 'styles', 'refcolor')
+"""module settings read by the figure jobs of `main`"""
+
+
+def _plot_and_save_function(dsList, _valuesOfInterest, func, funcName, fontSize,
+                            filename, algId):
+    """plot and save the figure of function `func` with data sets `dsList`
+    and title `funcName` if not `None`, a figure job of `main`"""
+    plot(dsList, _valuesOfInterest, styles=styles)  # styles might have changed via config
+    beautify(axesLabel=False)
+
+    # display number of instances in data and used targets type:
+    if all(set(d.instancenumbers) == set(dsList[0].instancenumbers)
+           for d in dsList): # all the same?
+        display_text = '%d instances\n' % len(((dsList[0]).instancenumbers))
+    else:
+        display_text = 'instances %s' % [d.instancenumbers for d in dsList]
+    display_text += _valuesOfInterest.short_info
+    plt.text(plt.xlim()[0], plt.ylim()[0],
+             display_text, fontsize=14, horizontalalignment="left",
+             verticalalignment="bottom")
+
+    if func in testbedsettings.current_testbed.functions_with_legend:
+        toolsdivers.legend(loc="best", fontsize=16)
+    if funcName is not None:
+        plt.gca().set_title(funcName, fontsize=fontSize)
+
+    if genericsettings.scaling_plots_with_axis_labels:
+        plt.xlabel('dimension')
+        plt.ylabel('log10(# f-evals / dimension)')
+
+    plot_previous_algorithms(func, _valuesOfInterest)
+    with warnings.catch_warnings(record=True) as ws:
+        ppfig.save_figure(filename, algId)
+        if len(ws):
+            for w in ws:
+                print(w)
+            print('while saving figure to "' + filename + '" (at ppfigdim.py:595)')
+
+    plt.close()
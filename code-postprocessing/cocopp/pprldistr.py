@@ -49,7 +49,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from pdb import set_trace
 from . import genericsettings, pproc, toolsdivers
-from . import testbedsettings
+from . import testbedsettings, figurejobs
 from .ppfig import consecutiveNumbers, plotUnifLogXMarkers, save_figure, logxticks
 from .pptex import color_to_latex, marker_to_latex
 from . import captions
@@ -496,19 +496,17 @@ def plotRLDistr(dsList, target, label='', max_fun_evals=np.inf,
           the number of data made the same, in case?
 
     """
-    x = []
-    nn = 0
-    fsolved = set()
-    funcs = set()
-    for ds in dsList: # ds is a DataSet
-        funcs.add(ds.funcId)
-        tmp = ds.detEvals((target((ds.funcId, ds.dim)),))[0] / ds.dim
-        nn += len(tmp)
-        tmp = tmp[np.isnan(tmp) == False] # keep only success
-        if len(tmp) > 0 and sum(tmp <= max_fun_evals):
-            fsolved.add(ds.funcId)
-        x.extend(tmp)
-        # nn += ds.nbRuns()
+    # evals of all data sets, padded with nan for data sets with fewer runs
+    if len(dsList):
+        evals = dsList.det_evals(lambda fun_dim: [target(fun_dim)])[:, 0]
+    else:
+        evals = np.zeros((0, 0))
+    evals /= np.asarray([ds.dim for ds in dsList])[:, None]
+    nn = sum(ds.nbRuns() for ds in dsList)
+    funcs = set(ds.funcId for ds in dsList)
+    fsolved = set(ds.funcId for ds, tmp in zip(dsList, evals)
+                  if np.any(tmp <= max_fun_evals))
+    x = list(evals[np.isnan(evals) == False])  # keep only success
     kwargs = plotArgs.copy()
     label += ': %d/%d' % (len(fsolved), len(funcs))
     kwargs['label'] = kwargs.setdefault('label', label)
@@ -817,9 +815,8 @@ def main(dsList, isStoringXMax=False, outputdir='',
     :param string info: string suffix for output file names.
 
     """
-    testbed = testbedsettings.current_testbed
-    targets = testbed.pprldistr_target_values # convenience abbreviation
-
+    global fmax
+    jobs = figurejobs.FigureJobs(module_settings={__name__: _job_settings})
     for d, dictdim in sorted(dsList.dictByDim().items()):
         maxEvalsFactor = max(i.mMaxEvals() / d for i in dictdim)
         if isStoringXMax:
@@ -831,67 +828,106 @@ def main(dsList, isStoringXMax=False, outputdir='',
         if runlen_xlimits_max is not None:
             evalfmax = runlen_xlimits_max
 
+        funcs = list(i.funcId for i in dictdim)
+        text = '{%s}, %d-D' % (consecutiveNumbers(sorted(funcs), 'f'), d)
+
         # first figure: Run Length Distribution
         filename = os.path.join(outputdir, 'pprldistr_%02dD_%s' % (d, info))
-        fig = plt.figure()
-        for j in range(len(targets)):
-            plotRLDistr(dictdim,
-                        lambda fun_dim: targets(fun_dim)[j],
-                        (targets.label(j)
-                         if isinstance(targets,
-                                       pproc.RunlengthBasedTargetValues)
-                         else targets.loglabel(j)),
-                        evalfmax, # can be larger maxEvalsFactor with no effect
-                        ** rldStyles[j % len(rldStyles)])
+        jobs.add(_plot_and_save_rld, dictdim, d, evalfmax, maxEvalsFactor,
+                 dsList.isBiobjective(), text, filename, dsList[0].algId)
 
-        funcs = list(i.funcId for i in dictdim)
-        text = '{%s}, %d-D' % (consecutiveNumbers(sorted(funcs), 'f'), d)
-        if not dsList.isBiobjective():
-     #   try:
+        # second figure: Function Value Distribution
+        filename = os.path.join(outputdir, 'ppfvdistr_%02dD_%s' % (d, info))
+        if isStoringXMax and not fmax:  # the first figure sets fmax for all others
+            jobs.render()
+            fmax = _plot_and_save_fvd(dictdim, maxEvalsFactor, text, isStoringXMax,
+                                      fmax, filename, dsList[0].algId)
+        else:
+            jobs.add(_plot_and_save_fvd, dictdim, maxEvalsFactor, text, isStoringXMax,
+                     fmax, filename, dsList[0].algId)
+    jobs.render()
 
-            if not isinstance(targets, pproc.RunlengthBasedTargetValues):
-            # if targets.target_values[-1] == 1e-8:  # this is a hack
-                plot_previous_algorithms(d, funcs)
 
-            else:
-                plotRLB_previous_algorithms(d, funcs)
+_job_settings = ('fmax', 'evalfmax', 'runlen_xlimits_min', 'runlen_xlimits_max',
+                 'previous_data_filename', 'previous_RLBdata_filename')
+"""module settings read by the figure jobs of `main`"""
 
-    #    except:
-     #       pass
 
-        plt.axvline(x=maxEvalsFactor, color='k') # vertical line at maxevals
-        toolsdivers.legend(loc='best')
-        plt.text(0.5, 0.98, text, horizontalalignment="center",
-                 verticalalignment="top",
-                 transform=plt.gca().transAxes
-                 # bbox=dict(ec='k', fill=False)
-                )
-        try: # was never tested, so let's make it safe
-            if len(funcs) == 1:
-                plt.title(testbed.info(funcs[0])[:27])
-        except:
-            warnings.warn('could not print title')
+def _plot_and_save_rld(dictdim, d, evalfmax, maxEvalsFactor, is_biobjective,
+                       text, filename, algId):
+    """plot and save the runtime distribution figure of the data sets
+    `dictdim` in dimension `d`, a figure job of `main`"""
+    testbed = testbedsettings.current_testbed
+    targets = testbed.pprldistr_target_values # convenience abbreviation
+    fig = plt.figure()
+    for j in range(len(targets)):
+        plotRLDistr(dictdim,
+                    lambda fun_dim: targets(fun_dim)[j],
+                    (targets.label(j)
+                     if isinstance(targets,
+                                   pproc.RunlengthBasedTargetValues)
+                     else targets.loglabel(j)),
+                    evalfmax, # can be larger maxEvalsFactor with no effect
+                    ** rldStyles[j % len(rldStyles)])
 
+    funcs = list(i.funcId for i in dictdim)
+    if not is_biobjective:
+ #   try:
 
-        beautifyRLD(evalfmax)
-        save_figure(filename, dsList[0].algId, subplots_adjust=dict(left=0.135, bottom=0.15, right=1, top=0.99))
-        plt.close(fig)
+        if not isinstance(targets, pproc.RunlengthBasedTargetValues):
+        # if targets.target_values[-1] == 1e-8:  # this is a hack
+            plot_previous_algorithms(d, funcs)
 
-        # second figure: Function Value Distribution
-        filename = os.path.join(outputdir, 'ppfvdistr_%02dD_%s' % (d, info))
-        fig = plt.figure()
-        plotFVDistr(dictdim, np.inf, testbed.ppfvdistr_min_target, **rldStyles[-1])
-        # coloring right to left
-        for j, max_eval_factor in enumerate(genericsettings.single_runlength_factors):
-            if max_eval_factor > maxEvalsFactor:
-                break
-            plotFVDistr(dictdim, max_eval_factor, testbed.ppfvdistr_min_target,
-                        **rldUnsuccStyles[j % len(rldUnsuccStyles)])
+        else:
+            plotRLB_previous_algorithms(d, funcs)
 
-        plt.text(0.98, 0.02, text, horizontalalignment="right",
-                 transform=plt.gca().transAxes) # bbox=dict(ec='k', fill=False),
-        beautifyFVD(isStoringXMax=isStoringXMax, ylabel=False)
-        save_figure(filename, dsList[0].algId, subplots_adjust=dict(left=0.0, bottom=0.15, right=1, top=0.99))
+#    except:
+ #       pass
+
+    plt.axvline(x=maxEvalsFactor, color='k') # vertical line at maxevals
+    toolsdivers.legend(loc='best')
+    plt.text(0.5, 0.98, text, horizontalalignment="center",
+             verticalalignment="top",
+             transform=plt.gca().transAxes
+             # bbox=dict(ec='k', fill=False)
+            )
+    try: # was never tested, so let's make it safe
+        if len(funcs) == 1:
+            plt.title(testbed.info(funcs[0])[:27])
+    except:
+        warnings.warn('could not print title')
 
-        plt.close(fig)
 
+    beautifyRLD(evalfmax)
+    save_figure(filename, algId, subplots_adjust=dict(left=0.135, bottom=0.15, right=1, top=0.99))
+    plt.close(fig)
+
+
+def _plot_and_save_fvd(dictdim, maxEvalsFactor, text, isStoringXMax, fmax_,
+                       filename, algId):
+    """plot and save the function value distribution figure of the data
+    sets `dictdim`, a figure job of `main`.
+
+    Return the maximal x-value `fmax`, which is `fmax_` if given and
+    `isStoringXMax`.
+    """
+    global fmax
+    if isStoringXMax:
+        fmax = fmax_
+    testbed = testbedsettings.current_testbed
+    fig = plt.figure()
+    plotFVDistr(dictdim, np.inf, testbed.ppfvdistr_min_target, **rldStyles[-1])
+    # coloring right to left
+    for j, max_eval_factor in enumerate(genericsettings.single_runlength_factors):
+        if max_eval_factor > maxEvalsFactor:
+            break
+        plotFVDistr(dictdim, max_eval_factor, testbed.ppfvdistr_min_target,
+                    **rldUnsuccStyles[j % len(rldUnsuccStyles)])
+
+    plt.text(0.98, 0.02, text, horizontalalignment="right",
+             transform=plt.gca().transAxes) # bbox=dict(ec='k', fill=False),
+    beautifyFVD(isStoringXMax=isStoringXMax, ylabel=False)
+    save_figure(filename, algId, subplots_adjust=dict(left=0.0, bottom=0.15, right=1, top=0.99))
+
+    plt.close(fig)
+    return fmax
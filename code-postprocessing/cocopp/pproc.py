@@ -29,14 +29,16 @@ import json
 import hashlib
 import functools
 import collections
+import pkg_resources
 from pdb import set_trace
 from six import string_types, advance_iterator
 import numpy, numpy as np
 import matplotlib.pyplot as plt
 from collections import OrderedDict
 from . import genericsettings, findfiles, toolsstats, toolsdivers
-from . import testbedsettings, dataformatsettings
+from . import testbedsettings, dataformatsettings, profiling
 from .readalign import split, align_data, HMultiReader, VMultiReader, openfile
+from .readalign import binary_data_file, binary_data_extension
 from .readalign import HArrayMultiReader, VArrayMultiReader, alignArrayData
 from .ppfig import consecutiveNumbers, Usage
 from . import archiving
@@ -44,6 +46,7 @@ from . import archiving
 do_assertion = genericsettings.force_assertions # expensive assertions
 targets_displayed_for_info = [10, 1., 1e-1, 1e-3, 1e-5, 1e-8]  # only to display info in DataSetList.info
 maximal_evaluations_only_to_last_target = False  # was true in release 13.03, leads naturally to better results
+results_cache_statistics = {'hits': 0, 'misses': 0}  # of all `DataSet` results caches, see `DataSet.clear_results_cache`
 
 
 def _DataSet_complement_data(self, step=10**0.2, final_target=1e-8):
@@ -910,25 +913,31 @@ class DataSet(object):
                 self._maxevals = maxevals
                 self.finalfunvals = finalfunvals
 
-        dataFiles = list(os.path.join(filepath, os.path.splitext(i)[0] + '.tdat')
-                         for i in self.dataFiles)
+        tdatFiles = list(os.path.splitext(i)[0] + '.tdat' for i in self.dataFiles)
+        dataFiles = list(os.path.join(filepath, i) for i in tdatFiles)
                              
-        if not any(os.path.isfile(dataFile) for dataFile in dataFiles):
+        if not any(os.path.isfile(dataFile) or findfiles.archive_member(dataFile)[0]
+                   or binary_data_file(dataFile)
+                   for dataFile in dataFiles):
             warnings.warn("Missing tdat files in '%s'. Please consider to rerun the experiments." % filepath)
 
-        datasets, algorithms, reference_values, success_ratio = split(dataFiles, idx_to_load=idx_of_instances_to_load)
-        data = VMultiReader(datasets)
+        self._funvals_sources = [[os.path.abspath(filepath), tdatFiles,
+                                  idx_of_instances_to_load, self.get_data_format()]]
+        """arguments to read `funvals` lazily, see `_read_funvals`"""
+        # only the last line of each run is converted here, the tdat
+        # files are parsed and aligned when `funvals` is accessed
+        datasets = split(dataFiles, idx_to_load=idx_of_instances_to_load, last_rows=True)[0]
         if genericsettings.verbose:
             print("Processing %s: %d/%d trials found."
-                   % (dataFiles, len(data), len(self.instancenumbers)))
+                   % (dataFiles, len(datasets), len(self.instancenumbers)))
         
-        if data:
-            self.funvals, maxevals, finalfunvals = align_data(
-                data, 
-                dataformatsettings.current_data_format.evaluation_idx,
-                dataformatsettings.current_data_format.function_value_idx,
-                )
-            # was: (adata, maxevals, finalfunvals) = align_data(data)
+        if datasets:
+            # the last lines are what `align_data` returns as maxevals and
+            # finalfunvals
+            maxevals = numpy.asarray([d[-1][dataformatsettings.current_data_format.evaluation_idx]
+                                      for d in datasets])
+            finalfunvals = numpy.asarray([d[-1][dataformatsettings.current_data_format.function_value_idx]
+                                          for d in datasets])
             try:
                 for i in range(len(maxevals)):
                     self._maxevals[i] = max(maxevals[i], self._maxevals[i])
@@ -1010,6 +1019,7 @@ class DataSet(object):
                 # warnings.warn('exact final precision was not recorded, next lower value set close to final precision')
                 # print('*** warning: final precision was not recorded')
                 assert self._evals[-1][0] < self.precision # shall not have changed
+            self.clear_results_cache()  # data were changed in place
             assert self._evals[-1][0] > 0
             self._maxevals = self._detMaxEvals()
 
@@ -1100,6 +1110,7 @@ class DataSet(object):
         # assert self._evals.shape[1] - 1 == len(self.instancenumbers), self
         # assert self.evals.shape[1] - 1 == len(self.maxevals), self
 
+    @profiling.profiled('DataSet.evals_with_simulated_restarts')
     def evals_with_simulated_restarts(self,
             targets,
             samplesize=None,
@@ -1134,7 +1145,9 @@ class DataSet(object):
           is sufficient (and preferable) if `randint` is derandomized.
         - A single successful running length is computed by adding
           uniformly randomly chosen running lengths until the first time a
-          successful one is chosen. In case of no successful run the
+          successful one is chosen, see `toolsstats.simulated_restarts`.
+          With ``randintrest=np.random.randint``, the restarts of all
+          samples are drawn at once. In case of no successful run the
           result is `None`.
 
         TODO: if `samplesize` >> `nbRuns` and nsuccesses is large,
@@ -1171,16 +1184,9 @@ class DataSet(object):
 
             # do the job
             indices = randintfirst(0, len(evals), samplesize)
-            sums = evals[indices]
-            failing = np.where(indices >= nsucc)[0]
             assert nsucc > 0  # prevent infinite loop
-            while len(failing):  # add "restarts"
-                indices = randintrest(0, len(evals), len(failing))
-                sums[failing] += evals[indices]
-                # keep failing indices
-                failing = [failing[i] for i in range(len(failing))
-                            if indices[i] >= nsucc]
-            res += [sorted(sums)]
+            res += [sorted(toolsstats.simulated_restarts(evals, nsucc, indices,
+                                                         randintrest))]
 
         assert set([len(evals) if evals is not None else samplesize
                 for evals in res]) == set([samplesize])
@@ -1610,65 +1616,108 @@ class DataSet(object):
 
         Details: uses attribute ``self.ert``.
         """
-        res = {}
-        _ert = self.ert  # for the side effect of correctly setting self._target
-        tmparray = numpy.vstack((self.target, _ert)).transpose()
-        it = reversed(tmparray)
-        # expect this array to be sorted by decreasing function values
+        return self._cached_result(('detERT', tuple(np.asarray(targets, dtype=float).tolist())),
+                                   lambda: self._detERT(targets))
 
-        prevline = numpy.array([-numpy.inf, numpy.inf])
-        try:
-            line = advance_iterator(it)
-        except StopIteration:
-            # evals is an empty array
+    def _detERT(self, targets):
+        """return `detERT` computed from ``self.ert``"""
+        _ert = self.ert  # for the side effect of correctly setting self._target
+        if not len(_ert):  # evals is an empty array
             return list()
-
-        for t in sorted(targets):
-            while line[0] <= t:
-                prevline = line
-                try:
-                    line = advance_iterator(it)
-                except StopIteration:
-                    break
-            res[t] = prevline.copy() # is copy necessary? Yes. 
-
+        # expect self.target to be sorted by decreasing function values,
+        # nb_lines is the number of lines with target <= t
+        nb_lines = np.searchsorted(np.asarray(self.target)[::-1],
+                                   np.asarray(targets, dtype=float), side='right')
         # Return a list of ERT corresponding to the input targets in
         # targets, sorted along targets
-        return list(res[i][1] for i in targets)
+        return list(np.where(nb_lines > 0, _ert[len(_ert) - np.maximum(nb_lines, 1)],
+                             np.inf))
 
     def detEvals(self, targets, copy=True, bootstrap=False, append_instances=False):
-        """return ``len(targets)`` data rows ``self.evals[i, 1:]``.
+        """return ``len(targets)`` data rows ``self.evals[i, 1:]`` as 2-D
+        `numpy.array` of shape ``(len(targets), self.nbRuns())``.
 
         Rows have the closest but not larger target such that
         ``self.evals[i, 0] <= target and self.evals[i - 1, 0] > target``,
         or in the "limit" cases the first data line or a line
         ``np.array(self.nbRuns() * [np.nan])``.
 
-        Makes by default a copy of the data, however this might change in
-        future.
-    """
-        evals = self.evals
+        The rows are found with `np.searchsorted` for all targets at once
+        and are always a copy of the data, `copy` is only kept for
+        backwards compatibility. Results are cached, see
+        `clear_results_cache`.
+
+        >>> import cocopp
+        >>> print('load data set'); dsl = cocopp.load('b/2009/bay')  # doctest:+ELLIPSIS
+        load data set...
+        >>> ds = dsl[99]
+        >>> evals = ds.detEvals([1e2, 1e-8, 1e-20])
+        >>> evals.shape == (3, ds.nbRuns())
+        True
+        >>> all(np.all(np.isnan(a) | (a == b))
+        ...     for a, b in zip(evals, ds._detEvals2([1e2, 1e-8, 1e-20])))
+        True
+        """
         if append_instances:  # TODO: add append_instances=True in toolstats line 709
             warnings.warn("append_instances was never thoroughly tested")
-            evals = self.evals_appended
-        evalsrows = {}  # data rows, easiest target first
-        idata = evals.shape[0] - 1  # current data line index
-        for target in sorted(targets):  # smallest most difficult target first
-            if evals[-1, 0] > target:  # last entry is worse than target
-                evalsrows[target] = np.array(self.nbRuns() * [np.nan])
-                continue
-            while idata > 0 and evals[idata - 1, 0] <= target:  # idata-1 line is good enough
-                idata -= 1  # move up
-            assert evals[idata, 0] <= target and (idata == 0 or evals[idata - 1, 0] > target)
-            evalsrows[target] = evals[idata, 1:].copy() if copy else evals[idata, 1:]
-        if do_assertion:
-            assert all([all((np.isnan(evalsrows[target]) + (evalsrows[target] == self._detEvals2(targets)[i])))
-                        for i, target in enumerate(targets)])
-        if bootstrap:
-            return [np.asarray(evalsrows[t])[np.random.randint(0,
-                                len(evalsrows[t]), len(evalsrows[t]))]
-                    for t in targets]
-        return [evalsrows[t] for t in targets]  # order w.r.t. input targets
+            res = self._detEvals(targets, self.evals_appended)
+        else:
+            res = self._cached_result(('detEvals', tuple(np.asarray(targets, dtype=float).tolist())),
+                                      lambda: self._detEvals(targets, self.evals))
+        if bootstrap:  # same random numbers as with one draw per target
+            return res[np.arange(len(res))[:, None],
+                       np.random.randint(0, res.shape[1], res.shape)]
+        return res  # order w.r.t. input targets
+
+    def _detEvals(self, targets, evals):
+        """return the `detEvals` rows of `evals` for `targets`"""
+        # evals[:, 0] is non-increasing, nb_lines is the number of lines
+        # with evals[i, 0] <= target, hence the line to return is the
+        # first of these lines
+        nb_lines = np.searchsorted(evals[::-1, 0], np.asarray(targets, dtype=float),
+                                   side='right')
+        res = np.nan * np.ones((len(nb_lines), evals.shape[1] - 1))
+        reached = nb_lines > 0  # otherwise the last entry is worse than target
+        res[reached] = evals[len(evals) - nb_lines[reached], 1:]
+        if do_assertion and evals is self.evals:
+            assert all([all((np.isnan(res[i]) + (res[i] == self._detEvals2(targets)[i])))
+                        for i in range(len(res))])
+        return res
+
+    def _cached_result(self, key, compute):
+        """return a copy of ``compute()`` which is cached under `key`.
+
+        The cache is kept until `evals` is replaced or
+        `clear_results_cache` is called. The least recently used results
+        are removed when the cache holds more than
+        `genericsettings.dataset_results_cache_size` values.
+        """
+        if not genericsettings.dataset_results_cache_size:
+            return compute()
+        cache = self.__dict__.get('_results_cache')
+        if cache is None or cache['evals'] is not self.evals:
+            cache = self._results_cache = {'evals': self.evals, 'size': 0,
+                                           'results': OrderedDict()}
+        results = cache['results']
+        if key in results:
+            results_cache_statistics['hits'] += 1
+            res = results.pop(key)  # reinsert as most recently used
+        else:
+            results_cache_statistics['misses'] += 1
+            res = compute()
+            cache['size'] += np.size(res)
+            while cache['size'] > genericsettings.dataset_results_cache_size and results:
+                cache['size'] -= np.size(results.popitem(last=False)[1])
+        results[key] = res
+        return res.copy() if isinstance(res, np.ndarray) else list(res)
+
+    def clear_results_cache(self):
+        """remove the cached results of `detEvals` and `detERT`.
+
+        The cache is also renewed when `evals` is replaced, however it
+        must be cleared when data in `evals` are changed in place.
+        """
+        self.__dict__.pop('_results_cache', None)
 
     def _number_of_better_runs(self, target, ref_eval):
         """return the number of ``self.evals(target)`` that are smaller
@@ -1836,6 +1885,58 @@ class DataSet(object):
         self._instance_multipliers_instancenumbers = tuple(self.instancenumbers)
         return self._instance_multipliers
 
+    @property
+    def funvals(self):
+        """data aligned by function evaluations, read from the :file:`tdat` files.
+
+        ``funvals[i][0]`` is a number of evaluations and ``funvals[i][1:]``
+        are the best function values in trial 1,... at this number of
+        evaluations. The :file:`tdat` files are read and aligned only when
+        `funvals` is accessed for the first time.
+        """
+        try:
+            return self._funvals
+        except AttributeError:
+            if 'funvals' in self.__dict__:  # unpickled from a previous version
+                self._funvals = self.__dict__.pop('funvals')
+                return self._funvals
+        funvals = self._read_funvals()
+        if funvals is None:
+            raise AttributeError("%s has no `funvals` data" % str(self))
+        self._funvals = funvals
+        return funvals
+
+    @funvals.setter
+    def funvals(self, funvals):
+        self._funvals = funvals
+
+    def _read_funvals(self):
+        """return `funvals` aligned from the data files in `_funvals_sources`,
+        or `None` if they contain no data.
+
+        Several sources come from merged data sets and are aligned in
+        the order of merging.
+        """
+        funvals = None
+        current_data_format = dataformatsettings.current_data_format
+        try:
+            for folder, files, idx_to_load, data_format in self._funvals_sources:
+                dataformatsettings.current_data_format = \
+                    dataformatsettings.data_format_name_to_class_mapping[data_format]()
+                datasets = split([os.path.join(folder, i) for i in files],
+                                 idx_to_load=idx_to_load)[0]
+                if not datasets:
+                    continue
+                data = align_data(VMultiReader(datasets),
+                                  dataformatsettings.current_data_format.evaluation_idx,
+                                  dataformatsettings.current_data_format.function_value_idx,
+                                  )[0]
+                funvals = data if funvals is None else alignArrayData(
+                                        VArrayMultiReader([funvals, data]))
+        finally:
+            dataformatsettings.current_data_format = current_data_format
+        return funvals
+
     @property
     def _instance_repetitions(self):  # -> int
         """return the number of runs that repeated a previous instance.
@@ -2121,51 +2222,539 @@ class DataSet(object):
         plt.grid(True)
         return plt.gca()  # not sure which makes most sense
 
-def get_DataSetList(*args, **kwargs):
-    """try to load pickle file or fall back to `DataSetList` constructor.
+dataset_cache_format_version = 3
+"""version of the cache files written by `save_cached_datasets`, cache
+   files with a different version are ignored"""
+
+_cocopp_version = pkg_resources.require('cocopp')[0].version
+"""version of `cocopp`, cache files written by another version are
+   ignored, see `_dataset_cache_settings`"""
 
-    Also write pickle file if reading failed. Global side effect:
-    `testbedsettings.load_current_testbed` is called as it is in
-    `DataSet.__init__`.
 
-    `args[0]` is expected to be either a `list` with one element which is a
-    repository filetype name or the name itself. Otherwise, the fallback is
-    executed.
+def _dataset_cache_filename(index_file):
+    """return the name of the cache file for `index_file` or `None`"""
+    if not genericsettings.dataset_cache_folder:
+        return None
+    index_file = os.path.abspath(index_file)
+    key = hashlib.sha1(index_file.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(os.path.expanduser(genericsettings.dataset_cache_folder),
+                        os.path.splitext(os.path.basename(index_file))[0]
+                        + '_' + key + '.npz')
+
+
+def _dataset_cache_sources(index_file, datasets):
+    """return a list of ``[absolute_filename, mtime, size]`` of all files the
+    `datasets` were parsed from, ``mtime, size == None, None`` for missing files.
     """
-    extension = '.pickle'
-    def fallback():
-        return DataSetList(*args, **kwargs)
-    if len(args) != 1 or len(kwargs) or sys.version_info[0] < 3:
-        return fallback()
-    arg1 = args[0]
-    if isinstance(arg1, string_types):
-        arg1 = [arg1]
-    if (len(args) != 1 or
-        not isinstance(arg1[0], string_types) or
-        not findfiles.is_recognized_repository_filetype(arg1[0])):
-        return fallback()
-    try: import pickle
-    except: return fallback()
-    name = arg1[0] + extension
-    if os.path.exists(name) and os.path.getmtime(name) > os.path.getmtime(arg1[0]):
+    index_file = os.path.abspath(index_file)
+    names = [index_file]
+    folder = os.path.split(index_file)[0]
+    for ds in datasets:
+        for name in ds.dataFiles:
+            for ext in ('.dat', '.tdat', binary_data_extension):
+                name_ext = os.path.join(folder, os.path.splitext(name)[0] + ext)
+                if name_ext not in names:
+                    names.append(name_ext)
+    res = []
+    for name in names:
         try:
-            with open(name, "rb") as f:
-                dsl = pickle.load(f)
-        except: pass
+            stat = os.stat(name)
+        except OSError:
+            res.append([name, None, None])
+        else:
+            res.append([name, stat.st_mtime, stat.st_size])
+    return res
+
+
+def _dataset_cache_settings(testbed=None):
+    """return the settings which change the result of parsing the data,
+    including the `cocopp` version, for the current testbed if `testbed`
+    is `None`"""
+    if testbed is None:
+        testbed = testbedsettings.current_testbed
+    return {'format': dataset_cache_format_version,
+            'cocopp': _cocopp_version,
+            'testbed': type(testbed).__name__ if testbed else None,
+            'instancesOfInterest': list(getattr(testbed, 'instancesOfInterest', None) or []),
+            'weight_evaluations_constraints': list(genericsettings.weight_evaluations_constraints),
+            }
+
+
+def _json_encodable(value):
+    """return `value` serializable for `json.dumps`, where tuples and
+    dicts become JSON objects which `_json_object_hook` converts back and
+    numpy scalars become Python scalars"""
+    if isinstance(value, tuple):
+        return {'__tuple__': [_json_encodable(v) for v in value]}
+    if isinstance(value, list):
+        return [_json_encodable(v) for v in value]
+    if isinstance(value, dict):
+        return {'__dict_items__': [[_json_encodable(k), _json_encodable(v)]
+                                   for k, v in value.items()]}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _json_object_hook(value):
+    """reverse the conversion of tuples and dicts by `_json_encodable`
+    in `json.loads`"""
+    if '__tuple__' in value:
+        return tuple(value['__tuple__'])
+    if '__dict_items__' in value:
+        return dict((k, v) for k, v in value['__dict_items__'])
+    return value
+
+
+def _dataset_to_arrays(ds, prefix):
+    """return a `dict` of arrays from `DataSet` `ds` to be saved with `numpy.savez`.
+
+    Array attributes, like ``_evals``, ``funvals``, ``_maxevals``, or
+    ``finalfunvals``, and lists of arrays are saved as raw arrays, as well
+    as ``instancenumbers``. All other attributes, mainly from the header
+    line, are saved as JSON string in array ``prefix + 'attributes'``,
+    where tuples and dicts keep their type, see `_json_encodable`.
+    """
+    arrays = {prefix + 'instancenumbers': np.asarray(ds.instancenumbers, dtype=int)}
+    attributes = {}
+    array_lists = {}
+    for name, value in ds.__dict__.items():
+        if name in ('instancenumbers', '_results_cache'):
+            continue
+        if isinstance(value, np.ndarray):
+            arrays[prefix + 'array_' + name] = value
+        elif (isinstance(value, list) and len(value) and
+              all(isinstance(v, np.ndarray) and v.shape == value[0].shape
+                  for v in value)):
+            array_lists[name] = len(value)  # saved as a single stacked array
+            arrays[prefix + 'list_' + name] = np.asarray(value)
         else:
-            if isinstance(dsl, DataSetList):  # found valid pickle file
-                # to be compatible with DataSet.__init__:
-                if not testbedsettings.current_testbed:
-                    testbedsettings.load_current_testbed(dsl[0].suite_name, TargetValues)
-                print("  using pickled DataSetList", end=' ')  # remove when all went well for a while?
-                return dsl
-    dsl = fallback()
+            attributes[name] = _json_encodable(value)
+    attributes['__array_lists__'] = array_lists
+    arrays[prefix + 'attributes'] = np.array(json.dumps(attributes))
+    return arrays
+
+
+def _dataset_from_arrays(arrays, prefix):
+    """return a `DataSet` from the `arrays` written by `_dataset_to_arrays`"""
+    ds = DataSet.__new__(DataSet)
+    attributes = json.loads(str(arrays[prefix + 'attributes']),
+                            object_hook=_json_object_hook)
+    for name in attributes.pop('__array_lists__'):
+        setattr(ds, name, list(arrays[prefix + 'list_' + name]))
+    for name, value in attributes.items():
+        setattr(ds, name, value)
+    for key in arrays.files:
+        if key.startswith(prefix + 'array_'):
+            setattr(ds, key[len(prefix + 'array_'):], arrays[key])
+    ds.instancenumbers = [int(i) for i in arrays[prefix + 'instancenumbers']]
+    return ds
+
+
+def save_cached_datasets(index_file, datasets):
+    """save the `DataSet` instances parsed from `index_file` into a cache file.
+
+    The cache is a single uncompressed :file:`npz` file in folder
+    `genericsettings.dataset_cache_folder` which contains the data arrays
+    of each `DataSet` and, as JSON strings, the remaining attributes and
+    the name, modification time and size of all source files. Return the
+    cache file name or `None` if nothing was written.
+
+    When the cache files take more than
+    `genericsettings.dataset_cache_max_size` bytes, the least recently
+    used ones are removed, see `_evict_cached_datasets`.
+    """
+    filename = _dataset_cache_filename(index_file)
+    if filename is None:
+        return None
+    arrays = {'sources': np.array(json.dumps(_dataset_cache_sources(index_file, datasets))),
+              'settings': np.array(json.dumps(_dataset_cache_settings())),
+              'number_of_datasets': np.array(len(datasets))}
     try:
-        with open(name, "wb") as f:
-            pickle.dump(dsl, f)
+        for i, ds in enumerate(datasets):
+            arrays.update(_dataset_to_arrays(ds, 'ds%d_' % i))
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        tmp_filename = filename[:-4] + '_%d.tmp.npz' % os.getpid()
+        np.savez(tmp_filename, **arrays)
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rename(tmp_filename, filename)
     except Exception as e:
-        warnings.warn("could not write pickle file {}: {}".format(name, e))
-    return dsl
+        warnings.warn("could not write dataset cache file {}: {}".format(filename, e))
+        return None
+    _evict_cached_datasets(os.path.dirname(filename), filename)
+    return filename
+
+
+def _evict_cached_datasets(folder, keep=None):
+    """remove the least recently used cache files in `folder` until they
+    take at most `genericsettings.dataset_cache_max_size` bytes, but not
+    the file `keep`.
+
+    The modification time of a cache file is its last use, because
+    `load_cached_datasets` updates it.
+    """
+    if genericsettings.dataset_cache_max_size is None:
+        return
+    files = []
+    for name in os.listdir(folder):
+        if name.endswith('.npz') and not name.endswith('.tmp.npz'):
+            name = os.path.join(folder, name)
+            try:
+                stat = os.stat(name)
+            except OSError:  # removed by another process
+                continue
+            files.append((stat.st_mtime, stat.st_size, name))
+    size = 0
+    for _mtime, file_size, name in sorted(files, reverse=True):
+        size += file_size
+        if size > genericsettings.dataset_cache_max_size and name != keep:
+            try:
+                os.remove(name)
+            except OSError:
+                pass
+
+
+def load_cached_datasets(index_file):
+    """return the list of `DataSet` instances of `index_file` from the cache,
+
+    or `None` if the cache file does not exist or is outdated, because a
+    source file or a setting relevant for parsing has changed since the
+    cache was written.
+
+    Like `DataSet.__init__`, `testbedsettings.current_testbed` and
+    `dataformatsettings.current_data_format` are set as side effect of
+    a valid cache file.
+    """
+    filename = _dataset_cache_filename(index_file)
+    if filename is None or not os.path.isfile(filename):
+        return None
+    try:
+        with np.load(filename, allow_pickle=False) as arrays:
+            sources = json.loads(str(arrays['sources']))
+            if not sources or sources[0][0] != os.path.abspath(index_file):
+                return None
+            for name, mtime, size in sources:
+                try:
+                    stat = os.stat(name)
+                except OSError:
+                    if mtime is not None:
+                        return None
+                else:
+                    if [mtime, size] != [stat.st_mtime, stat.st_size]:
+                        return None
+            datasets = [_dataset_from_arrays(arrays, 'ds%d_' % i)
+                        for i in range(int(arrays['number_of_datasets']))]
+            settings = json.loads(str(arrays['settings']))
+    except Exception as e:
+        warnings.warn("could not read dataset cache file {}: {}".format(filename, e))
+        return None
+    testbed = testbedsettings.current_testbed
+    if datasets and not testbed:  # the testbed `_set_current_settings` would load
+        testbed = testbedsettings.SuiteClass(datasets[0].suite_name)(TargetValues)
+    if settings != _dataset_cache_settings(testbed):
+        return None
+    try:
+        os.utime(filename, None)  # mark as recently used for `_evict_cached_datasets`
+    except OSError:
+        pass
+    for ds in datasets:
+        ds.indexFiles = [index_file]  # may be given relative to a different folder
+    _set_current_settings(datasets)
+    folder = os.path.split(os.path.abspath(index_file))[0]
+    for ds in datasets:
+        ds._funvals_sources = [[folder] + source[1:] for source in ds._funvals_sources]
+    if genericsettings.verbose:
+        print('Loaded %d data sets of %s from %s.' % (len(datasets), index_file, filename))
+    return datasets
+
+
+summary_format_version = 1
+"""version of the summary files written by `save_summary`, summary files
+   with a different version are recreated"""
+
+
+def summary_filename(data_path):
+    """return the name of the summary file of the data in `data_path`,
+    a hidden file next to `data_path`"""
+    folder, name = os.path.split(os.path.abspath(data_path.rstrip(os.sep)))
+    return os.path.join(folder, genericsettings.summary_file_prefix + name + '.npz')
+
+
+def is_summary_file(filename):
+    """return `True` if `filename` is named like a summary file"""
+    return (os.path.basename(filename).startswith(genericsettings.summary_file_prefix)
+            and filename.endswith('.npz'))
+
+
+def summary_target_values(fun_dim):
+    """return the sorted target values of all target sets of the current
+    testbed for ``fun_dim == (funcId, dim)``.
+
+    These are the target values of the attributes ending with
+    ``target_values`` or ``targetsOfInterest`` and the single targets
+    ending with ``ftarget`` or ``min_target``.
+    """
+    values = []
+    for name, value in sorted(vars(testbedsettings.current_testbed).items()):
+        if name.endswith(('target_values', 'targetsOfInterest')) and callable(value):
+            values.extend(value(fun_dim))
+        elif name.endswith(('ftarget', 'min_target')) and isinstance(value, (int, float)):
+            values.append(value)
+    return np.unique(np.asarray(values, dtype=float))
+
+
+def summarize_dataset(ds):
+    """return a copy of `DataSet` `ds` which keeps only the rows of `evals`
+    that `DataSet.detEvals` returns for the `summary_target_values`.
+
+    For these targets, `DataSet.detEvals` and `DataSet.detERT` of the copy
+    give the same results as of `ds`, for any other target the results
+    of the next smaller of these targets. The copy has no `funvals`.
+
+    >>> import cocopp
+    >>> print('load data set'); dsl = cocopp.load('b/2009/bay')  # doctest:+ELLIPSIS,+SKIP
+    load data set...
+    >>> ds = dsl[99]  # doctest:+SKIP
+    >>> targets = cocopp.pproc.summary_target_values((ds.funcId, ds.dim))  # doctest:+SKIP
+    >>> summary = cocopp.pproc.summarize_dataset(ds)  # doctest:+SKIP
+    >>> len(summary.evals) <= len(targets)  # doctest:+SKIP
+    True
+    >>> np.all(np.isnan(summary.detEvals(targets)) |  # doctest:+SKIP
+    ...        (summary.detEvals(targets) == ds.detEvals(targets)))
+    True
+    """
+    res = DataSet.__new__(DataSet)
+    res.__dict__.update((name, value) for name, value in ds.__dict__.items()
+                        if not name.startswith(('_evals', '_ert', '_target', '_results_cache',
+                                                '_funvals', 'funvals', '_maxevals_appended')))
+    evals = ds._evals
+    nb_lines = np.searchsorted(evals[::-1, 0], summary_target_values((ds.funcId, ds.dim)),
+                               side='right')
+    res._evals = evals[np.unique(len(evals) - nb_lines[nb_lines > 0])]
+    res._funvals_sources = []
+    return res
+
+
+def _summary_settings():
+    """return the settings which change the content of a summary file"""
+    return {'format': summary_format_version,
+            'weight_evaluations_constraints': list(genericsettings.weight_evaluations_constraints),
+            'runlength_based_targets': genericsettings.runlength_based_targets,
+            'isExpensive': genericsettings.isExpensive,
+            }
+
+
+def save_summary(data_path, filename=None):
+    """save the `summarize_dataset` summaries of all data sets in
+    `data_path` into `filename` and return `filename`.
+
+    `filename` defaults to `summary_filename` ``(data_path)``. Like the
+    dataset cache, the summary is an uncompressed :file:`npz` file which
+    also contains the modification time and size of `data_path` and the
+    settings under which it was created, see `load_summary`.
+    """
+    if filename is None:
+        filename = summary_filename(data_path)
+    stat = os.stat(data_path)
+    datasets = DataSetList(data_path)
+    arrays = {'sources': np.array(json.dumps([[os.path.abspath(data_path),
+                                               stat.st_mtime, stat.st_size]])),
+              'settings': np.array(json.dumps(_summary_settings())),
+              'number_of_datasets': np.array(len(datasets))}
+    for i, ds in enumerate(datasets):
+        arrays.update(_dataset_to_arrays(summarize_dataset(ds), 'ds%d_' % i))
+    tmp_filename = filename[:-4] + '_%d.tmp.npz' % os.getpid()
+    np.savez(tmp_filename, **arrays)
+    if os.path.exists(filename):
+        os.remove(filename)
+    os.rename(tmp_filename, filename)
+    return filename
+
+
+def is_current_summary(filename):
+    """return `True` if the summary file `filename` exists and its data
+    path and the relevant settings did not change since it was written"""
+    if not os.path.isfile(filename):
+        return False
+    try:
+        with np.load(filename, allow_pickle=False) as arrays:
+            sources = json.loads(str(arrays['sources']))
+            settings = json.loads(str(arrays['settings']))
+    except Exception:
+        return False
+    for name, mtime, size in sources:
+        try:
+            stat = os.stat(name)
+        except OSError:
+            return False
+        if [mtime, size] != [stat.st_mtime, stat.st_size]:
+            return False
+    return settings == _summary_settings()
+
+
+def load_summary(filename):
+    """return the list of `DataSet` summaries from the summary file
+    `filename` written by `save_summary`.
+
+    Like `DataSet.__init__`, `testbedsettings.current_testbed` and
+    `dataformatsettings.current_data_format` are set as side effect.
+    """
+    with np.load(filename, allow_pickle=False) as arrays:
+        datasets = [_dataset_from_arrays(arrays, 'ds%d_' % i)
+                    for i in range(int(arrays['number_of_datasets']))]
+    _set_current_settings(datasets)
+    if genericsettings.verbose:
+        print('Loaded %d data set summaries from %s.' % (len(datasets), filename))
+    return datasets
+
+
+def read_index_file(index_file):
+    """return the list of `DataSet` instances read from `index_file`
+
+    and the data files referenced therein. Data are loaded from the
+    dataset cache if possible and otherwise parsed and written to the
+    cache. An empty list is returned if `index_file` cannot be read.
+
+    Files in an archive registered by `findfiles.main` are not cached
+    and entries with deselected data files are skipped, see
+    `findfiles.ArchiveIndex`.
+    """
+    in_archive = findfiles.archive_member(index_file)[0] is not None
+    datasets = None if in_archive else load_cached_datasets(index_file)
+    if datasets is not None:
+        return datasets
+    datasets = []
+    try:
+        with openfile(index_file, errors='replace') as f:  # strange chars in names may cause errors
+            if genericsettings.verbose:
+                print('Processing %s.' % index_file)
+
+            # Read all data sets within one index file.
+            nbLine = 1
+            data_file_names = []
+            header = ''
+            while True:
+                try:
+                    if 'indicator' not in header:
+                        header = advance_iterator(f)
+                        while not header.strip(): # remove blank lines
+                            header = advance_iterator(f)
+                            nbLine += 1
+                        comment = advance_iterator(f)
+                        if not comment.startswith('%'):
+                            warnings.warn('Entry in file %s at line %d is faulty: '
+                                        % (index_file, nbLine) +
+                                        'it will be skipped.')
+                            nbLine += 2
+                            continue
+
+                    data = advance_iterator(f)  # this is the filename of the data file!?
+                    data_file_names.append(data)
+                    nbLine += 3
+                    if in_archive and not _is_selected_entry(index_file, data):
+                        continue
+                    #TODO: check that something is not wrong with the 3 lines.
+                    datasets.append(DataSet(header, comment, data, index_file))
+                except StopIteration:
+                    break
+        if not in_archive:
+            save_cached_datasets(index_file, datasets)
+        if len(data_file_names) != len(set(data_file_names)):
+            warnings.warn("WARNING: a data file has been referenced" +
+                " several times in file %s:" % index_file)
+            data_file_names = sorted(data_file_names)
+            for i in range(1, len(data_file_names)):
+                if data_file_names[i-1] == data_file_names[i]:
+                    warnings.warn("    data file " + data_file_names[i])
+            warnings.warn("  This is likely to produce spurious results.")
+
+    except IOError as e:
+        print('Could not load "%s".' % index_file)
+        print('I/O error(%s): %s' % (e.errno, e.strerror))
+    return datasets
+
+
+def _is_selected_entry(index_file, data):
+    """return `False` if all data files in the data line `data` of an
+    `index_file` entry are deselected, see `findfiles.is_selected`"""
+    folder = os.path.split(index_file)[0]
+    names = [name.strip() for name in data.split(', ') if name.strip().endswith('dat')]
+    return not names or any(findfiles.is_selected(os.path.join(
+                                folder, name.replace('\\', os.sep).replace('/', os.sep)))
+                            for name in names)
+
+
+def _set_current_settings(datasets):
+    """set the current testbed and data format like `DataSet.__init__`
+    would do when reading `datasets`"""
+    if datasets:
+        if not testbedsettings.current_testbed:
+            testbedsettings.load_current_testbed(datasets[0].suite_name, TargetValues)
+        dataformatsettings.current_data_format = \
+            dataformatsettings.data_format_name_to_class_mapping[datasets[-1].get_data_format()]()
+
+
+def _picklable_settings():
+    """return the `genericsettings` values to be passed to a worker
+    process"""
+    return dict((key, val) for key, val in vars(genericsettings).items()
+                if not key.startswith('_') and isinstance(
+                    val, (bool, int, float, string_types, tuple, list, dict, type(None))))
+
+
+def _init_reading_process(settings, testbed, archive_indices):
+    """initialize a worker process of `read_index_files` with the
+    `genericsettings`, the testbed and the archives of the parent process"""
+    for key, val in settings.items():
+        setattr(genericsettings, key, val)
+    testbedsettings.current_testbed = testbed
+    findfiles._archive_indices.update(archive_indices)
+
+
+@profiling.profiled('read_index_files')
+def read_index_files(index_files, workers):
+    """return a list with the result of `read_index_file` for each of
+    `index_files`, read with `workers` parallel processes.
+
+    The result is the same as ``[read_index_file(f) for f in index_files]``:
+    the first file is read in the current process to set the testbed,
+    like `DataSet.__init__` does, before it is passed to the worker
+    processes together with `genericsettings`. The order of
+    `index_files` is preserved and the current testbed and data format
+    are set as if the files were read sequentially.
+    """
+    if not len(index_files):
+        return []
+    res = [read_index_file(index_files[0])]
+    if len(index_files) > 1 and workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(min((workers, len(index_files) - 1)),
+                                    _init_reading_process,
+                                    (_picklable_settings(), testbedsettings.current_testbed,
+                                     findfiles._archive_indices))
+        try:
+            res += pool.map(read_index_file, index_files[1:], chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+        for datasets in res:
+            _set_current_settings(datasets)
+    else:
+        res += [read_index_file(f) for f in index_files[1:]]
+    return res
+
+
+def get_DataSetList(*args, **kwargs):
+    """return ``DataSetList(*args, **kwargs)``.
+
+    Formerly, a pickle file of the entire `DataSetList` was written next to
+    the archive given in `args[0]` and loaded on the next call. Now each
+    index file is cached separately by `DataSetList` in a version-robust
+    format, see `save_cached_datasets` and `load_cached_datasets`.
+    """
+    return DataSetList(*args, **kwargs)
 
 class DataSetList(list):
     """List of instances of :py:class:`DataSet`.
@@ -2179,13 +2768,18 @@ class DataSetList(list):
     #Do not inherit from set because DataSet instances are mutable which means
     #they might change over time.
 
-    def __init__(self, args=[], check_data_type=True):
+    def __init__(self, args=[], check_data_type=True, workers=None):
         """Instantiate self from a list of folder- or filenames or 
         ``DataSet`` instances.
 
         :keyword list args: strings being either info file names, folder
-                            containing info files or pickled data files,
-                            or a list of DataSets.
+                            containing info files, pickled data files or
+                            summary files, see `save_summary`, or a list
+                            of DataSets.
+        :keyword int workers: number of processes to read the info files
+                              with, `genericsettings.number_of_jobs` if
+                              `None`. The result does not depend on
+                              `workers`.
 
         Exceptions:
         Warning -- Unexpected user input.
@@ -2216,19 +2810,31 @@ class DataSetList(list):
         fnames = []
         alg_names = []
         for name in args:
-            if isinstance(name, string_types) and findfiles.is_recognized_repository_filetype(name):
+            if isinstance(name, string_types) and is_summary_file(name):
+                fnames.extend(load_summary(name))
+            elif isinstance(name, string_types) and findfiles.is_recognized_repository_filetype(name):
                 # the found names may not at all reflect name anymore
-                fnames.extend(findfiles.main(name))
+                fnames.extend(findfiles.main(name, genericsettings.archive_functions,
+                                             genericsettings.archive_dimensions))
             else:
                 fnames.append(name)
             alg_names.extend((len(fnames) - len(alg_names)) * [name])
         assert len(fnames) == len(alg_names)
+        if workers is None:
+            workers = genericsettings.number_of_jobs
+        index_files = [name for name in fnames
+                       if isinstance(name, string_types) and name.endswith('.info')]
+        read_datasets = {}
+        if workers > 1 and len(index_files) > 1:
+            # an index file given twice is read again below, as without workers
+            index_files = list(OrderedDict.fromkeys(index_files))
+            read_datasets = dict(zip(index_files, read_index_files(index_files, workers)))
         for name, alg_name in zip(fnames, alg_names): 
             if isinstance(name, DataSet):
                 self.append(name)
                 # we could check here whether name.algId and alg_name are similar or consistent
             elif name.endswith('.info'):
-                self.processIndexFile(name, alg_name)
+                self.processIndexFile(name, alg_name, read_datasets.pop(name, None))
             elif name.endswith('.pickle') or name.endswith('.pickle.gz'):
                 try:
                     # cocofy(name)
@@ -2269,8 +2875,12 @@ class DataSetList(list):
             if genericsettings.warning_level >= 1:
                 print("  Data consistent according to consistency_check() in pproc.DataSet")
             
-    def processIndexFile(self, indexFile, alg_name=None):
-        """Reads in an index (.info?) file information on the different runs."""
+    def processIndexFile(self, indexFile, alg_name=None, datasets=None):
+        """Reads in an index (.info?) file information on the different runs.
+
+        `datasets` are the `DataSet` instances already read from
+        `indexFile` with `read_index_file`, e.g. in another process.
+        """
 
         if alg_name.endswith('.info'):
             alg_name = None
@@ -2290,53 +2900,17 @@ class DataSetList(list):
                 alg_name = alg_name.replace('noiseless', '').rstrip('_').rstrip()
             if 11 < 3:  # would break searching of algId in archives
                 alg_name = toolsdivers.str_to_latex(alg_name)  # not really necessary but ' ' seems nicer than '_'
-        try:
-            with openfile(indexFile, errors='replace') as f:  # strange chars in names may cause errors
-                if genericsettings.verbose:
-                    print('Processing %s.' % indexFile)
-
-                # Read all data sets within one index file.
-                nbLine = 1
-                data_file_names = []
-                header = ''
-                while True:
-                    try:
-                        if 'indicator' not in header:
-                            header = advance_iterator(f)
-                            while not header.strip(): # remove blank lines
-                                header = advance_iterator(f)
-                                nbLine += 1
-                            comment = advance_iterator(f)
-                            if not comment.startswith('%'):
-                                warnings.warn('Entry in file %s at line %d is faulty: '
-                                            % (indexFile, nbLine) +
-                                            'it will be skipped.')
-                                nbLine += 2
-                                continue
-
-                        data = advance_iterator(f)  # this is the filename of the data file!?
-                        data_file_names.append(data)
-                        nbLine += 3
-                        #TODO: check that something is not wrong with the 3 lines.
-                        ds = DataSet(header, comment, data, indexFile)
-                        if alg_name is not None:
-                            ds.algId = alg_name
-                        if len(ds.instancenumbers) > 0:                    
-                            self.append(ds)
-                    except StopIteration:
-                        break
-            if len(data_file_names) != len(set(data_file_names)):
-                warnings.warn("WARNING: a data file has been referenced" +
-                    " several times in file %s:" % indexFile)
-                data_file_names = sorted(data_file_names)
-                for i in range(1, len(data_file_names)):
-                    if data_file_names[i-1] == data_file_names[i]:
-                        warnings.warn("    data file " + data_file_names[i])
-                warnings.warn("  This is likely to produce spurious results.")
-
-        except IOError as e:
-            print('Could not load "%s".' % indexFile)
-            print('I/O error(%s): %s' % (e.errno, e.strerror))
+        if datasets is None:
+            datasets = read_index_file(indexFile)
+        self._append_parsed_datasets(datasets, alg_name)
+
+    def _append_parsed_datasets(self, datasets, alg_name=None):
+        """append `DataSet` instances freshly read from an index file"""
+        for ds in datasets:
+            if alg_name is not None:
+                ds.algId = alg_name
+            if len(ds.instancenumbers) > 0:
+                self.append(ds)
 
     def append(self, o, check_data_type=False):
         """Redefines the append method to check for unicity."""
@@ -2368,7 +2942,11 @@ class DataSetList(list):
                 if 1 < 3:
                     i.dataFiles.extend(o.dataFiles)
                     i.indexFiles.extend(o.indexFiles)
-                    i.funvals = alignArrayData(VArrayMultiReader([i.funvals, o.funvals]))
+                    if any('_funvals' in ds.__dict__ or 'funvals' in ds.__dict__
+                           or getattr(ds, '_funvals_sources', None) is None
+                           for ds in (i, o)):  # funvals read already or by a previous version
+                        i.funvals = alignArrayData(VArrayMultiReader([i.funvals, o.funvals]))
+                    # else `funvals` are read from the `_funvals_sources` of both, extended below
                     i.finalfunvals = numpy.r_[i.finalfunvals, o.finalfunvals]
                     i._evals = alignArrayData(HArrayMultiReader([i._evals, o._evals]))
                     i._maxevals = numpy.r_[i._maxevals, o._maxevals]
@@ -2378,7 +2956,9 @@ class DataSetList(list):
                         i.modsFromPickleVersion = True
 
                     for name in i.__dict__:  # was: dir(i) which catches all properties
-                        if isinstance(getattr(i, name), list):
+                        if name == '_funvals_sources':  # missing in previous versions
+                            i._funvals_sources.extend(getattr(o, name, None) or [])
+                        elif isinstance(getattr(i, name), list):
                             getattr(i, name).extend(getattr(o, name))
 
                 else:
@@ -2941,6 +3521,48 @@ class DataSetList(list):
             return rld_dict.values()[0], left_envelope
         return rld_dict, left_envelope
 
+    def det_evals(self, target_values, append_instances=False):
+        """return the evaluations to reach `target_values` of all data
+        sets in a single array of shape ``(len(self), len(targets), n)``.
+
+        `target_values` is a list of target values or a callable, like a
+        `TargetValues` instance, which returns the list of target values
+        given a ``(funcId, dim)`` tuple. All lists must have the same
+        length. ``res[i]`` is ``self[i].detEvals(targets)``, where ``n``
+        is the largest ``nbRuns()`` over all data sets and rows of data
+        sets with fewer runs are padded with `nan`. If `self` is empty,
+        the shape is ``(0, len(target_values), 0)``, or ``(0, 0, 0)`` for
+        a callable `target_values`.
+
+        Example
+        -------
+        Get the number of successful trials of all data sets for each
+        target of the current testbed::
+
+            targets = cocopp.testbedsettings.current_testbed.pprldmany_target_values
+            successes = np.sum(np.isfinite(dsl.det_evals(targets)), axis=-1)
+
+        """
+        if callable(target_values):
+            evals = [ds.detEvals(target_values((ds.funcId, ds.dim)),
+                                 append_instances=append_instances)
+                     for ds in self]
+        else:
+            evals = [ds.detEvals(target_values, append_instances=append_instances)
+                     for ds in self]
+        if len(set(len(e) for e in evals)) > 1:
+            raise ValueError("number of target values differ between data sets: %s"
+                             % str(sorted(set(len(e) for e in evals))))
+        if evals:
+            number_of_targets = len(evals[0])
+        else:  # the number of targets of a callable is unknown without data sets
+            number_of_targets = 0 if callable(target_values) else len(target_values)
+        res = np.nan * np.ones((len(evals), number_of_targets,
+                                max([e.shape[1] for e in evals] or [0])))
+        for i, e in enumerate(evals):
+            res[i, :, :e.shape[1]] = e
+        return res
+
     def get_all_data_lines(self, target_value, fct, dim):
         """return a list of all data lines in ``self`` for each
         algorithm and a list of the respective
@@ -3229,6 +3851,7 @@ def set_unique_algId(ds_list, ds_list_reference, taken_ids=None):
             ds.algId = algId + ' ' + str(i)
 
 
+@profiling.profiled('processInputArgs')
 def processInputArgs(args, process_background_algorithms=False):
     """Process command line arguments.
 
@@ -3278,9 +3901,10 @@ def process_arguments(args, current_hash, dictAlg, dsList, sortedAlgs):
         alg = alg.strip().rstrip(os.path.sep)  # lstrip would not be the same folder anymore
         if alg == '':  # might cure an lf+cr problem when using cywin under Windows
             continue
-        if findfiles.is_recognized_repository_filetype(alg):
+        if is_summary_file(alg) or findfiles.is_recognized_repository_filetype(alg):
             if 11 < 3:
-                filelist = findfiles.main(alg)  # this destroys name information
+                filelist = findfiles.main(alg, genericsettings.archive_functions,
+                                          genericsettings.archive_dimensions)  # this destroys name information
                 tmpDsList = DataSetList(filelist)  # DataSetList calls findfiles.main anyway
                 # Do here any sorting or filtering necessary.
                 # filelist = list(i for i in filelist if i.count('ppdata_f005'))
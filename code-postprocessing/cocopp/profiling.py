@@ -0,0 +1,182 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Record run times, call counts and peak memory of post-processing
+stages.
+
+With `genericsettings.profile` set (with the ``--profile`` option),
+every stage, like loading the data, a function like `toolsstats.draw`
+or an output module like `pptable`, adds its wall time and its number
+of calls to `statistics`. Stages are either functions decorated with
+`profiled` or code blocks::
+
+    with profiling.stage('loading'):
+        dsList = pproc.DataSetList(args)
+
+The `buildmanifest.Build` steps, i.e. the output modules in
+`rungeneric1` and `rungenericmany`, are recorded as stages too. Times
+of nested stages are included in the time of the enclosing stage and
+only the main process is recorded, not the processes of the ``--jobs``
+option. Peak memory is the peak resident set size of the process at
+the end of the stage, its increase is the increase during the stage.
+
+`save_report` writes the statistics as JSON file and `summary` returns
+them as a table. When `genericsettings.profile` is not set, a decorated
+function only checks the setting.
+
+>>> from cocopp import genericsettings, profiling
+>>> genericsettings.profile = True
+>>> for i in range(3):
+...     with profiling.stage('doctest stage'):
+...         _ = sum(range(1000))
+>>> profiling.statistics['doctest stage']['calls']
+3
+>>> profiling.summary().splitlines()[1].split()[:3]
+['doctest', 'stage', '3']
+>>> genericsettings.profile = False
+>>> profiling.reset()
+
+"""
+
+from __future__ import absolute_import, division, print_function
+import sys
+import time
+import json
+import functools
+import threading
+from . import genericsettings
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+statistics = {}
+"""`dict` of stage name -> `dict` with the keys ``'calls'``, ``'time'``
+   (wall time in seconds), ``'peak memory'`` and ``'memory increase'``
+   (in MB)"""
+report_file_name = 'cocopp_profile.json'
+"""name of the JSON report in the output folder"""
+_statistics_lock = threading.Lock()  # stages may end in background threads
+_running = {}  # (stage name, thread id) -> list of (start time, start peak memory)
+
+
+def peak_memory():
+    """return the peak resident set size of the process in MB or `None`"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10  # bytes or KB
+
+
+def reset():
+    """remove all recorded statistics"""
+    with _statistics_lock:
+        statistics.clear()
+        _running.clear()
+
+
+def start(name):
+    """start the stage `name`, which is finished with `stop`"""
+    if not genericsettings.profile:
+        return
+    key = (name, threading.current_thread().ident)
+    with _statistics_lock:
+        _running.setdefault(key, []).append((time.time(), peak_memory()))
+
+
+def stop(name):
+    """finish the stage `name` and record its time, number of calls and
+    memory"""
+    if not genericsettings.profile:
+        return
+    t1, memory = time.time(), peak_memory()
+    key = (name, threading.current_thread().ident)
+    with _statistics_lock:
+        try:
+            t0, memory0 = _running[key].pop()
+        except (KeyError, IndexError):  # profiling was switched on in the stage
+            return
+        entry = statistics.setdefault(name, {'calls': 0, 'time': 0.,
+                                             'peak memory': None,
+                                             'memory increase': None})
+        entry['calls'] += 1
+        entry['time'] += t1 - t0
+        if memory is not None:
+            entry['peak memory'] = max((entry['peak memory'] or 0, memory))
+            entry['memory increase'] = max((entry['memory increase'] or 0, memory - memory0))
+
+
+class stage(object):
+    """context manager to record the enclosed code as stage `name`"""
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        start(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        stop(self.name)
+        return False
+
+
+def profiled(name):
+    """return a decorator which records calls of the decorated function
+    as stage `name`"""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not genericsettings.profile:
+                return function(*args, **kwargs)
+            start(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stop(name)
+        return wrapper
+    return decorator
+
+
+def report():
+    """return the statistics together with the total time and the
+    process peak memory as `dict`"""
+    with _statistics_lock:
+        stages = dict((name, dict(entry)) for name, entry in statistics.items())
+    return {'stages': stages,
+            'peak memory': peak_memory(),
+            'platform': sys.platform,
+            'python': sys.version.split()[0],
+            'jobs': genericsettings.number_of_jobs}
+
+
+def save_report(filename):
+    """write `report` as JSON to `filename`"""
+    with open(filename, 'w') as f:
+        json.dump(report(), f, indent=1, sort_keys=True)
+
+
+def summary(total=None, max_lines=25):
+    """return the `max_lines` stages with the longest time as table.
+
+    The relative time is relative to `total` or to the time of the
+    longest stage.
+    """
+    with _statistics_lock:
+        stages = sorted(statistics.items(), key=lambda item: -item[1]['time'])
+    if not stages:
+        return ''
+    if total is None:
+        total = stages[0][1]['time']
+    width = max(len(name) for name, _ in stages[:max_lines])
+    lines = ['%-*s %8s %9s %6s %10s %10s' % (width, 'stage', 'calls', 'time [s]', '%',
+                                             'peak [MB]', '+mem [MB]')]
+    for name, entry in stages[:max_lines]:
+        lines.append('%-*s %8d %9.2f %6.1f %10s %10s' % (
+            width, name, entry['calls'], entry['time'],
+            100 * entry['time'] / total if total else 0,
+            '%.0f' % entry['peak memory'] if entry['peak memory'] is not None else '-',
+            '%.0f' % entry['memory increase'] if entry['memory increase'] is not None else '-'))
+    if len(stages) > max_lines:
+        lines.append('(%d more stages in the report)' % (len(stages) - max_lines))
+    return '\n'.join(lines)
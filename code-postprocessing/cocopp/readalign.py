@@ -20,10 +20,11 @@ the experimental data.
 from __future__ import absolute_import, print_function
 
 import os, sys
+import io
 import numpy
 import warnings
 
-from . import genericsettings, testbedsettings, dataformatsettings
+from . import genericsettings, testbedsettings, dataformatsettings, findfiles
 
 from pdb import set_trace
 from six import string_types, advance_iterator
@@ -207,8 +208,11 @@ class HMultiReader(MultiReader):
         self.idxCurrentFOld = 0.
 
     def calculateCurrentValue(self):
-        factor = -1. if self.isNegative else 1.
-        return factor * numpy.power(10, self.idxCurrentF / self.nbPtsF)
+        return self._calculate_value(self.idxCurrentF, self.isNegative)
+
+    def _calculate_value(self, idxCurrentF, isNegative=False):
+        factor = -1. if isNegative else 1.
+        return factor * numpy.power(10, idxCurrentF / self.nbPtsF)
 
     def isFinished(self):
         """Is finished when we found the last alignment value reached."""
@@ -226,7 +230,10 @@ class HMultiReader(MultiReader):
     def getInitialValue(self):
         for i in self:
             i.next()
-        fvalues = self.currentValues()
+        return self._initial_value(self.currentValues())
+
+    def _initial_value(self, fvalues):
+        """set and return the initial alignment value for first `fvalues`"""
         self.idxCurrentF = numpy.ceil(numpy.log10(max(fvalues) if max(fvalues) > 0 else 1e-19) * self.nbPtsF)
         # Returns the smallest 10^i/nbPtsF value larger than max(Fvalues)
         return self.calculateCurrentValue()
@@ -255,7 +262,13 @@ class HMultiReader(MultiReader):
         if not fvalues:
             raise ValueError('Value %g is not reached.')
 
-        maxf = max(fvalues)
+        currentValue = self._reached_value(max(fvalues), currentValue)
+        return numpy.insert(self.currentLine(), 0, currentValue)
+
+    def _reached_value(self, maxf, currentValue):
+        """set and return the alignment value of the aligned line,
+        where `maxf` is the largest aligned function value.
+        """
         if maxf <= 0.:
             if currentValue > 0.:
                 self.idxCurrentFOld = self.idxCurrentF
@@ -283,8 +296,7 @@ class HMultiReader(MultiReader):
             # The update of idxCurrentF is done so all the intermediate
             # function value trigger reached are not written, only the smallest
             currentValue = self.calculateCurrentValue()
-
-        return numpy.insert(self.currentLine(), 0, currentValue)
+        return currentValue
 
 
 class ArrayMultiReader(MultiReader):
@@ -351,6 +363,175 @@ def align_data(data, idx_evals, idx_funvals, rewind_reader=False):
     This method returns an array for which the alignment value is the
     first column and the aligned values are in subsequent columns.
 
+    The data of all trials are aligned at once with `numpy` in
+    `_align_data_vectorized`. The readers in `data` are advanced line by
+    line like in `_align_data_stepwise` only if the data are not suited,
+    for example when they contain `nan` values. The results do not
+    depend on the implementation:
+
+    >>> import os, tarfile, tempfile
+    >>> import numpy as np
+    >>> import cocopp
+    >>> from cocopp import readalign, toolsdivers, testbedsettings, dataformatsettings
+    >>> folder = tempfile.mkdtemp()
+    >>> with tarfile.open(toolsdivers.path_in_package(
+    ...         os.path.join('refalgs', 'best2009-bbob.tar.gz'))) as tf:
+    ...     tf.extractall(folder)
+    >>> _ = testbedsettings.load_current_testbed('bbob', cocopp.pproc.TargetValues)
+    >>> dataformatsettings.current_data_format = dataformatsettings.BBOBOldDataFormat()
+    >>> for name in ('f01_d02', 'f08_d05', 'f21_d20'):
+    ...     name = os.path.join(folder, 'best2009-bbob', 'bbob-bestalg_%s.' % name)
+    ...     for Reader, ext in ((readalign.HMultiReader, 'dat'), (readalign.VMultiReader, 'tdat')):
+    ...         data = readalign.split([name + ext])[0]
+    ...         res1 = readalign.align_data(Reader(data), 0, 2)
+    ...         res2 = readalign._align_data_stepwise(Reader(data), 0, 2)
+    ...         assert all(np.array_equal(a, b, equal_nan=True) for a, b in zip(res1, res2))
+    >>> import shutil; shutil.rmtree(folder)
+
+    """
+    if rewind_reader:
+        if isinstance(data, HMultiReader):
+            data = HMultiReader(data)
+        elif isinstance(data, VMultiReader):
+            data = VMultiReader(data)
+        else:
+            raise TypeError("reset class %s not implemented"
+                            % type(data))
+    res = None
+    if all(i.currentLine is None for i in data):  # no data were read yet
+        res = _align_data_vectorized(data, idx_evals, idx_funvals)
+    if res is None:
+        res = _align_data_stepwise(data, idx_evals, idx_funvals)
+    return res
+
+
+def _is_close_array(a, b, rel_tol=1e-09, abs_tol=0.0):
+    """elementwise `is_close` for arrays"""
+    return numpy.abs(a - b) <= numpy.maximum(
+        rel_tol * numpy.maximum(numpy.abs(a), numpy.abs(b)), abs_tol)
+
+
+def _align_data_vectorized(data, idx_evals, idx_funvals):
+    """return the same as `_align_data_stepwise` without advancing the
+    readers in `data`, or `None` if the data are not suited.
+
+    The data must be finite and monotonous in the column of the
+    alignment value, that is, function values must not increase in
+    `HMultiReader` data and evaluations must not decrease in
+    `VMultiReader` data. `HArrayMultiReader` data must have a single
+    data column.
+    """
+    if type(data) not in (HMultiReader, VMultiReader, HArrayMultiReader) or not len(data):
+        return None
+    arrays = [i.data for i in data]
+    if any(numpy.ndim(a) != 2 for a in arrays):
+        return None
+    if data.isHArray and any(a.shape[1] != 2 for a in arrays):
+        return None
+    idx = idx_funvals if isinstance(data, HMultiReader) else idx_evals
+    idx_data = idx_evals if isinstance(data, HMultiReader) else idx_funvals
+    columns = [a[:, idx] for a in arrays]
+    sign = 1 if isinstance(data, HMultiReader) else -1
+    if not all(numpy.all(numpy.isfinite(x)) and numpy.all(sign * (x[1:] - x[:-1]) <= 0)
+               for x in columns):
+        return None
+    lengths = numpy.asarray([len(a) for a in arrays])
+    trials = numpy.arange(len(arrays))
+    values = numpy.full((max(lengths), len(arrays)), numpy.nan)
+    for j, a in enumerate(arrays):
+        values[:lengths[j], j] = a[:, idx_data]
+    # the data value of a finished reader, see `MultiReader.SingleReader.next`
+    finished_values = numpy.asarray([numpy.nan if data.isHArray or idx_data == i.idxEvals
+                                     else a[-1, idx_data] for i, a in zip(data, arrays)])
+
+    if isinstance(data, HMultiReader):
+        # the current line of a reader is the first line which reaches
+        # the alignment value or the line before if it is close. As the
+        # alignment values decrease by more than the closeness tolerance,
+        # this does not depend on the previous alignment steps.
+        alignment = numpy.full((max(lengths), len(arrays)), -numpy.inf)
+        for j, x in enumerate(columns):
+            alignment[:lengths[j], j] = x
+        last = alignment[lengths - 1, trials]
+
+        def align(current_values):
+            """return largest reached function values and aligned data rows"""
+            current_values = numpy.asarray(current_values)[:, None]
+            first = numpy.column_stack([numpy.searchsorted(-x, -current_values[:, 0], side='left')
+                                        for x in columns])
+            found = first < lengths
+            previous = numpy.maximum(first - 1, 0)
+            close = found & (first > 0) & _is_close_array(alignment[previous, trials],
+                                                          current_values)
+            current = numpy.where(found, numpy.where(close, previous, first), lengths - 1)
+            reached = found | _is_close_array(last, current_values)
+            fvalues = numpy.where(reached, alignment[current, trials], -numpy.inf)
+            return (numpy.max(fvalues, axis=1), reached.any(axis=1),
+                    numpy.where(found, values[current, trials], finished_values))
+
+        # align on all values of the positive target grid at once
+        current_value = data._initial_value(list(alignment[0]))
+        grid = {}
+        positive = alignment[alignment > 0]
+        if current_value > 0 and len(positive):
+            current_values = [data._calculate_value(data.idxCurrentF - i) for i in range(
+                max((0, int(data.idxCurrentF - numpy.log10(numpy.min(positive)) * data.nbPtsF) + 3)))]
+            grid = dict((value, i) for i, value in enumerate(current_values))
+            grid_data = align(current_values)
+        aligned_values, rows = [], []
+
+        def append_aligned(current_value):
+            if current_value in grid:
+                i, (maxf, reached, row) = grid[current_value], grid_data
+            else:
+                i, (maxf, reached, row) = 0, align([current_value])
+            if not reached[i]:
+                raise ValueError('Value %g is not reached.')
+            aligned_values.append(data._reached_value(maxf[i], current_value))
+            rows.append(row[i])
+
+        last_min = numpy.min(last)
+        if not last_min <= current_value:  # like `HMultiReader.isFinished`
+            append_aligned(current_value)
+        while last_min <= current_value and current_value is not None:
+            append_aligned(current_value)
+            current_value = data.newCurrentValue()
+    else:
+        # the alignment values are the smallest next evaluations, where
+        # close values are skipped, and the current lines are the last
+        # lines not exceeding the alignment value
+        aligned_values = [min(x[0] for x in columns)]
+        for value in numpy.unique(numpy.hstack([x[1:] if len(x) > 1 else x
+                                                for x in columns])):
+            if not (value <= aligned_values[-1] or is_close(value, aligned_values[-1])):
+                aligned_values.append(value)
+        aligned_values = numpy.asarray(aligned_values)
+        rows = numpy.empty((len(aligned_values), len(arrays)))
+        all_finished = numpy.ones(len(aligned_values), dtype=bool)
+        for j, x in enumerate(columns):
+            count = numpy.searchsorted(x, aligned_values, side='right')
+            while True:
+                close = count < len(x)
+                close[close] = _is_close_array(x[count[close]], aligned_values[close])
+                if not close.any():
+                    break
+                count += close
+            finished = count == len(x)
+            rows[:, j] = numpy.where(finished, finished_values[j],
+                                     values[numpy.maximum(count - 1, 0), j])
+            all_finished &= finished
+        if all_finished.any():
+            rows = rows[:numpy.argmax(all_finished) + 1]
+            aligned_values = aligned_values[:len(rows)]
+
+    return (numpy.column_stack((aligned_values, rows)),
+            numpy.asarray([a[-1, idx_evals] for a in arrays]),
+            numpy.asarray([a[-1, idx_funvals] for a in arrays]))
+
+
+def _align_data_stepwise(data, idx_evals, idx_funvals, rewind_reader=False):
+    """Aligns the data from a list of data arrays by advancing the readers
+    in `data` line by line, see `align_data`.
     """
 
     if rewind_reader:
@@ -405,6 +586,20 @@ def alignArrayData(data):
     This method returns an array for which the alignment value is the first
     column and the aligned values are in subsequent columns.
 
+    `HArrayMultiReader` data with a single data column, like the ERTs in
+    `bestalg.BestAlgSet`, are aligned at once with `_align_data_vectorized`
+    if no data were read yet, otherwise like in `_align_array_data_stepwise`.
+    """
+    if isinstance(data, HArrayMultiReader) and all(i.currentLine is None for i in data):
+        res = _align_data_vectorized(data, 1, 0)
+        if res is not None:
+            return res[0]
+    return _align_array_data_stepwise(data)
+
+
+def _align_array_data_stepwise(data):
+    """Aligns the data from a list of aligned arrays by advancing the
+    readers in `data` line by line, see `alignArrayData`.
     """
 
     # TODO: is template dependent.
@@ -425,7 +620,14 @@ def alignArrayData(data):
 
 
 def openfile(filePath, **kwargs):
-    """`kwargs` are passed to `open`"""
+    """`kwargs` are passed to `open`.
+
+    Members of an archive registered in `findfiles` are read directly
+    from the archive.
+    """
+    index, name = findfiles.archive_member(filePath)
+    if index is not None:
+        return io.StringIO(index.read(name).decode('utf-8', kwargs.get('errors', 'strict')))
     if not os.path.isfile(filePath):
         if ('win32' in sys.platform) and len(filePath) > 259:
             raise IOError(2, 'The path is too long for the file "%s".' % filePath)
@@ -439,11 +641,138 @@ def openfile(filePath, **kwargs):
         return open(filePath, 'r', **kwargs)
 
 
-def split(dataFiles, idx_to_load=None, dim=None):
+binary_data_extension = '.npz'
+"""extension of the binary data files read in place of missing ``.dat`` and
+``.tdat`` files, as written by ``cocoex.BufferedObserver``"""
+
+
+def binary_data_file(filePath):
+    """return the name of the binary file which contains the data of the
+    missing text data file `filePath`, or `None`.
+
+    The binary file contains the data of all runs of the ``.dat`` and the
+    ``.tdat`` file, one after the other, in the arrays ``dat`` and ``tdat``
+    with the columns of the text file, and the number of lines of each run
+    in ``dat_lengths`` and ``tdat_lengths``. It is read by `split`.
+    """
+    if os.path.isfile(filePath) or findfiles.archive_member(filePath)[0] is not None:
+        return None
+    name = os.path.splitext(filePath)[0] + binary_data_extension
+    if os.path.isfile(name) or findfiles.archive_member(name)[0] is not None:
+        return name
+    return None
+
+
+def _read_binary_data(binaryFile, extension):
+    """return the list of data arrays, one for each run, with the data of
+    the text file with `extension` from `binaryFile`.
+
+    >>> import os, tempfile
+    >>> import numpy as np
+    >>> from cocopp import readalign
+    >>> folder = tempfile.mkdtemp()
+    >>> name = os.path.join(folder, 'data')
+    >>> with open(name + '.dat', 'w') as f:
+    ...     _ = f.write('% header\\n1 0 1e1 1e1 1e1\\n3 0 1e0 1e0 1e0\\n'
+    ...                 '% header\\n1 0 2e1 2e1 2e1\\n')
+    >>> np.savez(name + '.npz', dat_lengths=np.array([2, 1]),
+    ...          dat=np.array([[1, 0, 1e1, 1e1, 1e1], [3, 0, 1e0, 1e0, 1e0],
+    ...                        [1, 0, 2e1, 2e1, 2e1]]))
+    >>> res1 = readalign.split([name + '.dat'])
+    >>> os.remove(name + '.dat')
+    >>> readalign.binary_data_file(name + '.dat') == name + '.npz'
+    True
+    >>> res2 = readalign.split([name + '.dat'])
+    >>> all(np.array_equal(a, b) for a, b in zip(res1[0], res2[0]))
+    True
+    >>> len(res2[0]), res1[1:] == res2[1:]
+    (2, True)
+    >>> import shutil; shutil.rmtree(folder)
+
+    """
+    extension = extension.lstrip('.')
+    index, name = findfiles.archive_member(binaryFile)
+    with numpy.load(io.BytesIO(index.read(name)) if index is not None
+                    else binaryFile) as data:
+        if extension not in data:
+            return []
+        return numpy.split(data[extension],
+                           numpy.cumsum(data[extension + '_lengths'])[:-1])
+
+
+def _convert_tokens(data):
+    """convert the string tokens in list `data` to `float` inplace.
+
+    Tokens which cannot be converted are replaced by `numpy.nan` with a
+    warning. This is the slow fallback of `_data_block`.
+    """
+    for index in range(len(data)):
+        if data[index] in ('Inf', 'inf'):
+            data[index] = numpy.inf
+        elif data[index] in ('-Inf', '-inf'):
+            data[index] = -numpy.inf
+        elif data[index] in ('NaN', 'nan'):
+            data[index] = numpy.nan
+        else:
+            try:
+                data[index] = float(data[index])
+            except ValueError:
+                warnings.warn('%s is not a valid number!' % data[index])
+                data[index] = numpy.nan
+    return data
+
+
+def _data_block(rows):
+    """return a 2-D array from `rows`, a list of lists of string tokens.
+
+    All tokens are converted in a single call to `numpy.array`. Only if
+    this fails, because of an invalid token or because of rows with
+    different lengths, the rows are converted one by one.
+    """
+    try:
+        return numpy.array(rows, dtype=float)
+    except ValueError:
+        return numpy.vstack([numpy.array(_convert_tokens(row)) for row in rows])
+
+
+def split(dataFiles, idx_to_load=None, dim=None, last_rows=False):
     """Split a list of data files into arrays corresponding to data sets.
        The Boolean list idx_to_load is thereby indicating whether a
        given part of the split is to be considered or not if None, all
        instances are considered.
+
+       If `last_rows`, each data set is only the last row of its
+       instance block, the other rows are not converted.
+
+       Each file is read at once and cut at its ``%`` header lines into
+       instance blocks, each of which is converted into an array in one go.
+       A missing data file is read from its binary counterpart, see
+       `binary_data_file`.
+
+       Return ``data_sets, algorithms, reference_values, success_ratio``.
+       The best algorithm data have an algorithm name and success ratio
+       for each row:
+
+       >>> import os, tarfile, tempfile
+       >>> import numpy as np
+       >>> from cocopp import readalign, toolsdivers
+       >>> folder = tempfile.mkdtemp()
+       >>> with tarfile.open(toolsdivers.path_in_package(
+       ...         os.path.join('refalgs', 'best2009-bbob.tar.gz'))) as tf:
+       ...     tf.extractall(folder)
+       >>> files = [os.path.join(folder, 'best2009-bbob', name) for name in
+       ...          ('bbob-bestalg_f01_d02.dat', 'bbob-bestalg_f24_d20.tdat')]
+       >>> data_sets, algorithms, reference_values, success_ratio = readalign.split(files)
+       >>> [data.shape for data in data_sets]
+       [(5, 3), (54, 3)]
+       >>> len(algorithms) == len(success_ratio) == 5 + 54
+       True
+       >>> last_rows = readalign.split(files, last_rows=True)[0]
+       >>> all(np.array_equal(data[-1:], last, equal_nan=True)
+       ...     for data, last in zip(data_sets, last_rows))
+       True
+       >>> import shutil; shutil.rmtree(folder)
+
     """
 
     data_sets = []
@@ -451,96 +780,86 @@ def split(dataFiles, idx_to_load=None, dim=None):
     success_ratio = []
     reference_values = {}
     for fil in dataFiles:
+        binaryFile = binary_data_file(fil)
+        if binaryFile:
+            idx = 0
+            for block in _read_binary_data(binaryFile, os.path.splitext(fil)[1]):
+                if dim and block.shape[1] != dim + 5:
+                    warnings.warn('Incomplete lines in data file %s' % binaryFile)
+                    continue
+                if len(block):
+                    if (idx_to_load is None) or (idx_to_load and len(idx_to_load) > idx and idx_to_load[idx]):
+                        data_sets.append(block[-1:] if last_rows else block)
+                    elif genericsettings.verbose:
+                        print('skipped instance...')
+                    idx += 1
+            continue
         with openfile(fil) as f:
-            # This doesnt work with windows.
-            # content = numpy.loadtxt(fil, comments='%')
-            lines = f.readlines()
+            lines = f.read().split('\n')
+        # indices of header lines, the data are in between
+        headers = [i for i, line in enumerate(lines) if line.startswith('%')]
 
-        content = []
         idx = 0  # instance index for checking in idx_to_load
         current_instance = 0
         current_reference_value = 0
         is_best_algorithm_data = False
-
-        # Save values in array content. Check for nan and inf.
-        for line in lines:
-            if line.startswith('%'):
-                if content:
-                    if (idx_to_load is None) or (idx_to_load and len(idx_to_load) > idx and idx_to_load[idx]):
-                        data_sets.append(numpy.vstack(content))
-                    elif genericsettings.verbose:
-                            print('skipped instance...')
-                    # Use only the reference values from instances 1 to 5.
-                    if current_instance in (1, 2, 3, 4, 5):
-                        reference_values[current_instance] = current_reference_value
-
-                    content = []
-                    current_instance = 0
-                    current_reference_value = 0
-                    is_best_algorithm_data = False
-                    idx += 1
-
-                # Get the current instance and reference value.
-                parts = line.strip('\n').strip('\%').split(', ')
-                for elem in parts:
-                    if '=' in elem:
-                        key, value = elem.split('=', 1)
-                        if key.strip() == 'instance':
-                            current_instance = int(value.strip())
-                        elif key.strip() == 'reference value':
-                            current_reference_value = float(value.strip())
-                        elif key.strip() == 'algorithm type':
-                            is_best_algorithm_data = 'best' == value.strip()
-
-                continue
-
-            # else remove end-of-line sign
-            # and split into single strings
-            data = line.strip('\n').split()
+        start = 0
+        for i_header in headers + [len(lines)]:
+            if last_rows:
+                rows = []
+                for line in reversed(lines[start:i_header]):
+                    if line.strip():
+                        rows = [line.split()]
+                        break
+            else:
+                rows = [line.split() for line in lines[start:i_header]]
+                rows = [row for row in rows if row]
+            start = i_header + 1
 
             # remove additional data for best algorithm
             if is_best_algorithm_data:
-                index = len(data) - 3
-                if index <= 0:
-                    warnings.warn('Invalid best algorithm data!')
-                else:
-                    algorithms.append(data[index])
-                    successful_runs = int(data[index + 1])
-                    all_runs = int(data[index + 2])
-                    success_ratio.append([successful_runs, all_runs])
-                    data = data[:-3]  # remove the three processed items from data
-
-            if dim and len(data) != dim + 5:
-                warnings.warn('Incomplete line %s in  ' % line +
-                              'data file %s: ' % fil)
-                continue
-            for index in range(len(data)):
-                if data[index] in ('Inf', 'inf'):
-                    data[index] = numpy.inf
-                elif data[index] in ('-Inf', '-inf'):
-                    data[index] = -numpy.inf
-                elif data[index] in ('NaN', 'nan'):
-                    data[index] = numpy.nan
-                else:
-                    try:
-                        data[index] = float(data[index])
-                    except ValueError:
-                        warnings.warn('%s is not a valid number!' % data[index])
-                        data[index] = numpy.nan
-
-            if data:
-                content.append(numpy.array(data))
-            # Check that it always have the same length?
-
-        if content:
-            if (idx_to_load is None) or (idx_to_load and len(idx_to_load) > idx and idx_to_load[idx]):
-                data_sets.append(numpy.vstack(content))
-            elif genericsettings.verbose:
-                    print('skipped instance...')
-
-            # Use only the reference values from instances 1 to 5.
-            if current_instance in (1, 2, 3, 4, 5):
-                reference_values[current_instance] = current_reference_value
+                for row in rows:
+                    index = len(row) - 3
+                    if index <= 0:
+                        warnings.warn('Invalid best algorithm data!')
+                    else:
+                        algorithms.append(row[index])
+                        success_ratio.append([int(row[index + 1]), int(row[index + 2])])
+                        del row[index:]  # remove the three processed items from data
+
+            if dim:
+                for row in [row for row in rows if len(row) != dim + 5]:
+                    warnings.warn('Incomplete line %s in  ' % ' '.join(row) +
+                                  'data file %s: ' % fil)
+                rows = [row for row in rows if len(row) == dim + 5]
+
+            if rows:
+                if (idx_to_load is None) or (idx_to_load and len(idx_to_load) > idx and idx_to_load[idx]):
+                    data_sets.append(_data_block(rows))
+                elif genericsettings.verbose:
+                        print('skipped instance...')
+                # Use only the reference values from instances 1 to 5.
+                if current_instance in (1, 2, 3, 4, 5):
+                    reference_values[current_instance] = current_reference_value
+
+                current_instance = 0
+                current_reference_value = 0
+                is_best_algorithm_data = False
+                idx += 1
+
+            if i_header == len(lines):
+                break
+            # Get the current instance and reference value.
+            parts = lines[i_header].strip('\\%').split(', ')
+            for elem in parts:
+                if '=' in elem:
+                    key, value = elem.split('=', 1)
+                    if key.strip() == 'instance':
+                        current_instance = int(value.strip())
+                    elif key.strip() == 'reference value':
+                        current_reference_value = float(value.strip())
+                    elif key.strip() == 'algorithm type':
+                        is_best_algorithm_data = 'best' == value.strip()
 
     if len(algorithms) < len(data_sets):
         algorithms = []
@@ -23,6 +23,7 @@ import warnings
 import webbrowser
 import matplotlib
 from . import genericsettings, testbedsettings, rungeneric1, rungenericmany, toolsdivers, bestalg, archiving
+from . import pproc, ppfig, profiling
 from .toolsdivers import truncate_latex_command_file, print_done, diff_attr
 from .ppfig import Usage
 from .compall import ppfigs
@@ -190,6 +191,42 @@ def main(argv=None):
             takes values between 0 (default) and 1000, fast processing that
             does not write eps files and uses a small number of bootstrap samples
 
+        --jobs=JOBS
+
+            number of processes to read the data and render the figures
+            with in parallel, the default is 1. The results do not depend
+            on JOBS.
+
+        --no-extract
+
+            read the data directly from tar and zip archives instead of
+            extracting the archives to disk first.
+
+        --functions=FUNCTIONS, --dimensions=DIMENSIONS
+
+            comma separated function numbers and dimensions, like
+            ``--functions=1,2,3 --dimensions=5,20``. Only the data of
+            these functions and dimensions are read from archives with
+            ``--no-extract``.
+
+        --incremental
+
+            skip the figures and tables whose data, settings and output
+            files did not change since the last call with the same output
+            directory, see :py:mod:`cocopp.buildmanifest`.
+
+        --background-figure-saving
+
+            encode and write the figure files in background threads while
+            the next figures are plotted.
+
+        --profile
+
+            record run time, number of calls and peak memory of loading,
+            bootstrapping, figure saving and each output module, print a
+            summary and write a JSON report into the output folder, see
+            :py:mod:`cocopp.profiling`.
+
         --no-svg
 
             do not generate the svg figures which are used in html files
@@ -241,7 +278,9 @@ def main(argv=None):
         try:
             opts, args = getopt.getopt(argv, short_options,
                                        long_options +
-                                       ['include-single', 'in-a-hurry=', 'input-path='])
+                                       ['include-single', 'in-a-hurry=', 'input-path=', 'jobs=',
+                                        'no-extract', 'functions=', 'dimensions=',
+                                        'incremental', 'background-figure-saving', 'profile'])
         except getopt.error as msg:
             raise Usage(msg)
 
@@ -282,6 +321,20 @@ def main(argv=None):
                     print('in_a_hurry like ', genericsettings.in_a_hurry, ' (should finally be set to zero)')
             elif o in ("--input-path", ):
                 inputdir = a
+            elif o == "--jobs":
+                genericsettings.number_of_jobs = int(a)
+            elif o == "--no-extract":
+                genericsettings.extract_archives = False
+            elif o == "--functions":
+                genericsettings.archive_functions = [int(i) for i in a.split(',')]
+            elif o == "--dimensions":
+                genericsettings.archive_dimensions = [int(i) for i in a.split(',')]
+            elif o == "--incremental":
+                genericsettings.incremental = True
+            elif o == "--background-figure-saving":
+                genericsettings.background_figure_saving = True
+            elif o == "--profile":
+                genericsettings.profile = True
             elif o in "--no-svg":
                 genericsettings.generate_svg_files = False
             elif o == "--no-rld-single-fcts":
@@ -356,6 +409,8 @@ def main(argv=None):
         if not genericsettings.verbose:
             warnings.filterwarnings('module', '.*', UserWarning, '.*')
             # warnings.simplefilter('ignore')  # that is bad, but otherwise to many warnings appear
+        profiling.reset()
+        profiling.start('rungeneric.main')
 
 #        print("\nPost-processing: will generate output " +
 #               "data in folder %s" % outputdir)
@@ -378,6 +433,12 @@ def main(argv=None):
         if None in args:
             raise ValueError("Data argument %d was not matching any file"
                              " or archive entry." % (args.index(None) + 1))
+        for path in args:
+            if pproc.is_summary_file(path):
+                # summaries have no funvals and only the evals of the summary targets
+                raise ValueError("Data summary %s can only be used as background"
+                                 " or reference algorithm data, see"
+                                 " genericsettings.background" % path)
         if len(args) != len(set(args)):
             warnings.warn("Several data arguments point to the very same location."
                           "This will most likely lead to a rather unexpected outcome.")
@@ -405,7 +466,8 @@ def main(argv=None):
             genericsettings.foreground_algorithm_list = []
             for i, alg in enumerate(args):
                 genericsettings.foreground_algorithm_list.append(alg)
-                dsld = rungeneric1.main(alg, outputdir, genopts + ["-o", outputdir, alg])
+                with profiling.stage('rungeneric1'):
+                    dsld = rungeneric1.main(alg, outputdir, genopts + ["-o", outputdir, alg])
 
         if len(args) >= 2 or len(genericsettings.background) > 0:
             # Reset foreground algorithm list if cocopp.main() is called.
@@ -413,7 +475,8 @@ def main(argv=None):
             # Arguments are still accumulated if rungeneric.main() is bypassed
             # and rungenericmany.main() or lower-level functions are called.
             genericsettings.foreground_algorithm_list = []
-            dsld = rungenericmany.main(args, outputdir)
+            with profiling.stage('rungenericmany'):
+                dsld = rungenericmany.main(args, outputdir)
             
         toolsdivers.prepend_to_file(latex_commands_filename,
                                         ['\\providecommand{\\numofalgs}{%d}' % len(args)]
@@ -430,6 +493,19 @@ def main(argv=None):
         open(os.path.join(outputdir,
                           'cocopp_commands.tex'), 'a').close()
 
+        if genericsettings.verbose:
+            print('Results cache of data sets: %(hits)d hits, %(misses)d misses'
+                  % pproc.results_cache_statistics)
+        ppfig.flush_figures()
+        if genericsettings.verbose or genericsettings.background_figure_saving:
+            print('Figures: %(figures)d figures in %(files)d files, %(encoding time).1fs'
+                  ' encoding, %(snapshot time).1fs pickling for and %(waiting time).1fs'
+                  ' waiting for background threads' % ppfig.figure_saving_statistics)
+        profiling.stop('rungeneric.main')
+        if genericsettings.profile:
+            profiling.save_report(os.path.join(outputdir, profiling.report_file_name))
+            print('Profile (written to %s):' % os.path.join(outputdir, profiling.report_file_name))
+            print(profiling.summary(profiling.statistics['rungeneric.main']['time']))
 
         # print changed genericsettings attributes
         def as_str(s, clip=25):
@@ -25,6 +25,7 @@ import matplotlib
 import warnings, getopt, numpy as np
 
 from . import genericsettings, testbedsettings, config, ppfig, pptable, pprldistr, ppfigdim, ppfigcons1, pplogloss, findfiles
+from . import buildmanifest
 from .pproc import DataSetList, store_reference_values, dictAlgByDim
 from .ppfig import Usage
 from .toolsdivers import print_done, prepend_to_file, strip_pathname1, str_to_latex, get_version_label, replace_in_file
@@ -128,6 +129,7 @@ def main(alg, outputdir, argv=None):
                 print('Folder %s was created.' % (algoutputdir))
 
     latex_commands_file = os.path.join(outputdir, 'cocopp_commands.tex')
+    build = buildmanifest.Build(outputdir, dsList, algfolder)
 
     if genericsettings.isPickled:
         dsList.pickle()
@@ -145,26 +147,29 @@ def main(alg, outputdir, argv=None):
                                      function_groups=dsList.getFuncGroups())
 
     values_of_interest = testbedsettings.current_testbed.ppfigdim_target_values
-    if genericsettings.isFig:
+    if genericsettings.isFig and build.start('ppfigdim'):
         print("Scaling figures...")
         # ERT/dim vs dim.
         ppfigdim.main(dsList, values_of_interest, algoutputdir)
+        build.done('ppfigdim')
 
         print_done()
 
-    if testbedsettings.current_testbed.has_constraints:
+    if testbedsettings.current_testbed.has_constraints and build.start('ppfigcons1'):
         print("Scaling wrt constraints...")
         ppfigcons1.main(dsList, values_of_interest, algoutputdir)
+        build.done('ppfigcons1')
         print_done()
 
-    if genericsettings.isConv:
+    if genericsettings.isConv and build.start('ppconverrorbars'):
         print("Generating convergence plots...")
         ppconverrorbars.main(dictAlg,
                              algoutputdir,
                              genericsettings.single_algorithm_file_name)
+        build.done('ppconverrorbars')
         print_done()
 
-    if genericsettings.isTab:
+    if genericsettings.isTab and build.start('pptable'):
         print("Generating LaTeX tables...")
         dictNoise = dsList.dictByNoise()
         dict_dim_list = dictAlgByDim(dictAlg)
@@ -180,9 +185,10 @@ def main(alg, outputdir, argv=None):
 
         for noise, sliceNoise in dictNoise.items():
             pptable.main(sliceNoise, dims, algoutputdir, latex_commands_file)
+        build.done('pptable')
         print_done()
 
-    if genericsettings.isRLDistr:
+    if genericsettings.isRLDistr and build.start('pprldistr'):
         print("ECDF graphs...")
         dictNoise = dsList.dictByNoise()
         if len(dictNoise) > 1:
@@ -214,47 +220,58 @@ def main(alg, outputdir, argv=None):
 
             pprldistr.fmax = None  # Resetting the max final value
             pprldistr.evalfmax = None  # Resetting the max #fevalsfactor
+        build.done('pprldistr')
         print_done()
 
-        if genericsettings.isRldOnSingleFcts: # copy-paste from above, here for each function instead of function groups
-            # ECDFs for each function
-            print("ECDF graphs per function...")
-            pprldmany.all_single_functions(dictAlg,
-                                           True,
-                                           None,
-                                           algoutputdir,
-                                           genericsettings.single_algorithm_file_name,
-                                           settings=genericsettings)
-            print_done()
-
-    if genericsettings.isLogLoss:
+    if (genericsettings.isRLDistr and genericsettings.isRldOnSingleFcts  # copy-paste from above, here for each function instead of function groups
+            and build.start('pprldmany-single-functions')):
+        # ECDFs for each function
+        print("ECDF graphs per function...")
+        pprldmany.all_single_functions(dictAlg,
+                                       True,
+                                       None,
+                                       algoutputdir,
+                                       genericsettings.single_algorithm_file_name,
+                                       settings=genericsettings)
+        build.done('pprldmany-single-functions')
+        print_done()
+
+    if genericsettings.isLogLoss and build.start('pplogloss'):
         print("ERT loss ratio figures and tables...")
-        for ng, sliceNoise in dsList.dictByNoise().items():
-            if ng == 'noiselessall':
-                testbed = 'noiseless'
-            elif ng == 'nzall':
-                testbed = 'noisy'
-            txt = ("Please input crafting effort value "
-                   + "for %s testbed:\n  CrE = " % testbed)
-            CrE = genericsettings.inputCrE
-            while CrE is None:
-                try:
-                    CrE = float(raw_input(txt))
-                except (SyntaxError, NameError, ValueError):
-                    print("Float value required.")
-            dictDim = sliceNoise.dictByDim()
-            for d in testbedsettings.current_testbed.rldDimsOfInterest:
-                try:
-                    sliceDim = dictDim[d]
-                except KeyError:
-                    continue
-                info = '%s' % ng
-                pplogloss.main(sliceDim, CrE, True, algoutputdir, info)
-                pplogloss.generateTable(sliceDim, CrE, algoutputdir, info)
-                for fGroup, sliceFuncGroup in sliceDim.dictByFuncGroup().items():
-                    info = '%s' % fGroup
-                    pplogloss.main(sliceFuncGroup, CrE, True,
-                                   algoutputdir, info)
+        recorded = False  # CrE is not in the settings if it was input
+        try:
+            for ng, sliceNoise in dsList.dictByNoise().items():
+                if ng == 'noiselessall':
+                    testbed = 'noiseless'
+                elif ng == 'nzall':
+                    testbed = 'noisy'
+                txt = ("Please input crafting effort value "
+                       + "for %s testbed:\n  CrE = " % testbed)
+                CrE = genericsettings.inputCrE
+                while CrE is None:
+                    try:
+                        CrE = float(raw_input(txt))
+                    except (SyntaxError, NameError, ValueError):
+                        print("Float value required.")
+                dictDim = sliceNoise.dictByDim()
+                for d in testbedsettings.current_testbed.rldDimsOfInterest:
+                    try:
+                        sliceDim = dictDim[d]
+                    except KeyError:
+                        continue
+                    info = '%s' % ng
+                    pplogloss.main(sliceDim, CrE, True, algoutputdir, info)
+                    pplogloss.generateTable(sliceDim, CrE, algoutputdir, info)
+                    for fGroup, sliceFuncGroup in sliceDim.dictByFuncGroup().items():
+                        info = '%s' % fGroup
+                        pplogloss.main(sliceFuncGroup, CrE, True,
+                                       algoutputdir, info)
+            recorded = genericsettings.inputCrE is not None
+        finally:
+            if recorded:
+                build.done('pplogloss')
+            else:
+                build.cancel('pplogloss')
         print_done()
 
     prepend_to_file(latex_commands_file,
@@ -289,6 +306,8 @@ def main(alg, outputdir, argv=None):
     prepend_to_file(latex_commands_file,
                     ['\\providecommand{\\algname}{' +
                      (str_to_latex(strip_pathname1(alg[0])) if len(alg) == 1 else str_to_latex(dsList[0].algId)) + '{}}'])
+    build.update_index_page(os.path.join(algoutputdir, genericsettings.single_algorithm_file_name + '.html'))
+    ppfig.flush_figures()
     print("Output data written to folder %s" %
           os.path.join(os.getcwd(), algoutputdir))
 
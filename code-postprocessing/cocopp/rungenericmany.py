@@ -15,7 +15,7 @@ import getopt
 import warnings
 
 from . import genericsettings, config, ppfig, testbedsettings, findfiles
-from . import pproc, pptex, pprldistr
+from . import pproc, pptex, pprldistr, buildmanifest
 from .pproc import DataSetList, processInputArgs
 from .ppfig import Usage
 from .toolsdivers import prepend_to_file, strip_pathname1, str_to_latex, replace_in_file
@@ -133,6 +133,7 @@ def main(args, outputdir):
         os.makedirs(many_algorithms_output)
         if genericsettings.verbose:
             print('Folder %s was created.' % many_algorithms_output)
+    build = buildmanifest.Build(outputdir, dsList, algorithm_folder)
 
     for i in dictAlg:
         if genericsettings.isNoisy and not genericsettings.isNoiseFree:
@@ -170,17 +171,19 @@ def main(args, outputdir):
         function_groups=dictAlg[sortedAlgs[0]].getFuncGroups()
     )
 
-    ppfig.save_single_functions_html(
-        os.path.join(many_algorithms_output, genericsettings.ppfigs_file_name),
-        '',  # algorithms names are clearly visible in the figure
-        htmlPage=ppfig.HtmlPage.PPFIGS,
-        function_groups=dictAlg[sortedAlgs[0]].getFuncGroups(),
-        parentFileName=genericsettings.many_algorithm_file_name
-    )
+    if not build.is_up_to_date('ppfigs'):  # keep the page of a skipped step
+        ppfig.save_single_functions_html(
+            os.path.join(many_algorithms_output, genericsettings.ppfigs_file_name),
+            '',  # algorithms names are clearly visible in the figure
+            htmlPage=ppfig.HtmlPage.PPFIGS,
+            function_groups=dictAlg[sortedAlgs[0]].getFuncGroups(),
+            parentFileName=genericsettings.many_algorithm_file_name
+        )
 
     dimensions = sorted(pproc.dictAlgByDim(dictAlg))
 
-    if testbedsettings.current_testbed.has_constraints:
+    if (testbedsettings.current_testbed.has_constraints and
+            not build.is_up_to_date('ppfigcons')):
         ppfig.save_single_functions_html(
             os.path.join(many_algorithms_output, genericsettings.ppfigcons_file_name),
             '',  # algorithms names are clearly visible in the figure
@@ -190,20 +193,21 @@ def main(args, outputdir):
             parentFileName=genericsettings.many_algorithm_file_name
         )
 
-    ppfig.save_single_functions_html(
-        os.path.join(many_algorithms_output, genericsettings.pptables_file_name),
-        '',  # algorithms names are clearly visible in the figure
-        dimensions=dimensions,
-        htmlPage=ppfig.HtmlPage.PPTABLES,
-        function_groups=dictAlg[sortedAlgs[0]].getFuncGroups(),
-        parentFileName=genericsettings.many_algorithm_file_name
-    )
+    if not build.is_up_to_date('pptables'):
+        ppfig.save_single_functions_html(
+            os.path.join(many_algorithms_output, genericsettings.pptables_file_name),
+            '',  # algorithms names are clearly visible in the figure
+            dimensions=dimensions,
+            htmlPage=ppfig.HtmlPage.PPTABLES,
+            function_groups=dictAlg[sortedAlgs[0]].getFuncGroups(),
+            parentFileName=genericsettings.many_algorithm_file_name
+        )
 
     # empirical cumulative distribution functions (ECDFs) aka Data profiles
     if genericsettings.isRLDistr:
         config.config(dsList[0].suite_name)
 
-        if len(genericsettings.foreground_algorithm_list) == 2:
+        if len(genericsettings.foreground_algorithm_list) == 2 and build.start('pprldistr2'):
             print("ECDF runlength ratio graphs...")
 
             ds_list0 = dictAlg[sortedAlgs[0]]
@@ -310,30 +314,35 @@ def main(args, outputdir):
                                            many_algorithms_output,
                                            '%s' % fGroup)
                 print_done()  # of "ECDF runlength graphs..."
+            build.done('pprldistr2')
 
         # ECDFs per noise groups
-        print("ECDF graphs per noise group...")
-        grouped_ecdf_graphs(pproc.dictAlgByNoi(dictAlg),
-                            sortedAlgs,
-                            many_algorithms_output,
-                            dictAlg[sortedAlgs[0]].getFuncGroups(),
-                            genericsettings,
-                            genericsettings.many_algorithm_file_name)
-        print_done()
+        if build.start('pprldmany-noise-groups'):
+            print("ECDF graphs per noise group...")
+            grouped_ecdf_graphs(pproc.dictAlgByNoi(dictAlg),
+                                sortedAlgs,
+                                many_algorithms_output,
+                                dictAlg[sortedAlgs[0]].getFuncGroups(),
+                                genericsettings,
+                                genericsettings.many_algorithm_file_name)
+            build.done('pprldmany-noise-groups')
+            print_done()
 
         # ECDFs per function groups
-        print("ECDF graphs per function group...")
-        grouped_ecdf_graphs(pproc.dictAlgByFuncGroup(dictAlg),
-                            sortedAlgs,
-                            many_algorithms_output,
-                            dictAlg[sortedAlgs[0]].getFuncGroups(),
-                            genericsettings,
-                            genericsettings.many_algorithm_file_name)
-        print_done()
+        if build.start('pprldmany-function-groups'):
+            print("ECDF graphs per function group...")
+            grouped_ecdf_graphs(pproc.dictAlgByFuncGroup(dictAlg),
+                                sortedAlgs,
+                                many_algorithms_output,
+                                dictAlg[sortedAlgs[0]].getFuncGroups(),
+                                genericsettings,
+                                genericsettings.many_algorithm_file_name)
+            build.done('pprldmany-function-groups')
+            print_done()
 
         # copy-paste from above, here for each function instead of function groups:
         print("ECDF graphs per function...")
-        if genericsettings.isRldOnSingleFcts:
+        if genericsettings.isRldOnSingleFcts and build.start('pprldmany-single-functions'):
             # ECDFs for each function
             if 1 < 3:
                 pprldmany.all_single_functions(dictAlg,
@@ -368,9 +377,10 @@ def main(args, outputdir):
                         dimensions=dims,
                         htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
                         header=ppfig.pprldmany_per_func_dim_header)
+            build.done('pprldmany-single-functions')
         print_done()
 
-    if genericsettings.isTab:
+    if genericsettings.isTab and build.start('pptables'):
         print("Generating comparison tables...")
         prepend_to_file(latex_commands_file,
                         ['\providecommand{\\bbobpptablesmanylegend}[1]{' +
@@ -386,9 +396,11 @@ def main(args, outputdir):
                     ([1, 20, 38] if (testbedsettings.current_testbed.name ==
                                      testbedsettings.suite_name_bi) else True),
                     latex_commands_file)
+        build.done('pptables')
         print_done()
 
-    if genericsettings.isScatter and len(genericsettings.foreground_algorithm_list) == 2:
+    if (genericsettings.isScatter and len(genericsettings.foreground_algorithm_list) == 2
+            and build.start('ppscatter')):
         print("Scatter plots...")
 
         ds_list0 = dictAlg[sortedAlgs[0]]
@@ -418,26 +430,32 @@ def main(args, outputdir):
         for i, alg in enumerate(args):
             replace_in_file(html_file_name, 'algorithm' + pptex.numtotext(i), str_to_latex(strip_pathname1(alg)))
 
+        build.done('ppscatter')
         print_done()
 
-    if genericsettings.isFig:
+    if genericsettings.isFig and build.start('ppfigs'):
         print("Scaling figures...")
         ppfigs.main(dictAlg,
                     genericsettings.ppfigs_file_name,
                     sortedAlgs,
                     many_algorithms_output,
                     latex_commands_file)
+        build.done('ppfigs')
         print_done()
 
-    if testbedsettings.current_testbed.has_constraints:
+    if testbedsettings.current_testbed.has_constraints and build.start('ppfigcons'):
         print("Scaling wrt constraints...")
         ppfigcons.main(dictAlg,
                        genericsettings.ppfigcons_file_name,
                        sortedAlgs,
                        many_algorithms_output,
                        latex_commands_file)
+        build.done('ppfigcons')
         print_done()
 
+    build.update_index_page(os.path.join(many_algorithms_output,
+                                         genericsettings.many_algorithm_file_name + '.html'))
+    ppfig.flush_figures()
     print("Output data written to folder %s" %
           os.path.join(os.getcwd(), many_algorithms_output))
 
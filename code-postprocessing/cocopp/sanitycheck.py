@@ -177,7 +177,7 @@ def main(argv=None):
         filelist = list()
         for i in args:
             if os.path.isdir(i):
-                filelist.extend(findfiles.main(i, verbose))
+                filelist.extend(findfiles.main(i))
             elif os.path.isfile(i):
                 filelist.append(i)
             else:
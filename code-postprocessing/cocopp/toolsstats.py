@@ -6,7 +6,7 @@
 from __future__ import absolute_import, print_function
 import warnings
 import numpy as np
-from . import genericsettings
+from . import genericsettings, profiling
 from pdb import set_trace
 
 def _has_len(thing):
@@ -210,6 +210,7 @@ def drawSP_from_dataset_new(data_set, ftarget, dummy,
     # the second call makes a long list with all repetitions
     return (None, data_set.evals_with_restarts([ftarget], sample_size_per_runtime)())
 
+@profiling.profiled('toolsstats.drawSP')
 def drawSP(runlengths_succ, runlengths_unsucc, percentiles,
            samplesize=genericsettings.simulated_runlength_bootstrap_sample_size,
            derandomized=True):
@@ -268,27 +269,23 @@ def drawSP(runlengths_succ, runlengths_unsucc, percentiles,
     # geometric distribution for number of unsuccessful runs
     # The samplesize depends on the number of unsuccessful runs?
 
-    arrStats = []
     sdata = np.array(runlengths_succ)  # more efficient indexing
     sdata.sort()
     udata = np.array(runlengths_unsucc)  # more efficient indexing
     udata.sort()
     Nu = len(udata)
     Ns = len(sdata)
-    # data = np.r_[udata, sdata]
     N = Ns + Nu
 
-    for idx in _randint_derandomized_generator(N, size=int(samplesize)):
-        # was: i in range(int(samplesize))
-        if not derandomized:
-            idx = np.random.randint(N)
-        assert 0 <= idx < N
-        sumdata = 0
-        while idx < Nu:
-            sumdata += udata[idx]
-            idx = np.random.randint(N)
-        sumdata += sdata[idx - Nu]  # add evals of the successful run
-        arrStats.append(sumdata)  # We know we have one success here.
+    # index idx < Nu refers to udata[idx], otherwise to sdata[idx - Nu]
+    if derandomized:
+        idx = randint_derandomized(N, size=int(samplesize))
+    else:
+        idx = np.random.randint(N, size=int(samplesize))
+    # simulated_restarts expects the successful runs first
+    idx = np.where(idx < Nu, idx + Ns, idx - Nu)
+    arrStats = list(simulated_restarts(np.hstack([sdata, udata]), Ns, idx,
+                                       np.random.randint))
     arrStats.sort()
     return (prctile(arrStats, percentiles, issorted=True),
             arrStats)
@@ -318,7 +315,14 @@ def randint_derandomized(low, high=None, size=None):
         np.asarray(data)[randint_derandomized(0, len(data), ndata)]
 
     """
-    return np.asarray(list(_randint_derandomized_generator(low, high, size)))
+    if high is None:
+        low, high = 0, low
+    if size is None:
+        size = high
+    # draw as many permutations as the generator, to get the same numbers
+    permutations = [np.random.permutation(high - low)
+                    for _ in range(-(-size // (high - low)))]
+    return low + np.hstack(permutations + [np.zeros(0, dtype=int)])[:size]
 
 def _randint_derandomized_generator(low, high=None, size=None):
     """the generator for `randint_derandomized`"""
@@ -334,6 +338,52 @@ def _randint_derandomized_generator(low, high=None, size=None):
             if delivered >= size:
                 break
 
+def simulated_restarts(runlengths, nsucc, indices, randint=randint_derandomized):
+    """return the run lengths of simulated restarts starting with the
+    runs ``runlengths[indices]``.
+
+    The first `nsucc` entries of `runlengths` are from successful runs.
+    For each unsuccessful first run, ``index >= nsucc``, uniformly
+    chosen run lengths are added until a successful run was chosen.
+
+    With ``randint is np.random.randint``, the number of unsuccessful
+    restarts is drawn from a geometric distribution for all simulated
+    runs at once. Otherwise the restarts are simulated in rounds with
+    ``randint(0, len(runlengths), number_of_still_failing_runs)`` such
+    that, for example, `randint_derandomized` applies to each round.
+
+    >>> import numpy as np
+    >>> from cocopp.toolsstats import simulated_restarts
+    >>> np.random.seed(2)
+    >>> runlengths = [1, 10, 100]  # one successful and two unsuccessful runs
+    >>> for randint in (randint_derandomized, np.random.randint):
+    ...     sums = simulated_restarts(runlengths, 1, randint_derandomized(3, size=3000), randint)
+    ...     assert np.all(sums % 10 == 1) and len(sums) == 3000
+    ...     print(np.sum(sums == 1), abs(np.mean(sums) / 111 - 1) < 0.1)  # expected mean is 111
+    1000 True
+    1000 True
+
+    """
+    runlengths = np.asarray(runlengths)
+    nruns = len(runlengths)
+    if nsucc <= 0:
+        raise ValueError("without any successful run, restarts cannot be simulated")
+    sums = np.array(runlengths[indices], dtype=float)
+    failing = np.nonzero(np.asarray(indices) >= nsucc)[0]
+    if randint is np.random.randint:
+        # number of unsuccessful restarts before the successful restart
+        restarts = np.random.geometric(float(nsucc) / nruns, len(failing)) - 1
+        unsucc = runlengths[np.random.randint(nsucc, nruns, np.sum(restarts))]
+        sums[failing] += np.bincount(np.repeat(np.arange(len(failing)), restarts),
+                                     weights=unsucc, minlength=len(failing))
+        sums[failing] += runlengths[np.random.randint(0, nsucc, len(failing))]
+        return sums
+    while len(failing):  # add "restarts"
+        indices = np.asarray(randint(0, nruns, len(failing)))
+        sums[failing] += runlengths[indices]
+        failing = failing[indices >= nsucc]  # keep failing indices
+    return sums
+
 def simulated_evals(evals, nfails,
             samplesize=genericsettings.simulated_runlength_bootstrap_sample_size,
             randint=randint_derandomized):
@@ -398,7 +448,40 @@ def simulated_evals(evals, nfails,
     return sorted(sums)
 
 
-def draw(data, percentiles, samplesize=1e3, func=sp1, args=()):
+def _sp_bootstrapped(data, idx, func, args):
+    """return ``func(data[i], *args)[0] for i in idx`` computed at once
+    for `func` in ``(sp1, sp)``, where `idx` is a 2-D index array.
+
+    The zero-th element of `args` is `maxvalue`, the first the success
+    status of the `data` values, the second `allowinf` of `sp`.
+    """
+    maxvalue = args[0] if len(args) > 0 else np.inf
+    issuccessful = args[1] if len(args) > 1 else None
+    allowinf = args[2] if len(args) > 2 and func is sp else True
+    values = data[idx]
+    isnan = np.isnan(values)
+    if issuccessful is None:
+        succ = values < maxvalue  # nan < maxvalue is False
+    else:
+        succ = np.asarray(issuccessful, dtype=bool)[idx] & ~isnan
+    N = np.sum(~isnan, axis=1)
+    nsucc = np.sum(succ, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if func is sp1:
+            res = np.sum(np.where(succ, values, 0), axis=1) * N / nsucc**2
+            res[nsucc == 0] = np.inf
+        else:
+            res = np.nansum(values, axis=1) / nsucc
+            if not allowinf:
+                res[nsucc == 0] = np.nansum(values, axis=1)[nsucc == 0]
+            else:
+                res[nsucc == 0] = np.inf
+    res[N == 0] = np.nan
+    return res
+
+@profiling.profiled('toolsstats.draw')
+def draw(data, percentiles, samplesize=1e3, func=sp1, args=(),
+         max_chunk_size=1e6):
     """Generates the empirical bootstrap distribution from a sample.
 
     Input:
@@ -407,23 +490,36 @@ def draw(data, percentiles, samplesize=1e3, func=sp1, args=()):
         percentiles to be computed from the bootstrapped distribution.
       - *func* -- function that computes the statistics as
         func(data,*args) or func(data,*args)[0], by default toolsstats.sp1
-      - *args* -- arguments to func, the zero-th element of args is
+      - *args* -- arguments to func, the first element of args is
         expected to be a sequence of boolean giving the success status
         of the associated data value. This specialization of the draw
         procedure is due to the interface of the performance computation
         methods sp1 and sp.
       - *samplesize* -- number of bootstraps drawn, default is 1e3,
         for more reliable values choose rather 1e4. 
-        performance is linear in samplesize, 0.2s for samplesize=1000.
+      - *max_chunk_size* -- maximal number of bootstrapped indices
+        drawn at once when `func` is `sp1` or `sp`, which are computed
+        for all bootstraps of a chunk in one pass. For any other `func`,
+        the bootstraps are computed in a loop, one at a time.
 
     Return:
         (prctiles, all_samplesize_bootstrapped_values_sorted)
 
     Example:
-        >> import toolsstats
-        >> data = np.random.randn(22)
-        >> res = toolsstats.draw(data, (10,50,90), samplesize=1e4)
-        >> print(res[0])
+        >>> import numpy as np
+        >>> from cocopp import toolsstats
+        >>> data = 10 + np.arange(22)
+        >>> successes = [i % 3 > 0 for i in range(22)]
+        >>> np.random.seed(5)
+        >>> res = toolsstats.draw(data, (10, 50, 90), samplesize=1e4,
+        ...                       func=toolsstats.sp, args=[np.inf, successes])
+        >>> np.random.seed(5)
+        >>> res_loop = toolsstats.draw(data, (10, 50, 90), samplesize=1e4,
+        ...                            func=lambda *args: toolsstats.sp(*args),
+        ...                            args=[np.inf, successes])
+        >>> assert np.allclose(res[0], res_loop[0])
+        >>> assert np.allclose(res[1], res_loop[1])
+        >>> assert len(res[1]) == 1e4
 
     .. note::
        NaN-values are also bootstrapped, but disregarded for the 
@@ -431,34 +527,37 @@ def draw(data, percentiles, samplesize=1e3, func=sp1, args=()):
        unexpected results.
 
     """
-    arrStats = []
     N = len(data)
-    adata = np.array(data)  # more efficient indexing
-    adata.sort()
+    order = np.argsort(data, kind='mergesort')
+    adata = np.array(data)[order]  # more efficient indexing
     succ = None
     # there is a third argument to func which is the array of success
-    if len(args) > 1:
-        succ = np.array(args[1])
+    if len(args) > 1 and args[1] is not None:
+        succ = np.array(args[1])[order]
     # should NaNs also be boostrapped?
-    argsv = args
-    if 1 < 3:
+    argsv = list(args)
+    if func in (sp1, sp):
+        if succ is not None:
+            argsv[1] = succ
+        # the same random numbers as drawn in the loop below
+        chunk = max(1, int(max_chunk_size // max(N, 1)))
+        arrStats = []
+        for i in range(0, int(samplesize), chunk):
+            idx = np.random.randint(N, size=(min(chunk, int(samplesize) - i), N))
+            arrStats.extend(_sp_bootstrapped(adata, idx, func, argsv))
+    else:
+        arrStats = []
         for i in range(int(samplesize)):
             # relying that idx<len(data)
             idx = np.random.randint(N, size=N)
 
             # This part is specialized to conform with sp1 and sp.
-            if len(args) > 1:
-                argsv[1] = succ[np.r_[idx]]
-
-            arrStats.append(func(adata[np.r_[idx]], *(argsv))[0])
+            if succ is not None:
+                argsv[1] = succ[idx]
 
-            # arrStats = [data[i] for i in idx]  # efficient up to 50 data
-    else:  # not more efficient
-        arrIdx = np.random.randint(N, size=N * samplesize)
-        arrIdx.resize(samplesize, N)
-        arrStats = [func(adata[np.r_[idx]], *args) for idx in arrIdx]
+            arrStats.append(func(adata[idx], *(argsv))[0])
 
-    arrStats.sort()
+    arrStats = np.sort(arrStats).tolist()  # NaNs last, unlike list.sort
 
     return (prctile(arrStats, percentiles, issorted=True),
             arrStats)
@@ -623,24 +722,34 @@ def ranksumtest(x, y):
     This method returns a slight difference compared to scipy.stats.ranksumtest
     in the two-tailed p-value. Should be test drived...
 
+    For 2-D inputs, each row, like the data for one target, is tested
+    separately and z and p are arrays with one value per row.
+
     Returns: z-value for first data set ``x`` and two-tailed p-value
-    
+
+    >>> import numpy as np
+    >>> from cocopp.toolsstats import ranksumtest
+    >>> x, y = np.arange(30).reshape(3, 10) % 7, np.arange(24).reshape(3, 8) % 5
+    >>> z, p = ranksumtest(x, y)
+    >>> assert z.shape == p.shape == (3,)
+    >>> assert all(np.allclose(ranksumtest(x[i], y[i]), (z[i], p[i])) for i in range(3))
+
     """
     x, y = map(np.asarray, (x, y))
-    n1 = len(x)
-    n2 = len(y)
-    alldata = np.concatenate((x, y))
-    ranked = rankdata(alldata)
-    x = ranked[:n1]
-    y = ranked[n1:]
-    s = np.sum(x, axis=0)
-    assert s + np.sum(y, axis=0) == np.sum(range(n1 + n2 + 1))
+    n1 = x.shape[-1]
+    n2 = y.shape[-1]
+    alldata = np.concatenate((x, y), axis=-1)
+    ranked = rankdata(alldata, axis=-1)
+    x = ranked[..., :n1]
+    y = ranked[..., n1:]
+    s = np.sum(x, axis=-1)
+    assert np.all(s + np.sum(y, axis=-1) == np.sum(range(n1 + n2 + 1)))
     expected = n1 * (n1 + n2 + 1) / 2.0
     z = (s - expected) / np.sqrt(n1 * n2 * (n1 + n2 + 1) / 12.0)
     prob = 2 * (1.0 - zprob(abs(z)))
     return z, prob
 
-def rankdata(a):
+def rankdata(a, axis=None):
     """Ranks the data in a, dealing with ties appropriately.
 
     Equal values are assigned a rank that is the average of the ranks that
@@ -648,32 +757,45 @@ def rankdata(a):
     Ranks begin at 1, not 0.
 
     Example:
-      In [15]: stats.rankdata([0, 2, 2, 3])
-      Out[15]: array([ 1. ,  2.5,  2.5,  4. ])
+
+    >>> from cocopp.toolsstats import rankdata
+    >>> print(rankdata([0, 2, 2, 3]))
+    [1.  2.5 2.5 4. ]
+    >>> print(rankdata([[0, 2, 2, 3], [5, 5, 5, 1]], axis=1))
+    [[1.  2.5 2.5 4. ]
+     [3.  3.  3.  1. ]]
 
     Parameters:
       - *a* : array
-        This array is first flattened.
+        This array is first flattened if `axis` is `None`.
+      - *axis* : `None` or int
+        The data along `axis` are ranked separately.
 
     Returns:
-      An array of length equal to the size of a, containing rank scores.
+      An array of the shape of the flattened `a` or of `a`,
+      containing rank scores.
 
     """
-    a = np.ravel(a)
-    n = len(a)
-    svec, ivec = fastsort(a)
-    sumranks = 0
-    dupcount = 0
-    newarray = np.zeros(n, float)
-    for i in range(n):
-        sumranks += i
-        dupcount += 1
-        if i == n - 1 or svec[i] != svec[i + 1]:
-            averank = sumranks / float(dupcount) + 1
-            for j in range(i - dupcount + 1, i + 1):
-                newarray[ivec[j]] = averank
-            sumranks = 0
-            dupcount = 0
+    a = np.asarray(a)
+    if axis is None:
+        a, axis = np.ravel(a), -1
+    if axis not in (-1, a.ndim - 1):
+        return np.moveaxis(rankdata(np.moveaxis(a, axis, -1), -1), -1, axis)
+    n = a.shape[-1]
+    rows = a.reshape(-1, n)
+    ivec = np.argsort(rows, axis=1)
+    ivec += n * np.arange(len(rows))[:, None]  # index into the flattened rows
+    svec = rows.ravel()[ivec]
+    # first and last index of each set of equal values in the sorted rows
+    index = np.arange(n)
+    is_first = np.ones(rows.shape, dtype=bool)
+    is_first[:, 1:] = svec[:, 1:] != svec[:, :-1]  # nan != nan
+    is_last = np.ones(rows.shape, dtype=bool)
+    is_last[:, :-1] = is_first[:, 1:]
+    first = np.maximum.accumulate(np.where(is_first, index, 0), axis=1)
+    last = np.minimum.accumulate(np.where(is_last, index, n)[:, ::-1], axis=1)[:, ::-1]
+    newarray = np.zeros(a.shape, float)
+    newarray.ravel()[ivec] = (first + last) / 2. + 1
     return newarray
 
 def significancetest(entry0, entry1, targets):
@@ -705,13 +827,15 @@ def significancetest(entry0, entry1, targets):
 
     bootstraps = False  # future extension
     res = []
+    data = [[], []]  # test data for each target of entry0 and entry1
     evals = []
     refalgs = []
     isRefAlg = False
     # one of the entry is an instance of BestAlgDataSet
     for entry in (entry0, entry1):
         tmp = entry.detEvals(targets)
-        if not 'funvals' in entry.__dict__ and not 'indicator' in entry.__dict__:  # this looks like a terrible hack
+        if (not any(name in entry.__dict__ for name in ('funvals', '_funvals', '_funvals_sources'))  # funvals may be read lazily
+                and not 'indicator' in entry.__dict__):  # this looks like a terrible hack
             isRefAlg = True
             # for i, j in enumerate(tmp[0]):
                 # if np.isnan(j).all():
@@ -798,8 +922,6 @@ def significancetest(entry0, entry1, targets):
                         fvalues.append(prevline)
 
         # 2. 3. 4. Collect data for the significance test:
-        curdata = []  # current data 
-        
         try: fvalues
         except NameError: pass
         else:
@@ -816,12 +938,17 @@ def significancetest(entry0, entry1, targets):
                     "negative Df value(s) found ({}, offset={}) in DataSet {} in significance test line {}"
                     " for target[{}] = {}. This is a bug and may lead to a wrong significance result."
                     .format(-tmp[idx], f_offset, entry.info_str(targets), tmp, i, targets[i]))
-            curdata.append(tmp)
+            data[j].append(tmp)
             if np.isnan(tmp).any():
                 warnings.warn("{} contains nan values in significance test line {} for target[{}] = {}"
                               .format(entry.info_str(targets), tmp, i, targets[i]))
 
-        z_and_p = ranksumtest(curdata[0], curdata[1])
+    if data[0] and len(set(len(tmp) for tmp in data[0])) == 1 and len(set(len(tmp) for tmp in data[1])) == 1:
+        z_and_p_values = list(zip(*ranksumtest(np.reshape(data[0], (len(targets), -1)),
+                                               np.reshape(data[1], (len(targets), -1)))))
+    else:  # the number of data differs between targets
+        z_and_p_values = [ranksumtest(data0, data1) for data0, data1 in zip(*data)]
+    for i, z_and_p in enumerate(z_and_p_values):
         if isRefAlg:
             z_and_p = list(z_and_p)  # no idea what that is for
             z_and_p[1] /= 2.  # one-tailed p-value instead of two-tailed
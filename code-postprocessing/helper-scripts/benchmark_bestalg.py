@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark the construction of `cocopp.bestalg.BestAlgSet`.
+
+Compares the run time of `bestalg.BestAlgSet` with the former row by
+row construction (a subclass with ``_vectorized = False``) on all
+functions and dimensions of the given data and checks that both give
+the same `_evals`, `_ert`, `best_algorithm_data` and `instances`.
+
+Usage::
+
+    python benchmark_bestalg.py [repetitions [data ...]]
+
+where `data` are folders, archive files or names known to
+`cocopp.archives.all`, like ``'bbob/2009/BFGS'``, of (at least two)
+algorithms. Without `data`, the best 2009 reference algorithm data
+shipped with `cocopp` are used together with a randomly perturbed copy
+of these data.
+"""
+
+from __future__ import absolute_import, division, print_function
+import os
+import sys
+import time
+import tarfile
+import shutil
+import tempfile
+import warnings
+import numpy as np
+import cocopp
+from cocopp import bestalg, pproc, toolsdivers
+
+__all__ = ['main']
+
+
+class StepwiseBestAlgSet(bestalg.BestAlgSet):
+    """`BestAlgSet` computed row by row"""
+    _vectorized = False
+
+
+def algorithms_by_function_and_dimension(dsList):
+    """return a `list` of `dict` arguments of `BestAlgSet`, one for each
+    function and dimension with data of at least two algorithms"""
+    res = []
+    for _f, dsListF in sorted(dsList.dictByFunc().items()):
+        for _d, dsListFD in sorted(dsListF.dictByDim().items()):
+            dict_alg = dict(('%s %d' % (alg[0], i), pproc.DataSetList([ds]))
+                            for i, (alg, ds) in enumerate(
+                                (ds.algId, ds) for ds in dsListFD))
+            if len(dict_alg) > 1:
+                res.append(dict_alg)
+    return res
+
+
+def default_data(folder):
+    """return a `DataSetList` of the best 2009 data and of a copy of these
+    data, extracted to `folder`, where the evaluations of each trial are
+    multiplied with a random factor between 1/2 and 2"""
+    with tarfile.open(toolsdivers.path_in_package(
+            os.path.join('refalgs', 'best2009-bbob.tar.gz'))) as tf:
+        tf.extractall(folder)
+    dsList = pproc.DataSetList(os.path.join(folder, 'best2009-bbob'))
+    perturbed = pproc.DataSetList(os.path.join(folder, 'best2009-bbob'))
+    rand = np.random.RandomState(1)
+    for ds in perturbed:
+        factors = 2 ** rand.uniform(-1, 1, len(ds.maxevals))
+        ds.algId = ds.algId + ' perturbed'
+        ds._evals = ds._evals.copy()
+        ds._evals[:, 1:] *= factors
+        ds._maxevals = ds._maxevals * factors
+        ds.computeERTfromEvals()
+        ds.clear_results_cache()
+    return pproc.DataSetList(list(dsList) + list(perturbed))
+
+
+def assert_equal(res, ref):
+    """assert equal data of `BestAlgSet` `res` and `ref`"""
+    assert np.array_equal(res._ert, ref._ert), res
+    assert np.array_equal(res.target, ref.target), res
+    assert res.best_algorithm_data == ref.best_algorithm_data, res
+    assert res.instances == ref.instances, res
+    assert len(res._evals) == len(ref._evals) and all(
+        np.array_equal(a, b, equal_nan=True) for a, b in zip(res._evals, ref._evals)), res
+
+
+def timeit(constructor, arguments, repetitions):
+    """return the smallest run time of `constructor` over all `arguments`"""
+    times = []
+    for _ in range(repetitions):
+        t0 = time.time()
+        for dict_alg in arguments:
+            constructor(dict_alg)
+        times.append(time.time() - t0)
+    return min(times)
+
+
+def main(argv=None):
+    """run the benchmark, see module documentation"""
+    if argv is None:
+        argv = sys.argv[1:]
+    repetitions = int(argv[0]) if argv else 3
+    folder = tempfile.mkdtemp(prefix='_benchmark_bestalg_')
+    cocopp.genericsettings.verbose = False
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            if len(argv) > 1:
+                dsList = cocopp.load(argv[1:])
+            else:
+                dsList = default_data(folder)
+            arguments = algorithms_by_function_and_dimension(dsList)
+            for dict_alg in arguments:  # check that results are identical
+                assert_equal(bestalg.BestAlgSet(dict_alg), StepwiseBestAlgSet(dict_alg))
+            t_new = timeit(bestalg.BestAlgSet, arguments, repetitions)
+            t_old = timeit(StepwiseBestAlgSet, arguments, repetitions)
+    finally:
+        shutil.rmtree(folder)
+    print('%d best algorithm data sets of %d data sets' % (len(arguments), len(dsList)))
+    print('  row by row BestAlgSet: %8.3f s' % t_old)
+    print('  bestalg.BestAlgSet:    %8.3f s' % t_new)
+    print('  speedup:               %8.1f' % (t_old / t_new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark the data file parser `cocopp.readalign.split`.
+
+Compares the run time of `readalign.split` with the former line by line
+implementation `split_linewise` on all :file:`dat` and :file:`tdat`
+files of an archived data set and checks that both give the same result.
+
+Usage::
+
+    python benchmark_readalign_split.py [archive [repetitions]]
+
+where `archive` is a (local) :file:`tgz` or :file:`zip` file, a folder
+or a name known to `cocopp.archives.all`, like ``'bbob/2009/BFGS'``.
+Without `archive`, the best 2009 reference algorithm data shipped with
+`cocopp` are used.
+"""
+
+from __future__ import absolute_import, division, print_function
+import os
+import sys
+import time
+import warnings
+import tarfile
+import zipfile
+import shutil
+import tempfile
+import numpy as np
+import cocopp
+from cocopp import readalign, toolsdivers
+
+__all__ = ['main']
+
+
+def split_linewise(dataFiles, idx_to_load=None, dim=None):
+    """Line by line implementation of `readalign.split` before it was
+    vectorized, used as reference.
+
+    Converts each token separately, hence it is much slower than
+    `readalign.split`.
+    """
+
+    data_sets = []
+    algorithms = []
+    success_ratio = []
+    reference_values = {}
+    for fil in dataFiles:
+        with readalign.openfile(fil) as f:
+            # This doesnt work with windows.
+            # content = np.loadtxt(fil, comments='%')
+            lines = f.readlines()
+
+        content = []
+        idx = 0  # instance index for checking in idx_to_load
+        current_instance = 0
+        current_reference_value = 0
+        is_best_algorithm_data = False
+
+        # Save values in array content. Check for nan and inf.
+        for line in lines:
+            if line.startswith('%'):
+                if content:
+                    if (idx_to_load is None) or (idx_to_load and len(idx_to_load) > idx and idx_to_load[idx]):
+                        data_sets.append(np.vstack(content))
+                    elif cocopp.genericsettings.verbose:
+                            print('skipped instance...')
+                    # Use only the reference values from instances 1 to 5.
+                    if current_instance in (1, 2, 3, 4, 5):
+                        reference_values[current_instance] = current_reference_value
+
+                    content = []
+                    current_instance = 0
+                    current_reference_value = 0
+                    is_best_algorithm_data = False
+                    idx += 1
+
+                # Get the current instance and reference value.
+                parts = line.strip('\n').strip('\%').split(', ')
+                for elem in parts:
+                    if '=' in elem:
+                        key, value = elem.split('=', 1)
+                        if key.strip() == 'instance':
+                            current_instance = int(value.strip())
+                        elif key.strip() == 'reference value':
+                            current_reference_value = float(value.strip())
+                        elif key.strip() == 'algorithm type':
+                            is_best_algorithm_data = 'best' == value.strip()
+
+                continue
+
+            # else remove end-of-line sign
+            # and split into single strings
+            data = line.strip('\n').split()
+
+            # remove additional data for best algorithm
+            if is_best_algorithm_data:
+                index = len(data) - 3
+                if index <= 0:
+                    warnings.warn('Invalid best algorithm data!')
+                else:
+                    algorithms.append(data[index])
+                    successful_runs = int(data[index + 1])
+                    all_runs = int(data[index + 2])
+                    success_ratio.append([successful_runs, all_runs])
+                    data = data[:-3]  # remove the three processed items from data
+
+            if dim and len(data) != dim + 5:
+                warnings.warn('Incomplete line %s in  ' % line +
+                              'data file %s: ' % fil)
+                continue
+            for index in range(len(data)):
+                if data[index] in ('Inf', 'inf'):
+                    data[index] = np.inf
+                elif data[index] in ('-Inf', '-inf'):
+                    data[index] = -np.inf
+                elif data[index] in ('NaN', 'nan'):
+                    data[index] = np.nan
+                else:
+                    try:
+                        data[index] = float(data[index])
+                    except ValueError:
+                        warnings.warn('%s is not a valid number!' % data[index])
+                        data[index] = np.nan
+
+            if data:
+                content.append(np.array(data))
+            # Check that it always have the same length?
+
+        if content:
+            if (idx_to_load is None) or (idx_to_load and len(idx_to_load) > idx and idx_to_load[idx]):
+                data_sets.append(np.vstack(content))
+            elif cocopp.genericsettings.verbose:
+                    print('skipped instance...')
+
+            # Use only the reference values from instances 1 to 5.
+            if current_instance in (1, 2, 3, 4, 5):
+                reference_values[current_instance] = current_reference_value
+
+    if len(algorithms) < len(data_sets):
+        algorithms = []
+
+    return data_sets, algorithms, reference_values, success_ratio
+
+
+def data_files(archive, folder):
+    """return all data files from `archive` which may be extracted to `folder`"""
+    if not os.path.exists(archive):
+        archive = cocopp.archives.all.get(archive)
+    if os.path.isdir(archive):
+        folder = archive
+    elif zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(folder)
+    else:
+        with tarfile.open(archive) as tf:
+            tf.extractall(folder)
+    res = []
+    for root, _dirs, files in os.walk(folder):
+        res.extend(os.path.join(root, f) for f in files
+                   if f.endswith('.dat') or f.endswith('.tdat'))
+    return sorted(res)
+
+
+def timeit(parser, files, repetitions):
+    """return the smallest run time of `parser` over all `files`"""
+    times = []
+    for _ in range(repetitions):
+        t0 = time.time()
+        for fil in files:
+            parser([fil])
+        times.append(time.time() - t0)
+    return min(times)
+
+
+def main(argv=None):
+    """run the benchmark, see module documentation"""
+    if argv is None:
+        argv = sys.argv[1:]
+    archive = argv[0] if argv else toolsdivers.path_in_package(
+                            os.path.join('refalgs', 'best2009-bbob.tar.gz'))
+    repetitions = int(argv[1]) if len(argv) > 1 else 3
+    folder = tempfile.mkdtemp(prefix='_benchmark_split_')
+    try:
+        files = data_files(archive, folder)
+        megabytes = sum(os.path.getsize(f) for f in files) / 1e6
+        for fil in files:  # check that results are identical
+            res, ref = readalign.split([fil]), split_linewise([fil])
+            assert len(res[0]) == len(ref[0]) and res[1:] == ref[1:], fil
+            assert all(np.array_equal(a, b, equal_nan=True)
+                       for a, b in zip(res[0], ref[0])), fil
+        t_new = timeit(readalign.split, files, repetitions)
+        t_old = timeit(split_linewise, files, repetitions)
+    finally:
+        shutil.rmtree(folder)
+    print('%d data files (%.1f MB) from %s' % (len(files), megabytes, archive))
+    print('  split_linewise:            %8.3f s' % t_old)
+    print('  readalign.split:           %8.3f s' % t_new)
+    print('  speedup:                   %8.1f' % (t_old / t_new))
+
+
+if __name__ == '__main__':
+    main()
@@ -113,7 +113,7 @@ except:
 setup(
     name = _name,
     version = git_version_print(pep440=True),
-    packages = [_name, _name + '.comp2', _name + '.compall'],
+    packages = [_name, _name + '.comp2', _name + '.compall', _name + '.benchmarks'],
     package_dir = {_name: 'cocopp'},
     package_data={_name: ['*enchmarkshortinfos.txt',
                           '*enchmarkinfos.txt',